@@ -22,29 +22,18 @@ NEEDS DEBUGGING
 #5. change sequence of cabinets in assembly
 
 
+import asyncio
 import random
 import re
-from typing import List, Dict, Any
-from openai import OpenAI
-import os
-from dotenv import load_dotenv
+from typing import List, Dict, Any, Optional
 import logging
 
-# Load environment variables
-load_dotenv()
-
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from LLM_chain.LLM_chain.resources import get_openai_client
+from LLM_chain.LLM_chain.usda_scanner import default_prim_name
 
 def extract_default_prim(content: str) -> str:
-    """Extract the defaultPrim name from the content."""
-    match = re.search(r'defaultPrim = "(\w+)"', content)
-    if match:
-        return match.group(1)
-    else:
-        # If defaultPrim is not found, try to extract the name from the Xform definition
-        xform_match = re.search(r'def Xform "(\w+)"', content)
-        return xform_match.group(1) if xform_match else "Unknown"
+    """Extract the defaultPrim name from the content, falling back to the name of the root Xform."""
+    return default_prim_name(content, default="Unknown")
 
 
 
@@ -84,7 +73,7 @@ def llm_picker(components: List[Dict[str, Any]], k: int, query: str) -> List[Dic
         prompt += "\n"
     prompt += "For each component, return only the number of the best option, separated by spaces."
 
-    response = client.chat.completions.create(
+    response = get_openai_client().chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[{"role": "system", "content": "You are a helpful assistant."},
                   {"role": "user", "content": prompt}]
@@ -121,7 +110,7 @@ def llm_different_strategy(components: List[List[Dict[str, Any]]], k: int, query
         prompt += "\n"
     prompt += "For each component, return only the number of the selected option, separated by spaces."
 
-    response = client.chat.completions.create(
+    response = get_openai_client().chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[{"role": "system", "content": "You are a helpful assistant."},
                   {"role": "user", "content": prompt}]
@@ -171,4 +160,30 @@ def choose_assemblies(components: List[Dict[str, Any]], k: int, query: str) -> D
         }
     except Exception as e:
         logging.exception(f"Error in choose_assemblies: {e}")
-        return {}
\ No newline at end of file
+        return {}
+
+
+async def choose_assemblies_async(components: List[Dict[str, Any]], k: int, query: str,
+                                  semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+    """
+    choose_assemblies with the strategies running concurrently: the two LLM strategies wait for their responses
+    at the same time instead of one after the other. semaphore bounds the concurrent calls, e.g. across pipelines.
+    """
+    semaphore = semaphore or asyncio.Semaphore(4)
+
+    async def run(strategy, *args):
+        async with semaphore:
+            return await asyncio.to_thread(strategy, *args)
+
+    strategies = {
+        "highest_k_score": (highest_k_score, components, k),
+        "llm_picker": (llm_picker, components, k, query),
+        "llm_different_strategy": (llm_different_strategy, components, k, query),
+        "random_picker": (random_picker, components, k),
+    }
+    try:
+        results = await asyncio.gather(*(run(*call) for call in strategies.values()))
+        return dict(zip(strategies, results))
+    except Exception as e:
+        logging.exception(f"Error in choose_assemblies: {e}")
+        return {}
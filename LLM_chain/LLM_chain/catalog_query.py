@@ -0,0 +1,136 @@
+"""
+Exact attribute and dimension-range queries against the local SKU catalog.
+
+Constraints such as "rolling cabinet around 500mm wide" are a poor fit for embeddings. This module answers them
+from the SQLite catalog built by asset_generator/catalog_db.py, locally and from indexes, so the chain can narrow
+candidates before (or instead of) vector search.
+
+Usage:
+    catalog = ComponentCatalog()
+    catalog.query(component_type="Rolling Cabinet", width=around(500))
+"""
+
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_CATALOG_DB = os.getenv("SKU_CATALOG_DB", os.path.join("assets", "sku_catalog.sqlite"))
+
+DIMENSIONS = ("width", "depth", "height")
+
+Range = Tuple[Optional[int], Optional[int]]
+
+
+def around(value: float, tolerance: float = 0.1) -> Range:
+    """Return the millimeter range within a relative tolerance of value, e.g. around(500) == (450, 550)."""
+    return (round(value * (1 - tolerance)), round(value * (1 + tolerance)))
+
+
+def _where(clauses, ranges, column=None, low=None, high=None, high_exclusive=False):
+    """
+    Return the WHERE clause and range parameters for the fixed clauses plus the dimension ranges.
+
+    The optional column/low/high bound is added as a single pair so SQLite uses both ends of the index range.
+    """
+    clauses, params = list(clauses), []
+    bounds = dict(ranges)
+    if column is not None:
+        bounds[column] = (low, high)
+    for dimension, (low, high) in bounds.items():
+        if low is not None:
+            clauses.append(f"{dimension} >= ?")
+            params.append(low)
+        if high is not None:
+            clauses.append(f"{dimension} {'<' if high_exclusive and dimension == column else '<='} ?")
+            params.append(high)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+class ComponentCatalog:
+    """Read-only connection to the SKU catalog. Attribute matches are exact but case-insensitive."""
+
+    def __init__(self, db_path: str = DEFAULT_CATALOG_DB):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"SKU catalog {db_path} not found, build it with asset_generator/catalog_db.py")
+        self.db_path = db_path
+        self._connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+
+    def query(self, component_type: Optional[str] = None, material: Optional[str] = None,
+              color: Optional[str] = None, width: Optional[Range] = None, depth: Optional[Range] = None,
+              height: Optional[Range] = None, near: Optional[Dict[str, float]] = None,
+              limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """
+        Find SKUs matching every given constraint.
+
+        Args:
+            component_type, material, color: Exact (case-insensitive) attribute values. color is the object color
+                name of the catalog (grey, black, ...).
+            width, depth, height: Inclusive (min, max) millimeter ranges. Either bound may be None.
+            near: Optional {dimension: millimeters} to order the matches by closeness, e.g. {'width': 500}.
+                Without it matches come back in index order.
+            limit: Maximum number of SKUs returned, None for all.
+
+        Returns:
+            list: One dict per SKU with name, type, function, width, depth, height, color, color_attribute
+                and material.
+        """
+        if near:
+            unknown = set(near) - set(DIMENSIONS)
+            if unknown:
+                raise ValueError(f"Cannot order by {sorted(unknown)}, expected one of {DIMENSIONS}")
+
+        clauses, params = [], []
+        for column, value in (("type", component_type), ("material", material), ("color", color)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        ranges = {column: bounds for column, bounds in zip(DIMENSIONS, (width, depth, height)) if bounds is not None}
+
+        if near and len(near) == 1 and limit is not None:
+            # Walk the dimension's index outwards from the target in both directions and keep the closest
+            # matches, instead of sorting every match by distance
+            (column, target), = near.items()
+            low, high = ranges.pop(column, (None, None))
+            above = _where(clauses, ranges, column, max(low, target) if low is not None else target, high)
+            # The target itself is already covered by the upward walk; a range bound below it is not
+            if high is None or target <= high:
+                below = _where(clauses, ranges, column, low, target, high_exclusive=True)
+            else:
+                below = _where(clauses, ranges, column, low, high)
+            sql = (f"SELECT * FROM ("
+                   f"SELECT * FROM (SELECT * FROM skus{above[0]} ORDER BY {column} LIMIT ?) "
+                   f"UNION ALL "
+                   f"SELECT * FROM (SELECT * FROM skus{below[0]} ORDER BY {column} DESC LIMIT ?)"
+                   f") ORDER BY ABS({column} - ?) LIMIT ?")
+            params = params + above[1] + [limit] + params + below[1] + [limit, target, limit]
+        else:
+            where, range_params = _where(clauses, ranges)
+            sql = "SELECT * FROM skus" + where
+            params += range_params
+            if near:
+                sql += " ORDER BY " + ", ".join(f"ABS({column} - ?)" for column in near)
+                params.extend(near.values())
+            if limit is not None:
+                sql += " LIMIT ?"
+                params.append(limit)
+
+        return [dict(row) for row in self._connection.execute(sql, params)]
+
+    def types(self) -> List[str]:
+        """Return the distinct component types of the catalog."""
+        return [row[0] for row in self._connection.execute("SELECT DISTINCT type FROM skus ORDER BY type")]
+
+    def close(self):
+        self._connection.close()
+
+
+_default_catalog = None
+
+
+def find_components(**constraints) -> List[Dict[str, Any]]:
+    """Query the default catalog (SKU_CATALOG_DB, or assets/sku_catalog.sqlite), see ComponentCatalog.query."""
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = ComponentCatalog()
+    return _default_catalog.query(**constraints)
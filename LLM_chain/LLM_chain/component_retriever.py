@@ -6,10 +6,11 @@ based on natural language queries. It uses LlamaIndex for vector similarity sear
 the most relevant components matching the user's requirements.
 
 Key features:
-- Loads a pre-built vector index of component descriptions
-- Performs semantic similarity search using VectorIndexRetriever
+- Loads a pre-built vector index of component descriptions on the first query
+- Performs semantic similarity search over the index's vectors, a batch of queries at a time (retrieve_many)
+- Embeds each distinct query once, reusing the vectors of earlier queries from a persistent cache (query_cache.py)
 - Returns top matching components with their relevance scores
-- Configurable number of results via similarity_top_k parameter
+- Configurable number of results via top_k
 
 Usage:
     query = "I need a plastic workbench top with high chemical resistance"
@@ -17,62 +18,88 @@ Usage:
 """
 
 # retrieve index components based on structured users input.
-from llama_index.core import StorageContext, load_index_from_storage
-from llama_index.core.retrievers import VectorIndexRetriever
-from dotenv import load_dotenv
 import logging
 import sys
-import os
 
 import json
-# Load environment variables
-load_dotenv()
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise ValueError("Failed to import OPENAI_API_KEY")
+from LLM_chain.LLM_chain.query_cache import canonical_query, model_key
+from LLM_chain.LLM_chain.resources import get_embed_model, get_index, get_query_cache, get_vector_index
+from LLM_chain.LLM_chain.usda_scanner import scan_usda
 
 # Set up logging
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# Rebuild storage context
-storage_context = StorageContext.from_defaults(persist_dir="LLM_chain/LLM_chain/index_components")
-# Load index
-index = load_index_from_storage(storage_context)
-
-# Create a VectorIndexRetriever
-retriever = VectorIndexRetriever(
-    index=index,
-    similarity_top_k=1 # Adjust this value based on how many results you want
-)
-
 def load_search_json(filename):
     with open(filename, 'r') as f:
         search_data = json.load(f)
     return search_data
 
-def retrieve_modules(query):
-    nodes = retriever.retrieve(query)
-    results = []
-    for node in nodes:
-        content = node.node.text
-        # Extract defaultPrim name using string parsing
-        default_prim = None
-        for line in content.split('\n'):
-            if 'defaultPrim = ' in line:
-                # Extract text between quotes
-                default_prim = line.split('"')[1] if '"' in line else line.split('=')[1].strip()
-                break
-                
-        results.append({
-            "content": content,
-            "score": node.score,
-            "default_prim": default_prim
-        })
-    return results
-
+def _module_result(content, score):
+    # Header and component metadata in a single scan of the USDA text
+    metadata = scan_usda(content)
+    return {
+        "content": content,
+        "score": score,
+        "default_prim": metadata['default_prim'],
+        "custom_data": metadata['custom_data'],
+        "extent": metadata['extent']
+    }
+
+
+def embed_queries(queries):
+    """
+    Return the vectors of the canonical forms of queries (see query_cache.canonical_query), in order.
+
+    Queries found in the query cache are not embedded again; the distinct others are embedded in a single batch
+    request and added to the cache.
+    """
+    canonical = [canonical_query(query) for query in queries]
+    embed_model = get_embed_model()
+    cache = get_query_cache()
+    model = model_key(embed_model)
+    vectors = cache.get_many(model, canonical) if cache is not None else {}
+    missing = [query for query in dict.fromkeys(canonical) if query not in vectors]
+    if missing:
+        embedded = dict(zip(missing, embed_model.get_text_embedding_batch(missing)))
+        if cache is not None:
+            cache.put_many(model, embedded)
+        vectors.update(embedded)
+    if cache is not None:
+        logger.debug(f"Query embedding cache: {len(missing)} of {len(canonical)} queries embedded, "
+                     f"{cache.hits} hits and {cache.misses} misses so far")
+    return [vectors[query] for query in canonical]
+
+
+def retrieve_many(queries, top_k=1):
+    """
+    Retrieve the top_k components of every query at once.
+
+    The queries are embedded in at most one batch request (see embed_queries) and searched as one batch in the
+    in-memory vector index: exact by default, approximate with VECTOR_INDEX=ivf (see vector_search.py).
+
+    Returns:
+        list: For each query, in order, its results as returned by retrieve_modules.
+    """
+    queries = list(queries)
+    if not queries:
+        return []
+    # The index is loaded on the first query (see resources.py)
+    vector_index = get_vector_index()
+    query_vectors = embed_queries(queries)
+    matches = vector_index.search(query_vectors, top_k)
+
+    docstore = get_index().docstore
+    nodes = {node.node_id: node for node in
+             docstore.get_nodes(list({node_id for query_matches in matches for node_id, _ in query_matches}))}
+    return [[_module_result(nodes[node_id].text, score) for node_id, score in query_matches]
+            for query_matches in matches]
+
+
+def retrieve_modules(query, top_k=1):
+    return retrieve_many([query], top_k)[0]
 
 
 # search_data = load_search_json('LLM_chain/LLM_chain/searches/search_20241202_121421.json')
@@ -0,0 +1,137 @@
+"""
+Embedding backends for the component index.
+
+EMBEDDING_BACKEND selects how index_components.py embeds the component documents:
+- 'openai' (default): LlamaIndex's OpenAI embeddings, over the network and with an API key
+- 'local': HashedNgramEncoder, in process with NumPy, no key and no network. Words and character n-grams are
+  hashed into a fixed number of buckets, so nothing has to be fitted or stored besides the settings below.
+
+The backend an index was built with is recorded in its persist directory (embedding.json) and the retriever embeds
+queries with that backend, whatever EMBEDDING_BACKEND says: query and document vectors must share one space.
+Indexes persisted before the file existed were built with OpenAI.
+"""
+
+from functools import lru_cache
+import json
+import os
+import re
+import zlib
+
+import numpy as np
+
+EMBEDDING_BACKENDS = ("openai", "local")
+DEFAULT_EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai")
+DEFAULT_EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1024"))
+DEFAULT_NGRAM = 3
+EMBEDDING_CONFIG_NAME = "embedding.json"
+
+_TOKEN = re.compile(r"[a-z]+|\d+")
+# USDA syntax shared by every component document, it only dilutes the vectors
+STOP_WORDS = frozenset((
+    "usda", "def", "xform", "cube", "geometry", "kind", "component", "defaultprim", "customdata", "string", "int",
+    "float", "float3", "double3", "color3f", "token", "uniform", "primvars", "displaycolor", "xformop",
+    "xformoporder", "extent", "scale", "translate", "null", "true", "false", "the", "a", "an", "and", "or", "of",
+    "to", "for", "with", "in", "on", "category", "requirements", "size", "none",
+))
+
+
+def resolve_embedding_backend(backend=None):
+    """Validate backend, falling back to EMBEDDING_BACKEND."""
+    backend = (backend or DEFAULT_EMBEDDING_BACKEND).lower()
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unsupported embedding backend '{backend}', expected one of {EMBEDDING_BACKENDS}")
+    return backend
+
+
+@lru_cache(maxsize=65536)
+def _bucket(feature, dim):
+    """Hash a feature to (bucket, sign). crc32 is stable across processes, unlike hash()."""
+    h = zlib.crc32(feature.encode("utf-8"))
+    return h % dim, (1.0 if h & 0x80000000 else -1.0)
+
+
+class HashedNgramEncoder:
+    """
+    Stateless text encoder: hashed word and character n-gram counts, sublinearly scaled and L2-normalized.
+
+    Character n-grams of each word (with boundary markers) make 'drawer' and 'drawers' similar; signed hashing keeps
+    bucket collisions unbiased. Vectors are float32 and unit length, so a dot product is the cosine similarity.
+    """
+
+    def __init__(self, dim=DEFAULT_EMBEDDING_DIM, ngram=DEFAULT_NGRAM):
+        self.dim = dim
+        self.ngram = ngram
+
+    def features(self, text):
+        words = [word for word in _TOKEN.findall(text.lower()) if word not in STOP_WORDS]
+        features = list(words)
+        n = self.ngram
+        for word in words:
+            if len(word) > n:
+                marked = f"<{word}>"
+                features.extend(marked[i:i + n] for i in range(len(marked) - n + 1))
+        return features
+
+    def encode(self, text):
+        counts = {}
+        for feature in self.features(text):
+            counts[feature] = counts.get(feature, 0) + 1
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, count in counts.items():
+            bucket, sign = _bucket(feature, self.dim)
+            vector[bucket] += sign * (1.0 + np.log(count))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def encode_batch(self, texts):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            matrix[i] = self.encode(text)
+        return matrix
+
+
+def write_embedding_config(persist_dir, config):
+    with open(os.path.join(persist_dir, EMBEDDING_CONFIG_NAME), "w") as f:
+        json.dump(config, f, indent=2)
+
+
+def read_embedding_config(persist_dir):
+    """Return the embedding settings an index was built with."""
+    path = os.path.join(persist_dir, EMBEDDING_CONFIG_NAME)
+    if not os.path.exists(path):
+        return {'backend': 'openai'}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def get_embed_model(backend=None, dim=DEFAULT_EMBEDDING_DIM, ngram=DEFAULT_NGRAM):
+    """
+    Return the LlamaIndex embedding model of a backend.
+
+    Returns:
+        BaseEmbedding: The model to pass as embed_model, or None for 'openai', which is LlamaIndex's default.
+    """
+    backend = resolve_embedding_backend(backend)
+    if backend == "local":
+        from LLM_chain.LLM_chain.local_embedding import HashedNgramEmbedding
+
+        return HashedNgramEmbedding(dim=dim, ngram=ngram)
+
+    from LLM_chain.LLM_chain.resources import openai_api_key
+
+    # Fail early and clearly without a key
+    openai_api_key()
+    return None
+
+
+def embedding_config(backend=None, dim=DEFAULT_EMBEDDING_DIM, ngram=DEFAULT_NGRAM):
+    """Return the settings recorded with an index, the keyword arguments of get_embed_model."""
+    backend = resolve_embedding_backend(backend)
+    if backend == "local":
+        return {'backend': backend, 'dim': dim, 'ngram': ngram}
+    return {'backend': backend}
+
+
+def embed_model_for_index(persist_dir):
+    """Return the embedding model matching the one a persisted index was built with (see get_embed_model)."""
+    return get_embed_model(**read_embedding_config(persist_dir))
@@ -1,9 +1,15 @@
 """
-This script creates and stores vector embeddings for USDA component documents.
+This script creates and stores vector embeddings for USD component documents.
 It reads documents from a specified directory, converts them into embeddings using
-OpenAI's API, and saves the indexed data for future retrieval.
+OpenAI's API or the offline local backend (--backend local, see embeddings.py), and saves the indexed data for
+future retrieval.
 
-The script:
+The retriever reads each component's text, so the index needs one document per SKU: .usda files are read as they
+are and binary .usdc files (USD_FORMAT=usdc) are exported to the same USDA text. Family assets, which hold several
+SKUs as variants of one file, cannot be indexed.
+
+Run it as a script (python -m LLM_chain.LLM_chain.index_components from the repository root) to rebuild the index.
+It:
 1. Loads environment variables (OpenAI API key)
 2. Sets up logging
 3. Processes documents from the assets directory
@@ -12,32 +18,76 @@ The script:
 """
 
 # create embedings of usda compnonents.
-import os
+import argparse
 from pathlib import Path
-from llama_index.core import SimpleDirectoryReader, VectorStoreIndex
-from dotenv import load_dotenv
-
 
-# Load environment variables
-load_dotenv()
+from USD_modules.component_reader import SIZE_VARIANT_SET
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise ValueError("Failed to import OPENAI_API_KEY")
+from LLM_chain.LLM_chain.embeddings import (DEFAULT_EMBEDDING_DIM, EMBEDDING_BACKENDS, embedding_config,
+                                            get_embed_model, write_embedding_config)
+from LLM_chain.LLM_chain.resources import INDEX_DIR
 
 # Define the path to the components folder
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets" / "components"
+
+
+USD_EXTENSIONS = (".usda", ".usdc")
+
+
+def _usdc_reader():
+    """A SimpleDirectoryReader file extractor that reads binary USD layers as their USDA text."""
+    from llama_index.core import Document
+    from llama_index.core.readers.base import BaseReader
+
+    class UsdcReader(BaseReader):
+        def load_data(self, file, extra_info=None, fs=None):
+            from pxr import Sdf
+
+            layer = Sdf.Layer.FindOrOpen(str(file))
+            if layer is None:
+                raise ValueError(f"Could not open USD layer {file}")
+            return [Document(text=layer.ExportToString(), metadata=extra_info or {})]
+
+    return UsdcReader()
 
 
 # Load documents and build index
-def index_directory(assets_path, index_store_path):
+def index_directory(assets_path, index_store_path, backend=None, dim=DEFAULT_EMBEDDING_DIM):
+    """
+    Embed every document of assets_path and persist the index to index_store_path.
+
+    backend selects the embedding backend (see embeddings.py), EMBEDDING_BACKEND by default. It is recorded next to
+    the index so the retriever embeds queries the same way.
+    """
+    from llama_index.core import SimpleDirectoryReader, VectorStoreIndex
+
+    config = embedding_config(backend, dim=dim)
+    embed_model = get_embed_model(**config)
+    # Only the USD documents: the components folder also holds the sidecar database and the build manifest
+    if not any(path.suffix in USD_EXTENSIONS for path in Path(assets_path).iterdir()):
+        raise ValueError(f"No .usda or .usdc component files in {assets_path}: generate the per-SKU components "
+                         f"(asset_generator/usd_utlis.py without --families) before indexing")
     documents = SimpleDirectoryReader(
-            assets_path
+            assets_path, required_exts=list(USD_EXTENSIONS), file_extractor={".usdc": _usdc_reader()}
             ).load_data()
-    
-    index = VectorStoreIndex.from_documents(documents, show_progress=True)
+    families = [document.metadata.get('file_name') for document in documents
+                if f'variantSets = "{SIZE_VARIANT_SET}"' in document.text]
+    if families:
+        raise ValueError(f"{assets_path} holds family assets ({', '.join(sorted(families))}), which pack several SKUs "
+                         f"into one file: the retrieval index needs one component file per SKU")
+
+    kwargs = {'embed_model': embed_model} if embed_model is not None else {}
+    index = VectorStoreIndex.from_documents(documents, show_progress=True, **kwargs)
     index.storage_context.persist(persist_dir=index_store_path)
+    write_embedding_config(index_store_path, config)
     return index
 
-assets_path = Path("../assets/components")
-index_store_path = Path("LLM_chain/index_components")
-index = index_directory(assets_path, index_store_path)
\ No newline at end of file
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Embed the component assets and persist the vector index.")
+    parser.add_argument("--backend", choices=EMBEDDING_BACKENDS, default=None,
+                        help="Embedding backend (default: the EMBEDDING_BACKEND environment variable, or openai)")
+    parser.add_argument("--assets", default=str(ASSETS_DIR), help="Directory of the component documents")
+    parser.add_argument("--index-dir", default=INDEX_DIR, help="Persist directory of the index")
+    args = parser.parse_args()
+    index = index_directory(args.assets, args.index_dir, backend=args.backend)
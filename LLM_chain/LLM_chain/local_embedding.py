@@ -0,0 +1,47 @@
+"""
+LlamaIndex adapter of the in-process HashedNgramEncoder (see embeddings.py).
+
+Kept apart from embeddings.py so that the encoder itself can be used, and benchmarked, without LlamaIndex.
+"""
+
+from typing import Any, List
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
+
+from LLM_chain.LLM_chain.embeddings import DEFAULT_EMBEDDING_DIM, DEFAULT_NGRAM, HashedNgramEncoder
+
+
+class HashedNgramEmbedding(BaseEmbedding):
+    """Offline embedding model: hashed word and character n-grams, computed in process."""
+
+    dim: int = Field(default=DEFAULT_EMBEDDING_DIM, description="Number of hash buckets, the vector size")
+    ngram: int = Field(default=DEFAULT_NGRAM, description="Length of the character n-grams")
+
+    _encoder: HashedNgramEncoder = PrivateAttr()
+
+    def __init__(self, dim: int = DEFAULT_EMBEDDING_DIM, ngram: int = DEFAULT_NGRAM, **kwargs: Any) -> None:
+        kwargs.setdefault("model_name", f"hashed-ngram-{dim}")
+        # Nothing goes over the network, encode whole batches at once
+        kwargs.setdefault("embed_batch_size", 1024)
+        super().__init__(dim=dim, ngram=ngram, **kwargs)
+        self._encoder = HashedNgramEncoder(dim, ngram)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "HashedNgramEmbedding"
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._encoder.encode(query).tolist()
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._encoder.encode(text).tolist()
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._encoder.encode_batch(texts).tolist()
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embedding(text)
@@ -7,6 +7,8 @@ It follows a multi-step pipeline:
 3. Generates assembly recommendations for each component category
 4. Outputs final assembly configurations
 
+The pipeline is asynchronous (main_async, main_many for several inputs); main() is its synchronous wrapper.
+
 The script handles various furniture components including cabinets, workbench tops, and rear panels,
 while considering both specific and general requirements for each component.
 
@@ -16,21 +18,34 @@ Dependencies:
 - assembly_chooser: Selects optimal assembly configurations
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
 from LLM_chain.LLM_chain.structure_user_input import structure_user_input, convert_to_dict
-from LLM_chain.LLM_chain.component_retriever import retrieve_modules
+from LLM_chain.LLM_chain.component_retriever import retrieve_many
 from LLM_chain.LLM_chain.retrieval_utils import width_cabinet,calculate_rear_panels_constrained, construct_file_path
-from dotenv import load_dotenv, find_dotenv
-import os
 
-# Load .env
-dotenv_path = find_dotenv()
-load_dotenv(dotenv_path)
+# The OpenAI client and the component index are created on first use, see resources.py
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Blocking steps (LLM and embedding requests, USD reads) in flight at once, per pipeline or across the pipelines of
+# main_many, which share one semaphore
+DEFAULT_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "8"))
 
 
-def main(user_input):
+async def _run_blocking(semaphore, function, *args):
+    """Run a blocking step in a worker thread, within the concurrency bound."""
+    async with semaphore:
+        return await asyncio.to_thread(function, *args)
+
+
+async def main_async(user_input, semaphore=None):
+    """
+    Run the pipeline without blocking the event loop.
+
+    The steps depend on each other and run in order; the independent work within a step (the width lookups of
+    the retrieved cabinets) runs concurrently. Pass a shared semaphore to bound several pipelines together.
+    """
     # Get user input
     # print("\nPlease describe your workbench configuration needs.")
     # print("Example: 'I need three cabinets, one small with shelves, two medium with drawers, a wooden workbench top, and black rear panels'")
@@ -39,43 +54,31 @@ def main(user_input):
     # Validate input is not empty
     if not user_input.strip():
         raise ValueError("User input cannot be empty")
+    semaphore = semaphore or asyncio.Semaphore(DEFAULT_CONCURRENCY)
+    assembly_data_model = None
     try:
 
 
         
         # Step 1: Structure user input
-        structured_input = structure_user_input(user_input)
+        structured_input = await _run_blocking(semaphore, structure_user_input, user_input)
         if not structured_input:
             raise ValueError("No structured input received")
         searches = convert_to_dict(structured_input)
 
         # Step 2: Retrieve components for each part of the structured input
         cabinets = [c for c in searches['components'] if c['category'] == "Cabinet"]
-        for cabinet in cabinets:
-            try:
-                retrieved_modules = retrieve_modules(str(cabinet))
-                if retrieved_modules:
-                    # Assuming you want the first result's default_prim
-                    cabinet['filepath'] = retrieved_modules[0]['default_prim']
-                else:
-                    cabinet['filepath'] = None
-            except Exception as e:
-                logging.error(f"Failed to retrieve module for cabinet: {cabinet}. Error: {e}")
-                cabinet['filepath'] = None
-
-
         workbenches = [c for c in searches['components'] if c['category'] == "Workbench Top"]
-        for workbench in workbenches:
-            try:
-                retrieved_modules = retrieve_modules(str(workbench))
-                if retrieved_modules:
-                    # Assuming you want the first result's default_prim
-                    workbench['filepath'] = retrieved_modules[0]['default_prim']
-                else:
-                    workbench['filepath'] = None
-            except Exception as e:
-                logging.error(f"Failed to retrieve module for workbench: {workbench}. Error: {e}")
-                workbench['filepath'] = None
+        # One batch embedding request and one scoring pass for all cabinets and workbench tops
+        components = cabinets + workbenches
+        try:
+            retrieved = await _run_blocking(semaphore, retrieve_many, [str(component) for component in components])
+        except Exception as e:
+            logging.error(f"Failed to retrieve modules for components: {components}. Error: {e}")
+            retrieved = [[] for _ in components]
+        for component, retrieved_modules in zip(components, retrieved):
+            # Assuming you want the first result's default_prim
+            component['filepath'] = retrieved_modules[0]['default_prim'] if retrieved_modules else None
 
         # Step 3: Add filepaths to the json
         assembly_data_model = searches  # This is a dictionary
@@ -93,7 +96,10 @@ def main(user_input):
         # Step 4: Calculate length and config of rear panels
         # Calculate total width of cabinets using the width_cabinet function
         cabinet_filepaths = [construct_file_path(cabinet['filepath']) for cabinet in cabinets if cabinet['filepath']]
-        cabinet_widths = width_cabinet(cabinet_filepaths)
+        # One lookup per file, concurrently; width_cabinet skips files it cannot measure
+        widths_per_file = await asyncio.gather(*(_run_blocking(semaphore, width_cabinet, [filepath])
+                                                 for filepath in cabinet_filepaths))
+        cabinet_widths = [width for widths in widths_per_file for width in widths]
         total_cabinet_width = round(sum(cabinet_widths) * 1000)
 
         # Calculate rear panel configuration
@@ -141,3 +147,32 @@ def main(user_input):
     except Exception as e:
         logging.error(f"An error occurred: {e}")
     return assembly_data_model
+
+
+async def main_many(user_inputs, max_concurrency=DEFAULT_CONCURRENCY):
+    """
+    Run the pipeline for several inputs concurrently, at most max_concurrency blocking steps at a time.
+
+    Returns:
+        list: One entry per input, in order: the assembly data model (None if the pipeline failed, as with
+            main_async), or the exception the input raised, e.g. ValueError for an empty input. One bad input
+            does not abort the others.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = await asyncio.gather(*(main_async(user_input, semaphore) for user_input in user_inputs),
+                                   return_exceptions=True)
+    for user_input, result in zip(user_inputs, results):
+        if isinstance(result, Exception):
+            logging.error(f"Pipeline failed for input {user_input!r}: {result}")
+    return results
+
+
+def main(user_input):
+    """Synchronous entry point of the pipeline (see main_async), used by run_demo.demo."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main_async(user_input))
+    # Called from a running event loop, e.g. a notebook: run the pipeline on its own loop in a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, main_async(user_input)).result()
@@ -0,0 +1,181 @@
+"""
+Persistent cache of query embeddings.
+
+The chain phrases every component query as str() of a component dict, and the same few queries ({'category':
+'Cabinet', 'requirements': ['drawers'], 'size': 'Medium'}) come back with every customer. retrieve_many() looks the
+queries up here first and only sends the missing ones to the embedding model.
+
+Queries are keyed on their canonical form (canonical_query): dict keys sorted, whitespace collapsed and requirements
+lower-cased, so reprs that differ only in that way share one entry. The canonical form is also the text that gets
+embedded, so a hit returns the vector a miss would have computed, stored as float32 (the precision vector_search
+scores in). Entries are stored per embedding model in a SQLite file (QUERY_CACHE_PATH, default
+query_embeddings.sqlite in the index directory) shared by all processes, and the least recently used entries are
+evicted beyond maxsize (QUERY_CACHE_SIZE, default 100000; 0 disables the cache).
+
+The cache never fails a retrieval: if the file cannot be opened, read or written, it logs a warning and behaves as
+a miss. Reads stay reads: an entry's last use is only rewritten once per TOUCH_INTERVAL, and the size is only
+counted every EVICTION_INTERVAL inserts, so maxsize may be exceeded by that much in between.
+"""
+
+from array import array
+import ast
+import logging
+import os
+import re
+import sqlite3
+from threading import Lock
+import time
+
+DEFAULT_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "100000"))
+# Seconds before a hit rewrites the entry's last use (LRU precision), and inserts between two size checks
+TOUCH_INTERVAL = 3600
+EVICTION_INTERVAL = 1000
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_text(value):
+    return _WHITESPACE.sub(" ", value).strip()
+
+
+def _canonical_value(key, value):
+    if isinstance(value, str):
+        value = _normalize_text(value)
+        return value.lower() if key == 'requirements' else value
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(key, item) for item in value]
+    return value
+
+
+def canonical_query(query):
+    """
+    Return the canonical form of a query: a component dict (or its str()) as str() of the dict with sorted keys,
+    collapsed whitespace and lower-cased requirements; any other text with collapsed whitespace.
+    """
+    if isinstance(query, str):
+        text = _normalize_text(query)
+        if not text.startswith("{"):
+            return text
+        try:
+            query = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            return text
+        if not isinstance(query, dict):
+            return text
+    return str({key: _canonical_value(key, query[key]) for key in sorted(query, key=str)})
+
+
+def model_key(embed_model):
+    """Identify an embedding model and its settings; vectors of different models never share an entry."""
+    settings = [embed_model.class_name(), embed_model.model_name]
+    for name in ("dim", "ngram", "dimensions"):
+        value = getattr(embed_model, name, None)
+        if value is not None:
+            settings.append(f"{name}={value}")
+    return ":".join(str(setting) for setting in settings)
+
+
+class QueryEmbeddingCache:
+    """Bounded, persistent LRU of query vectors keyed on (embedding model, canonical query)."""
+
+    def __init__(self, path, maxsize=DEFAULT_CACHE_SIZE):
+        self.path = path
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._inserted = 0
+        try:
+            self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS query_embeddings ("
+                    " model TEXT NOT NULL, query TEXT NOT NULL, vector BLOB NOT NULL, last_used REAL NOT NULL,"
+                    " PRIMARY KEY (model, query))")
+                self._connection.execute(
+                    "CREATE INDEX IF NOT EXISTS query_embeddings_last_used ON query_embeddings (last_used)")
+        except sqlite3.Error as e:
+            logger.warning(f"Query embedding cache {path} is unavailable, queries will be embedded every time: {e}")
+            self._connection = None
+
+    def get_many(self, model, queries):
+        """Return {query: vector} for the canonical queries found in the cache, and mark them as used."""
+        queries = list(dict.fromkeys(queries))
+        found = {}
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    stale = []
+                    touched = time.time()
+                    # Stay below SQLite's limit on the number of parameters of one statement
+                    for start in range(0, len(queries), 500):
+                        chunk = queries[start:start + 500]
+                        rows = self._connection.execute(
+                            f"SELECT query, vector, last_used FROM query_embeddings WHERE model = ? AND query IN "
+                            f"({', '.join('?' * len(chunk))})", [model, *chunk])
+                        for query, vector, last_used in rows:
+                            found[query] = array('f', vector).tolist()
+                            if touched - last_used > TOUCH_INTERVAL:
+                                stale.append(query)
+                    if stale:
+                        with self._connection:
+                            self._connection.executemany(
+                                "UPDATE query_embeddings SET last_used = ? WHERE model = ? AND query = ?",
+                                [(touched, model, query) for query in stale])
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not read the query embedding cache {self.path}: {e}")
+            self.hits += len(found)
+            self.misses += len(queries) - len(found)
+        return found
+
+    def put_many(self, model, vectors):
+        """Store {query: vector} for canonical queries, evicting the least recently used entries beyond maxsize."""
+        now = time.time()
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO query_embeddings (model, query, vector, last_used) VALUES (?, ?, ?, ?)",
+                        [(model, query, array('f', vector).tobytes(), now) for query, vector in vectors.items()])
+                    self._inserted += len(vectors)
+                    if self._inserted >= min(EVICTION_INTERVAL, self.maxsize):
+                        self._inserted = 0
+                        excess = self._size() - self.maxsize
+                        if excess > 0:
+                            self._connection.execute(
+                                "DELETE FROM query_embeddings WHERE rowid IN "
+                                "(SELECT rowid FROM query_embeddings ORDER BY last_used LIMIT ?)", (excess,))
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write the query embedding cache {self.path}: {e}")
+
+    def _size(self):
+        return self._connection.execute("SELECT COUNT(*) FROM query_embeddings").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM query_embeddings")
+            self.hits = self.misses = 0
+
+    def info(self):
+        """Return hits, misses, hit rate, maxsize and current size. Hits and misses count this process's lookups."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            try:
+                currsize = self._size() if self._connection is not None else 0
+            except sqlite3.Error:
+                currsize = 0
+            return {'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'maxsize': self.maxsize, 'currsize': currsize}
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
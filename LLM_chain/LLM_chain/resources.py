@@ -0,0 +1,115 @@
+"""
+Shared resources of the LLM chain: the OpenAI client, the component vector index, its query embedding model and
+query embedding cache and its in-memory search matrix.
+
+Nothing is loaded when the package is imported. Each resource is created on first use and then reused by every
+step of the chain, so importing a module performs no I/O and no network calls. Long-running workers that prefer
+to pay the loading cost up front can call init().
+"""
+
+import os
+from threading import Lock
+
+# The persisted LlamaIndex vector store written by index_components.py. COMPONENT_INDEX_DIR points the chain at
+# another one, e.g. an index built offline with EMBEDDING_BACKEND=local for load tests.
+INDEX_DIR = os.getenv("COMPONENT_INDEX_DIR",
+                      os.path.join(os.path.dirname(os.path.abspath(__file__)), "index_components"))
+# The persistent query embedding cache (see query_cache.py), kept with the index it serves unless QUERY_CACHE_PATH
+# says otherwise
+QUERY_CACHE_PATH = os.getenv("QUERY_CACHE_PATH", os.path.join(INDEX_DIR, "query_embeddings.sqlite"))
+
+_lock = Lock()
+_environment_loaded = False
+_openai_client = None
+_index = None
+_embed_model = None
+_query_cache = None
+_vector_index = None
+
+
+def load_environment():
+    """Load the .env file into the environment, once."""
+    global _environment_loaded
+    if not _environment_loaded:
+        from dotenv import load_dotenv, find_dotenv
+
+        load_dotenv(find_dotenv())
+        _environment_loaded = True
+
+
+def openai_api_key():
+    """Return OPENAI_API_KEY, raising ValueError if it is not set."""
+    load_environment()
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not found in environment variables")
+    return api_key
+
+
+def get_openai_client():
+    """Return the OpenAI client shared by the chain, created on first use."""
+    global _openai_client
+    with _lock:
+        if _openai_client is None:
+            from openai import OpenAI
+
+            _openai_client = OpenAI(api_key=openai_api_key())
+        return _openai_client
+
+
+def get_index():
+    """Return the component vector index, loaded from INDEX_DIR on first use."""
+    global _index, _embed_model
+    with _lock:
+        if _index is None:
+            from llama_index.core import Settings, StorageContext, load_index_from_storage
+            from LLM_chain.LLM_chain.embeddings import embed_model_for_index
+
+            # Queries are embedded with the backend the index was built with
+            embed_model = embed_model_for_index(INDEX_DIR)
+            kwargs = {'embed_model': embed_model} if embed_model is not None else {}
+            _index = load_index_from_storage(StorageContext.from_defaults(persist_dir=INDEX_DIR), **kwargs)
+            _embed_model = embed_model if embed_model is not None else Settings.embed_model
+        return _index
+
+
+def get_embed_model():
+    """Return the model that embeds queries for the component index."""
+    get_index()
+    return _embed_model
+
+
+def get_query_cache():
+    """Return the query embedding cache, opened on first use, or None if QUERY_CACHE_SIZE is 0."""
+    global _query_cache
+    with _lock:
+        if _query_cache is None:
+            from LLM_chain.LLM_chain.query_cache import DEFAULT_CACHE_SIZE, QueryEmbeddingCache
+
+            if DEFAULT_CACHE_SIZE <= 0:
+                return None
+            _query_cache = QueryEmbeddingCache(QUERY_CACHE_PATH, DEFAULT_CACHE_SIZE)
+        return _query_cache
+
+
+def get_vector_index():
+    """
+    Return the stored vectors of the component index as an in-memory search index (see vector_search.py): an
+    ExactIndex, or an approximate IVFIndex with VECTOR_INDEX=ivf.
+    """
+    global _vector_index
+    index = get_index()
+    with _lock:
+        if _vector_index is None:
+            from LLM_chain.LLM_chain.vector_search import vector_index_from_store
+
+            _vector_index = vector_index_from_store(index.vector_store)
+        return _vector_index
+
+
+def init(openai=True, index=True):
+    """Create the shared resources now instead of on first use, e.g. when a worker process starts."""
+    if openai:
+        get_openai_client()
+    if index:
+        get_vector_index()
@@ -1,5 +1,7 @@
 import os
-from pxr import Usd, UsdGeom
+
+from USD_modules.component_cache import get_component
+from USD_modules.usd_format import resolve_usd_format
 
 def calculate_rear_panels_constrained(L_cabinet):
     # Calculate maximum a and b
@@ -23,38 +25,38 @@ def calculate_rear_panels_constrained(L_cabinet):
 
 
 
-def width_cabinet(input_files):
+def width_cabinet(input_files, catalog_file=None):
+    """Return the bounding box width of each cabinet. With catalog_file, input_files are prim names in that catalog."""
     length_of_cabinets= []
     for _index, file_path in enumerate(input_files):
-            if not os.path.exists(file_path):
+            if not catalog_file and not os.path.exists(file_path):
                 print(f"Warning: Input file {file_path} does not exist. Skipping.")
                 continue
 
-            model_name = os.path.splitext(os.path.basename(file_path))[0]
-
-            # Compute translation based on bounding box size
+            # Compute translation based on bounding box size, parsed once per process (see component_cache)
             try:
-                referenced_stage = Usd.Stage.Open(file_path)
-                model_geometry_prim = referenced_stage.GetPrimAtPath(f'/{model_name}/geometry')
-
-                if model_geometry_prim:
-                    boundable = UsdGeom.Boundable(model_geometry_prim)
-                    extent = boundable.GetExtentAttr().Get()
-                    model_width = extent[1][0] - extent[0][0]  # Bounding box width
-                    length_of_cabinets.append(model_width)
-                    
-
+                if catalog_file:
+                    component = get_component(catalog_file, prim_path=f"/{file_path}")
                 else:
-                    print(f"Warning: Could not find geometry for {file_path}.Try again.")
-                    
-
+                    component = get_component(file_path)
+            except ValueError as e:
+                print(f"Warning: Could not find geometry for {file_path}.Try again. ({e})")
+                continue
             except Exception as e:
+                # Unreadable layers (pxr raises Tf.ErrorException) are skipped like any other bad input
                 print(f"Error computing bounds for {file_path}: {e}")
                 continue
 
+            extent = component['extent']
+            if extent is None:
+                print(f"Error computing bounds for {file_path}: no extent authored")
+                continue
+            model_width = extent[1][0] - extent[0][0]  # Bounding box width
+            length_of_cabinets.append(model_width)
+
     return length_of_cabinets
 
 
-def construct_file_path(filename, directory="assets/components"):
-    return os.path.join(directory, filename + ".usda").replace("\\", "/")
+def construct_file_path(filename, directory="assets/components", file_format=None):
+    return os.path.join(directory, f"{filename}.{resolve_usd_format(file_format)}").replace("\\", "/")
 
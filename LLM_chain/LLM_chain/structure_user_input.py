@@ -8,7 +8,7 @@ Key functionality:
    - Workbench top (type, requirements)
    - Rear panels (if needed, type, color, requirements)
    - General requirements
-3. Saves the structured output as a timestamped JSON file
+3. Saves the structured output as a timestamped JSON file (save_searches, or when run as a script)
 
 The script uses OpenAI's API and provides default values when specific details are not mentioned in the input.
 """
@@ -21,25 +21,19 @@ The script uses OpenAI's API and provides default values when specific details a
 #3. diffeerent sizes and collors of different panels.
 
 import os
-from dotenv import load_dotenv, find_dotenv
 import json
-from pydantic import BaseModel
 from typing import List, Optional
 from enum import Enum
-from openai import OpenAI
 from datetime import datetime
 
-# Load .env
-dotenv_path = find_dotenv()
-load_dotenv(dotenv_path)
+from LLM_chain.LLM_chain.resources import get_openai_client
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-
-
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY not found in environment variables")
+# Structured searches are saved here by save_searches
+SEARCHES_DIR = os.path.join(os.path.dirname(__file__), "searches")
 
 def structure_user_input(user_input):
+    from pydantic import BaseModel
+
     # Define a simple output structure
     class Category(str, Enum):
         cabinet = "Cabinet"
@@ -79,9 +73,7 @@ def structure_user_input(user_input):
     Return the data as a list of components.
     Infer reasonable values for any missing information. Use standard types and colors if not specified.
     """
-    client = OpenAI(api_key=OPENAI_API_KEY)
-
-    completion = client.beta.chat.completions.parse(
+    completion = get_openai_client().beta.chat.completions.parse(
         model="gpt-4o-2024-08-06",
         messages=[
             {"role": "system", "content": prompt_template_str},
@@ -96,8 +88,6 @@ def structure_user_input(user_input):
     # Get the components from the parsed response
     return completion.choices[0].message.parsed.components
 
-searches = structure_user_input("I need three cabinets, one small with shelves, two medium with drawers.n I want two drawer cabinets, one small one large, a wooden workbench top, and black rear panel, and a cabinet that provides power.")
-
 # Function to format the output
 def format_component(component):
     return f"Category: {component.category.value}, Requirements: {', '.join(component.requirements)}, Size: {component.size.value if component.size else 'N/A'}"
@@ -135,17 +125,22 @@ def convert_to_dict(searches):
         ]
     }
 
-# Create searches directory if it doesn't exist
-searches_dir = os.path.join(os.path.dirname(__file__), "searches")
-os.makedirs(searches_dir, exist_ok=True)
+def save_searches(searches_dict, searches_dir=SEARCHES_DIR):
+    """Save a converted search to <searches_dir>/search_<timestamp>.json and return the file path."""
+    # Create searches directory if it doesn't exist
+    os.makedirs(searches_dir, exist_ok=True)
+
+    # Generate filename using timestamp from the dict
+    filename = f"search_{searches_dict['metadata']['timestamp']}.json"
+    filepath = os.path.join(searches_dir, filename)
 
-# Use the new function to convert searches to dict
-searches_dict = convert_to_dict(searches)
+    # Save to JSON file
+    with open(filepath, "w") as f:
+        json.dump(searches_dict, f, indent=2)
+    return filepath
 
-# Generate filename using timestamp from the dict
-filename = f"search_{searches_dict['metadata']['timestamp']}.json"
-filepath = os.path.join(searches_dir, filename)
 
-# Save to JSON file
-with open(filepath, "w") as f:
-    json.dump(searches_dict, f, indent=2)
+if __name__ == "__main__":
+    searches = structure_user_input("I need three cabinets, one small with shelves, two medium with drawers.n I want two drawer cabinets, one small one large, a wooden workbench top, and black rear panel, and a cabinet that provides power.")
+    print_searches(searches)
+    print(f"Saved to {save_searches(convert_to_dict(searches))}")
@@ -0,0 +1,134 @@
+"""
+Single-pass scanner for the header and component metadata of USDA text.
+
+Retrieved nodes carry the raw USDA of a component. scan_usda() pulls the defaultPrim, the root Xform name, the
+geometry customData and the extent out of that text without building a stage. The scan only moves forward: each
+field is located with str.find from where the previous one ended and parsed in place (string slicing, or a
+precompiled pattern anchored at that position), so no part of the text is searched twice. default_prim_name() stops after the layer header.
+"""
+
+import re
+
+_DEFAULT_PRIM = re.compile(r'defaultPrim\s*=\s*"([^"]*)"')
+_QUOTED_NAME = re.compile(r'\s*"([^"]*)"')
+_EXTENT = re.compile(r'\s*=\s*\[\s*\(([^)]*)\)\s*,\s*\(([^)]*)\)\s*\]')
+_CUSTOM_DATA_ENTRY = re.compile(r'(\w+)[ \t]+(\w+)[ \t]*=[ \t]*(?:"""(.*?)"""|"([^"\\\n]*(?:\\.[^"\\\n]*)*)"|(\S+))',
+                                re.DOTALL)
+_CONVERTERS = {"int": int, "int64": int, "uint": int, "uint64": int, "float": float, "double": float, "half": float,
+               "bool": lambda value: value in ("1", "true")}
+
+
+def _header_end(content):
+    """Return the offset of the first prim definition; the layer metadata (header) lies before it."""
+    if content.startswith("def "):
+        return 0
+    end = content.find("\ndef ")
+    return len(content) if end < 0 else end + 1
+
+
+def _default_prim(content, header_end):
+    start = content.find("defaultPrim", 0, header_end)
+    if start < 0:
+        return None
+    match = _DEFAULT_PRIM.match(content, start)
+    return match.group(1) if match else None
+
+
+def _root_xform(content, start):
+    start = content.find('def Xform', start)
+    if start < 0:
+        return None, 0
+    match = _QUOTED_NAME.match(content, start + len('def Xform'))
+    return (match.group(1), match.end()) if match else (None, start)
+
+
+def _custom_data_block(content, start):
+    """Return the body of the customData dictionary whose keyword ends at start and the offset after it, or None."""
+    opening = content.find("{", start)
+    if opening < 0 or content[start:opening].strip() != "=":
+        return None, start
+    closing = content.find("}", opening)
+    if closing < 0 or "{" in content[opening + 1:closing]:
+        return None, start
+    return content[opening + 1:closing], closing + 1
+
+
+def _parse_custom_data(block):
+    if '"""' not in block:
+        # One entry per line; only triple-quoted strings span lines and need the full pattern
+        return _parse_custom_data_lines(block)
+    custom_data = {}
+    for value_type, key, multiline, string, value in _CUSTOM_DATA_ENTRY.findall(block):
+        if value:
+            converter = _CONVERTERS.get(value_type)
+            custom_data[key] = converter(value) if converter else value
+        else:
+            custom_data[key] = multiline or string
+    return custom_data
+
+
+def _parse_custom_data_lines(block):
+    custom_data = {}
+    for line in block.splitlines():
+        declaration, equals, value = line.partition("=")
+        declaration = declaration.split()
+        if not equals or len(declaration) != 2:
+            continue
+        value_type, key = declaration
+        value = value.strip()
+        if value[:1] == '"':
+            custom_data[key] = value[1:-1]
+        else:
+            converter = _CONVERTERS.get(value_type)
+            custom_data[key] = converter(value) if converter else value
+    return custom_data
+
+
+def _parse_vector(text):
+    return tuple(map(float, text.split(',')))
+
+
+def scan_usda(content):
+    """
+    Scan USDA text once for its component metadata.
+
+    Returns:
+        dict: 'default_prim' and 'root_xform' (str or None), 'custom_data' (dict of the first customData block
+            after the root Xform, empty if none) and 'extent' (((min x, y, z), (max x, y, z)) or None).
+    """
+    header_end = _header_end(content)
+    default_prim = _default_prim(content, header_end)
+    root_xform, position = _root_xform(content, header_end)
+
+    custom_data = {}
+    start = content.find("customData", position)
+    if start >= 0:
+        block, end = _custom_data_block(content, start + len("customData"))
+        if block is not None:
+            custom_data = _parse_custom_data(block)
+            position = end
+
+    extent = None
+    start = content.find("extent", position)
+    while start >= 0:
+        # Skip longer identifiers such as extentsHint
+        match = _EXTENT.match(content, start + len("extent"))
+        if match and (start == 0 or not content[start - 1].isalnum()):
+            extent = (_parse_vector(match.group(1)), _parse_vector(match.group(2)))
+            break
+        start = content.find("extent", start + len("extent"))
+
+    return {'default_prim': default_prim, 'root_xform': root_xform, 'custom_data': custom_data, 'extent': extent}
+
+
+def default_prim_name(content, default=None):
+    """Return the defaultPrim of USDA text, or the root Xform name if it has none, reading only the header."""
+    # Inlined rather than going through scan_usda: this runs once per retrieved candidate
+    header_end = content.find("\ndef ")
+    start = content.find("defaultPrim", 0, header_end if header_end >= 0 else len(content))
+    if start >= 0:
+        match = _DEFAULT_PRIM.match(content, start)
+        if match:
+            return match.group(1)
+    root_xform, _ = _root_xform(content, max(header_end, 0))
+    return root_xform if root_xform is not None else default
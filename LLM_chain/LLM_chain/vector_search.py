@@ -0,0 +1,174 @@
+"""
+In-memory vector search over the component index.
+
+ExactIndex holds every stored vector of the index as one normalized NumPy matrix and scores a whole batch of query
+vectors with a single matrix product, instead of one Python loop over the stored vectors per query. Scores are
+cosine similarities, as in LlamaIndex's simple vector store.
+
+IVFIndex is the approximate option for large catalogs (VECTOR_INDEX=ivf): the vectors are clustered around nlist
+centroids and a query only scores the vectors of its nprobe closest clusters. nprobe trades recall for latency
+(IVF_NPROBE, default 16; nprobe = nlist is exact search), nlist defaults to the square root of the number of vectors
+(IVF_NLIST). The environment variables are read when an index is built, after resources has loaded the .env file.
+See benchmarks/bench_ann_index.py for recall and latency against ExactIndex.
+"""
+
+import os
+
+import numpy as np
+
+VECTOR_INDEXES = ("exact", "ivf")
+# k-means is trained on a sample of this many vectors per cluster, the rest are only assigned
+TRAINING_POINTS_PER_LIST = 64
+# Rows scored at once when assigning vectors to clusters, bounds the temporary score matrix
+ASSIGN_CHUNK = 8192
+
+
+def normalize(matrix):
+    """Scale the rows of matrix to unit length, leaving zero rows as they are."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k_rows(scores, top_k):
+    """Return (columns, scores) of the top_k scores of each row, best first."""
+    k = min(top_k, scores.shape[1])
+    if k < scores.shape[1]:
+        columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        columns = np.broadcast_to(np.arange(k), (scores.shape[0], k))
+    top_scores = np.take_along_axis(scores, columns, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return np.take_along_axis(columns, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+
+def _stored_vectors(vector_store):
+    embeddings = vector_store.to_dict()['embedding_dict']
+    return list(embeddings.keys()), list(embeddings.values())
+
+
+def resolve_vector_index(kind=None):
+    """Validate kind, falling back to VECTOR_INDEX."""
+    kind = (kind or os.getenv("VECTOR_INDEX", "exact")).lower()
+    if kind not in VECTOR_INDEXES:
+        raise ValueError(f"Unsupported vector index '{kind}', expected one of {VECTOR_INDEXES}")
+    return kind
+
+
+def vector_index_from_store(vector_store, kind=None):
+    """Build the in-memory index selected by kind (or VECTOR_INDEX) from a LlamaIndex SimpleVectorStore."""
+    if resolve_vector_index(kind) == "ivf":
+        return IVFIndex.from_vector_store(vector_store)
+    return ExactIndex.from_vector_store(vector_store)
+
+
+class ExactIndex:
+    """Brute-force cosine search over all stored vectors."""
+
+    def __init__(self, ids, vectors):
+        self.ids = list(ids)
+        self.vectors = normalize(vectors) if self.ids else np.zeros((0, 0), dtype=np.float32)
+
+    @classmethod
+    def from_vector_store(cls, vector_store):
+        """Build the index from a LlamaIndex SimpleVectorStore."""
+        return cls(*_stored_vectors(vector_store))
+
+    def search(self, queries, top_k=1):
+        """
+        Find the top_k stored vectors of each query vector.
+
+        Returns:
+            list: One list of (id, score) tuples per query, best first.
+        """
+        if not self.ids:
+            return [[] for _ in range(len(queries))]
+        columns, scores = top_k_rows(normalize(queries) @ self.vectors.T, top_k)
+        return [[(self.ids[c], float(s)) for c, s in zip(row_columns, row_scores)]
+                for row_columns, row_scores in zip(columns, scores)]
+
+
+def _assign(vectors, centroids):
+    """Return the index of the closest centroid of every row of vectors."""
+    return np.concatenate([np.argmax(vectors[start:start + ASSIGN_CHUNK] @ centroids.T, axis=1)
+                           for start in range(0, len(vectors), ASSIGN_CHUNK)])
+
+
+def _check_nprobe(nprobe):
+    if nprobe < 1:
+        raise ValueError(f"nprobe must be at least 1, got {nprobe}")
+    return nprobe
+
+
+def train_centroids(vectors, nlist, iterations=10, seed=0):
+    """Spherical k-means: nlist unit-length centroids of the unit-length rows of vectors, trained on a sample."""
+    rng = np.random.default_rng(seed)
+    sample = vectors[rng.choice(len(vectors), min(len(vectors), nlist * TRAINING_POINTS_PER_LIST), replace=False)]
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)]
+    for _ in range(iterations):
+        labels = _assign(sample, centroids)
+        order = np.argsort(labels, kind="stable")
+        present, starts = np.unique(labels[order], return_index=True)
+        sums = np.zeros_like(centroids)
+        sums[present] = np.add.reduceat(sample[order], starts, axis=0)
+        # Clusters that lost all their points restart from random sample points
+        empty = np.setdiff1d(np.arange(nlist), present)
+        sums[empty] = sample[rng.choice(len(sample), len(empty), replace=False)]
+        centroids = normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    """Approximate cosine search: an inverted file of k-means clusters, probing the closest nprobe per query."""
+
+    def __init__(self, ids, vectors, nlist=None, nprobe=None, iterations=10, seed=0):
+        """nlist and nprobe default to IVF_NLIST (0: square root of the number of vectors) and IVF_NPROBE (16)."""
+        nlist = int(os.getenv("IVF_NLIST", "0")) if nlist is None else nlist
+        if nlist < 0:
+            raise ValueError(f"nlist must be at least 0, got {nlist}")
+        self.ids = list(ids)
+        self.nprobe = _check_nprobe(int(os.getenv("IVF_NPROBE", "16")) if nprobe is None else nprobe)
+        if not self.ids:
+            self.nlist = 0
+            self.centroids = self.vectors = np.zeros((0, 0), dtype=np.float32)
+            self.rows = self.offsets = np.zeros(0, dtype=np.int64)
+            return
+        vectors = normalize(vectors)
+        self.nlist = min(len(self.ids), nlist or max(1, round(len(self.ids) ** 0.5)))
+        self.centroids = train_centroids(vectors, self.nlist, iterations, seed)
+        labels = _assign(vectors, self.centroids)
+        # The vectors of each cluster are stored contiguously: cluster c holds rows offsets[c]:offsets[c + 1]
+        self.rows = np.argsort(labels, kind="stable")
+        self.vectors = vectors[self.rows]
+        self.offsets = np.searchsorted(labels[self.rows], np.arange(self.nlist + 1))
+
+    @classmethod
+    def from_vector_store(cls, vector_store, **kwargs):
+        """Build the index from a LlamaIndex SimpleVectorStore."""
+        return cls(*_stored_vectors(vector_store), **kwargs)
+
+    def search(self, queries, top_k=1, nprobe=None):
+        """
+        Find the top_k stored vectors of each query vector among the clusters of its nprobe (default self.nprobe)
+        closest centroids.
+
+        Returns:
+            list: One list of (id, score) tuples per query, best first.
+        """
+        nprobe = self.nprobe if nprobe is None else _check_nprobe(nprobe)
+        if not self.ids:
+            return [[] for _ in range(len(queries))]
+        queries = normalize(queries)
+        centroid_scores = queries @ self.centroids.T
+        # Never spend a probe on a cluster without vectors
+        centroid_scores[:, self.offsets[1:] == self.offsets[:-1]] = -np.inf
+        probed, _ = top_k_rows(centroid_scores, min(nprobe, self.nlist))
+        results = []
+        for query, clusters in zip(queries, probed):
+            ranges = [(self.offsets[c], self.offsets[c + 1]) for c in clusters if self.offsets[c] < self.offsets[c + 1]]
+            candidates = np.concatenate([np.arange(start, end) for start, end in ranges])
+            scores = np.concatenate([self.vectors[start:end] @ query for start, end in ranges])
+            columns, top_scores = top_k_rows(scores[np.newaxis, :], top_k)
+            results.append([(self.ids[self.rows[candidates[c]]], float(s)) for c, s in zip(columns[0], top_scores[0])])
+        return results
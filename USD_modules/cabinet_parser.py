@@ -26,9 +26,10 @@ Dependencies: pxr (USD), custom models (CabinetModel, AssemblyModel, CabinetAsse
 # Takes the path of a set of cabinets and returns a cabinet model
 # extracts a length range
 
-from models import CabinetModel, AssemblyModel, CabinetAssembly
-from pxr import Usd, UsdGeom
-from typing import Dict, Any, List, Tuple
+from USD_modules.models import CabinetModel, AssemblyModel, CabinetAssembly
+from USD_modules.component_cache import get_component
+from USD_modules.component_reader import batch_extract
+from typing import Dict, Any, List, Optional, Tuple, Union
 import os
 
 # assets/components/cabinet_with_hinged_doors_4.usda
@@ -37,69 +38,38 @@ import os
 
 
 
-def extract_usd_properties(file_path: str) -> CabinetModel:
-    stage = Usd.Stage.Open(file_path)
-    if not stage:
-        raise ValueError(f"Failed to open USD stage for {file_path}")
-
-    root_prim = stage.GetDefaultPrim()
-    if not root_prim:
-        raise ValueError(f"No default prim found in {file_path}")
-
-    # Extract kind
-    kind = Usd.ModelAPI(root_prim).GetKind()
-
-    # Find the geometry prim
-    geometry_prim = root_prim.GetChild("geometry")
-    if not geometry_prim:
-        raise ValueError(f"No geometry prim found in {file_path}")
-
-    # Extract custom data
-    custom_data = geometry_prim.GetCustomData()
-
-    # Extract extent
-    extent_attr = geometry_prim.GetAttribute("extent")
-    extent = extent_attr.Get() if extent_attr else None
-
-    # Extract display color
-    display_color_attr = geometry_prim.GetAttribute("primvars:displayColor")
-    display_color = display_color_attr.Get() if display_color_attr else None
-
-    # Extract xformOps
-    xform_ops = {}
-    xformable = UsdGeom.Xformable(geometry_prim)
-    for op in xformable.GetOrderedXformOps():
-        op_name = op.GetOpName()
-        op_value = op.Get()
-        xform_ops[op_name] = op_value
-
-    # Extract xformOpOrder
-    xform_op_order_attr = geometry_prim.GetAttribute("xformOpOrder")
-    xform_op_order = xform_op_order_attr.Get() if xform_op_order_attr else None
+def extract_usd_properties(file_path: str, prim_path: Optional[str] = None) -> CabinetModel:
+    # Parsed once per process: from the metadata sidecar, the layer, or a composed stage as a last resort
+    component = get_component(file_path, prim_path)
+    custom_data = component['custom_data']
 
     return CabinetModel(
-        name=os.path.splitext(os.path.basename(file_path))[0],
+        name=component['name'] if prim_path else os.path.splitext(os.path.basename(file_path))[0],
         asset_path=file_path,
-        dimensions=tuple(xform_ops.get('xformOp:scale', (1.0, 1.0, 1.0))),
+        dimensions=tuple(component['scale'] or (1.0, 1.0, 1.0)),
         function=custom_data.get('function', 'Unknown'),
         type=custom_data.get('type', 'Unknown'),
-        color=tuple(display_color[0]) if display_color else (1.0, 1.0, 1.0),  # Default to white if no color is specified
+        color=tuple(component['color'] or (1.0, 1.0, 1.0)),  # Default to white if no color is specified
         material=custom_data.get('material', 'Unknown')
     )
 
 
+def extract_usd_properties_batch(
+    cabinet_paths: List[Union[str, Tuple[str, str]]], max_workers: Optional[int] = None
+) -> Tuple[List[CabinetModel], List[Tuple[Union[str, Tuple[str, str]], str]]]:
+    """
+    Extract many cabinets concurrently on a thread pool.
 
-
+    cabinet_paths holds file paths, or (catalog_file, prim_path) tuples. Returns the CabinetModels of the files
+    that could be read, in input order, and a list of (path, error message) for the others.
+    """
+    return batch_extract(cabinet_paths, extract_usd_properties, max_workers=max_workers)
 
 
 def create_assembly(cabinet_paths: List[str]) -> CabinetAssembly:
-    cabinets = []
-    for path in cabinet_paths:
-        try:
-            cabinet = extract_usd_properties(path)
-            cabinets.append(cabinet)
-        except ValueError as e:
-            print(f"Error processing {path}: {e}")
+    cabinets, errors = extract_usd_properties_batch(cabinet_paths)
+    for path, error in errors:
+        print(f"Error processing {path}: {error}")
     
     assembly = CabinetAssembly(cabinets=cabinets)
     
@@ -111,30 +81,29 @@ def create_assembly(cabinet_paths: List[str]) -> CabinetAssembly:
     return assembly
 
 # Example usage:
-cabinet_paths = [
-    "assets/components/drawer_cabinet_2.usda",
-    "assets/components/cabinet_with_hinged_doors_4.usda",
-    "assets/components/rolling_cabinet_6.usda"
-]
-
-try:
-    assembly = create_assembly(cabinet_paths)
-    print("Assembly created successfully:")
-    print(f"Number of cabinets: {len(assembly.cabinets)}")
-    print(f"Total length of assembly: {assembly.total_length}")
-
-    # Print details of each cabinet
-    for i, cabinet in enumerate(assembly.cabinets, 1):
-        print(f"\nCabinet {i}:")
-        print(f"  Name: {cabinet.name}")
-        print(f"  Asset Path: {cabinet.asset_path}")
-        print(f"  Dimensions: {cabinet.dimensions}")
-        print(f"  Function: {cabinet.function}")
-        print(f"  Type: {cabinet.type}")
-        print(f"  Color: {cabinet.color}")
-        print(f"  Material: {cabinet.material}")
-
-except Exception as e:
-    print(f"Error creating assembly: {e}")
-
-
+if __name__ == "__main__":
+    cabinet_paths = [
+        "assets/components/drawer_cabinet_2.usda",
+        "assets/components/cabinet_with_hinged_doors_4.usda",
+        "assets/components/rolling_cabinet_6.usda"
+    ]
+
+    try:
+        assembly = create_assembly(cabinet_paths)
+        print("Assembly created successfully:")
+        print(f"Number of cabinets: {len(assembly.cabinets)}")
+        print(f"Total length of assembly: {assembly.total_length}")
+
+        # Print details of each cabinet
+        for i, cabinet in enumerate(assembly.cabinets, 1):
+            print(f"\nCabinet {i}:")
+            print(f"  Name: {cabinet.name}")
+            print(f"  Asset Path: {cabinet.asset_path}")
+            print(f"  Dimensions: {cabinet.dimensions}")
+            print(f"  Function: {cabinet.function}")
+            print(f"  Type: {cabinet.type}")
+            print(f"  Color: {cabinet.color}")
+            print(f"  Material: {cabinet.material}")
+
+    except Exception as e:
+        print(f"Error creating assembly: {e}")
@@ -0,0 +1,103 @@
+"""
+Process-wide cache of parsed component metadata.
+
+One request touches the same component files several times (width_cabinet, merge_usda_files, the parsers and
+assembly building), and a long-running worker sees the same catalog assets on every request. get_component()
+parses each component once: from the metadata sidecar when it is fresh, else from its layer, else from a composed
+stage. Entries are keyed on the file's real path, mtime and size, so an edited file is parsed again, and the
+least recently used entries are evicted beyond maxsize (COMPONENT_CACHE_SIZE, default 4096).
+"""
+
+from collections import OrderedDict
+from threading import Lock
+import os
+
+from USD_modules.component_index import lookup_component
+from USD_modules.component_reader import read_component, read_component_stage
+
+DEFAULT_CACHE_SIZE = int(os.getenv("COMPONENT_CACHE_SIZE", "4096"))
+
+
+def _from_sidecar(record):
+    return {
+        'name': record['name'],
+        'custom_data': {key: record[key] for key in
+                        ('type', 'function', 'width', 'depth', 'height', 'color_attribute', 'material')},
+        'scale': (record['scale_x'], record['scale_y'], record['scale_z']),
+        'extent': ((record['extent_min_x'], record['extent_min_y'], record['extent_min_z']),
+                   (record['extent_max_x'], record['extent_max_y'], record['extent_max_z'])),
+        'color': (record['color_r'], record['color_g'], record['color_b']),
+    }
+
+
+def load_component(file_path, prim_path=None, variant=None):
+    """Parse a component without caching: sidecar, then layer-level read, then composed stage."""
+    record = lookup_component(file_path, prim_path, variant)
+    if record is not None:
+        return _from_sidecar(record)
+    component = read_component(file_path, prim_path, variant)
+    if component is not None:
+        return component
+    return read_component_stage(file_path, prim_path, variant)
+
+
+class ComponentCache:
+    """Bounded LRU of component metadata keyed on (path, prim path, variant, mtime, size)."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, file_path, prim_path=None, variant=None):
+        """
+        Return the metadata of a component (see component_reader.read_component), parsing it on a miss.
+
+        The returned dict is shared between callers and must not be modified. Raises ValueError if the file does
+        not exist or holds no such component.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            raise ValueError(f"{file_path} does not exist")
+        key = (os.path.realpath(file_path), prim_path, variant, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            component = self._entries.get(key)
+            if component is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return component
+            self.misses += 1
+
+        component = load_component(file_path, prim_path, variant)
+
+        with self._lock:
+            self._entries[key] = component
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return component
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        """Return hits, misses, hit rate, maxsize and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'maxsize': self.maxsize, 'currsize': len(self._entries)}
+
+
+component_cache = ComponentCache()
+
+
+def get_component(file_path, prim_path=None, variant=None):
+    """Look up a component in the process-wide cache."""
+    return component_cache.get(file_path, prim_path, variant)
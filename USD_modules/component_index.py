@@ -0,0 +1,101 @@
+"""
+Reader of the metadata sidecar the asset generator writes next to its outputs (asset_generator/sidecar_index.py).
+
+Layout and parsing code asks lookup_component() for a component's metadata before opening its USD file. An entry
+is only returned while the file's mtime and size still match what was recorded at generation time, so a hand-edited
+or regenerated asset without a refreshed sidecar transparently falls back to reading the USD file.
+"""
+
+import os
+import sqlite3
+
+# Must match asset_generator/sidecar_index.SIDECAR_NAME
+SIDECAR_NAME = "components.sqlite"
+
+
+def _path_key(path):
+    return os.path.normcase(os.path.realpath(path))
+
+
+class ComponentIndex:
+    """In-memory view of one sidecar, reloaded when the sidecar file itself changes."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._signature = None
+        self._entries = {}
+
+    def _refresh(self):
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            self._signature, self._entries = None, {}
+            return
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return
+
+        sidecar_dir = os.path.dirname(self.db_path) or "."
+        connection = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        try:
+            connection.row_factory = sqlite3.Row
+            rows = [dict(row) for row in connection.execute("SELECT * FROM components")]
+        except sqlite3.Error as e:
+            print(f"Warning: Could not read sidecar {self.db_path}: {e}")
+            rows = []
+        finally:
+            connection.close()
+
+        entries = {}
+        for row in rows:
+            file_key = _path_key(os.path.join(sidecar_dir, row['file_path']))
+            entries[(file_key, row['prim_path'], row['variant'])] = row
+            if row['default_prim']:
+                entries[(file_key, None, row['variant'])] = row
+        self._signature, self._entries = signature, entries
+
+    def lookup(self, file_path, prim_path=None, variant=None):
+        """Return the fresh sidecar entry of a component, or None if it is unknown or its file has changed."""
+        self._refresh()
+        entry = self._entries.get((_path_key(file_path), prim_path, variant))
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) != (entry['file_mtime_ns'], entry['file_size']):
+            return None
+        return entry
+
+
+_indexes = {}
+
+
+def sidecar_for(file_path):
+    """Return the sidecar indexing file_path (components.sqlite in the same directory), or None."""
+    db_path = os.path.join(os.path.dirname(file_path) or ".", SIDECAR_NAME)
+    return db_path if os.path.exists(db_path) else None
+
+
+def lookup_component(file_path, prim_path=None, variant=None):
+    """
+    Look up a generated component in its sidecar.
+
+    Args:
+        file_path (str): The USD file holding the component (component file, catalog or family asset).
+        prim_path (str): Root prim of the component. None selects the file's default prim.
+        variant (str): The 'size' variant of a product family asset.
+
+    Returns:
+        dict: The sidecar row (see asset_generator/sidecar_index.COLUMNS), or None when the caller has to read
+            the USD file instead.
+    """
+    db_path = sidecar_for(file_path)
+    if db_path is None:
+        return None
+    index = _indexes.get(db_path)
+    if index is None:
+        index = _indexes[db_path] = ComponentIndex(db_path)
+    return index.lookup(file_path, prim_path, variant)
+
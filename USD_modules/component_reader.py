@@ -0,0 +1,140 @@
+"""
+Lightweight, layer-level reads of generated component assets.
+
+Generated components (asset_generator) keep everything the parsers need on the /<name>/geometry prim spec of a
+single layer: customData, xformOp:scale, extent and primvars:displayColor. Reading that spec straight from the
+Sdf layer skips stage population and composition entirely. Assets that are not laid out like this (references,
+sublayers, hand-authored files) return None so callers can fall back to a full Usd.Stage read.
+
+batch_extract() runs any per-file extraction over many paths on a thread pool and collects per-file errors.
+
+pxr is imported by the readers on first use, so processes served entirely from the metadata sidecar never load it.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+# Name of the variantSet holding the SKUs of a product family asset
+SIZE_VARIANT_SET = "size"
+
+
+def read_component(file_path, prim_path=None, variant=None):
+    """
+    Read a component's metadata from its layer without composing a stage.
+
+    Args:
+        file_path (str): USD file holding the component.
+        prim_path (str): Root prim of the component. None selects the layer's default prim.
+        variant (str): The 'size' variant of a product family asset to read.
+
+    Returns:
+        dict: 'name', 'custom_data', 'scale', 'extent' and 'color' (None when not authored), or None if the
+            layer does not hold the geometry spec itself.
+    """
+    from pxr import Sdf
+
+    layer = Sdf.Layer.FindOrOpen(file_path)
+    if layer is None:
+        raise ValueError(f"Failed to open USD layer for {file_path}")
+
+    if prim_path is None:
+        if not layer.defaultPrim:
+            return None
+        prim_path = f"/{layer.defaultPrim}"
+    root_spec = layer.GetPrimAtPath(prim_path)
+    if root_spec is None or root_spec.hasReferences or layer.subLayerPaths:
+        return None
+    name = root_spec.name
+    if variant is not None:
+        variant_set = root_spec.variantSets.get(SIZE_VARIANT_SET)
+        variant_spec = variant_set.variants.get(variant) if variant_set is not None else None
+        if variant_spec is None:
+            return None
+        root_spec, name = variant_spec.primSpec, variant
+    geometry_spec = root_spec.nameChildren.get("geometry")
+    if geometry_spec is None:
+        return None
+
+    def default(attribute_name):
+        attribute_spec = geometry_spec.attributes.get(attribute_name)
+        return attribute_spec.default if attribute_spec is not None else None
+
+    display_color = default("primvars:displayColor")
+    return {
+        'name': name,
+        'custom_data': dict(geometry_spec.customData),
+        'scale': default("xformOp:scale"),
+        'extent': default("extent"),
+        'color': tuple(display_color[0]) if display_color else None,
+    }
+
+
+def read_component_stage(file_path, prim_path=None, variant=None):
+    """
+    Read a component's metadata from a fully composed stage, for assets read_component cannot handle.
+
+    Returns the same dict as read_component and raises ValueError if the component or its geometry is missing.
+    """
+    from pxr import Usd, UsdGeom
+
+    stage = Usd.Stage.Open(file_path)
+    if not stage:
+        raise ValueError(f"Failed to open USD stage for {file_path}")
+
+    # Components of a single-layer catalog are addressed by prim path instead of the default prim
+    root_prim = stage.GetPrimAtPath(prim_path) if prim_path else stage.GetDefaultPrim()
+    if not root_prim:
+        raise ValueError(f"No {prim_path or 'default prim'} found in {file_path}")
+    name = root_prim.GetName()
+    if variant is not None:
+        # Select the variant in the session layer so the shared family layer is left untouched
+        with Usd.EditContext(stage, stage.GetSessionLayer()):
+            root_prim.GetVariantSets().GetVariantSet(SIZE_VARIANT_SET).SetVariantSelection(variant)
+        name = variant
+
+    geometry_prim = root_prim.GetChild("geometry")
+    if not geometry_prim:
+        raise ValueError(f"No geometry prim found in {file_path}")
+
+    xform_ops = {op.GetOpName(): op.Get() for op in UsdGeom.Xformable(geometry_prim).GetOrderedXformOps()}
+    extent_attr = geometry_prim.GetAttribute("extent")
+    display_color_attr = geometry_prim.GetAttribute("primvars:displayColor")
+    display_color = display_color_attr.Get() if display_color_attr else None
+    return {
+        'name': name,
+        'custom_data': dict(geometry_prim.GetCustomData()),
+        'scale': xform_ops.get('xformOp:scale'),
+        'extent': extent_attr.Get() if extent_attr else None,
+        'color': tuple(display_color[0]) if display_color else None,
+    }
+
+
+def batch_extract(items, extract, max_workers=None):
+    """
+    Run extract over many components concurrently.
+
+    Args:
+        items (list): File paths, or (file_path, prim_path) tuples for components of a single-layer catalog.
+        extract (callable): extract(file_path, prim_path) returning a model, raising ValueError on bad input.
+        max_workers (int): Thread pool size. Defaults to the executor's default (min(32, CPUs + 4)).
+
+    Returns:
+        tuple: (models in input order for the files that succeeded, list of (item, error message) tuples).
+    """
+    def run(item):
+        file_path, prim_path = item if isinstance(item, tuple) else (item, None)
+        try:
+            if not os.path.exists(file_path):
+                raise ValueError(f"{file_path} does not exist")
+            return extract(file_path, prim_path), None
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+
+    models, errors = [], []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item, (model, error) in zip(items, executor.map(run, items)):
+            if error is None:
+                models.append(model)
+            else:
+                errors.append((item, error))
+    return models, errors
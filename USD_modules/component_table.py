@@ -0,0 +1,172 @@
+"""
+Columnar (struct-of-arrays) table of cabinet components for bulk dimension arithmetic.
+
+CabinetModel stays the public API. For work over thousands of cabinets, a ComponentTable holds the same data as
+NumPy arrays (dimensions and colors as (n, 3) float arrays, type/material/function as categorical codes) so
+filtering, length sums and consistency checks run vectorized instead of looping over Pydantic objects.
+
+Tables are built from models (from_models), or loaded once from the metadata sidecar the asset generator writes
+next to its outputs (from_sidecar), and convert back with to_models().
+"""
+
+from USD_modules.models import CabinetModel
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import os
+import sqlite3
+
+
+def _categorical(values):
+    """Return (codes, categories) for a sequence of strings."""
+    categories, codes = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+    return codes.astype(np.int32), categories.astype(object)
+
+
+class ComponentTable:
+    """
+    Columns of n components. Row i of every column describes the same component.
+
+    Attributes:
+        names, asset_paths: (n,) object arrays.
+        dimensions: (n, 3) float64 array, the CabinetModel dimensions (x, y, z).
+        colors: (n, 3) float64 array of RGB display colors.
+        type_codes, material_codes, function_codes: (n,) int32 indices into types, materials, functions.
+    """
+
+    def __init__(self, names, asset_paths, dimensions, colors, type_codes, types, material_codes, materials,
+                 function_codes, functions):
+        self.names = np.asarray(names, dtype=object)
+        self.asset_paths = np.asarray(asset_paths, dtype=object)
+        self.dimensions = np.asarray(dimensions, dtype=np.float64).reshape(-1, 3)
+        self.colors = np.asarray(colors, dtype=np.float64).reshape(-1, 3)
+        self.type_codes, self.types = np.asarray(type_codes, dtype=np.int32), np.asarray(types, dtype=object)
+        self.material_codes, self.materials = (np.asarray(material_codes, dtype=np.int32),
+                                               np.asarray(materials, dtype=object))
+        self.function_codes, self.functions = (np.asarray(function_codes, dtype=np.int32),
+                                               np.asarray(functions, dtype=object))
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def widths(self):
+        return self.dimensions[:, 0]
+
+    @classmethod
+    def from_columns(cls, names, asset_paths, dimensions, colors, types, materials, functions):
+        type_codes, type_categories = _categorical(types)
+        material_codes, material_categories = _categorical(materials)
+        function_codes, function_categories = _categorical(functions)
+        return cls(names, asset_paths, dimensions, colors, type_codes, type_categories, material_codes,
+                   material_categories, function_codes, function_categories)
+
+    @classmethod
+    def from_models(cls, models: Iterable[CabinetModel]) -> "ComponentTable":
+        models = list(models)
+        return cls.from_columns(
+            [model.name for model in models],
+            [model.asset_path for model in models],
+            [model.dimensions for model in models],
+            [model.color for model in models],
+            [model.type for model in models],
+            [model.material for model in models],
+            [model.function for model in models],
+        )
+
+    @classmethod
+    def from_sidecar(cls, db_path: str) -> "ComponentTable":
+        """Load every component indexed in a metadata sidecar (components.sqlite) in one query."""
+        connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            rows = connection.execute(
+                "SELECT name, file_path, scale_x, scale_y, scale_z, color_r, color_g, color_b, type, material, "
+                "function FROM components ORDER BY rowid").fetchall()
+        finally:
+            connection.close()
+        sidecar_dir = os.path.dirname(db_path)
+        columns = list(zip(*rows)) if rows else [()] * 11
+        return cls.from_columns(
+            columns[0],
+            [os.path.join(sidecar_dir, file_path).replace("\\", "/") for file_path in columns[1]],
+            np.column_stack(columns[2:5]) if rows else np.empty((0, 3)),
+            np.column_stack(columns[5:8]) if rows else np.empty((0, 3)),
+            columns[8], columns[9], columns[10],
+        )
+
+    def model(self, index: int) -> CabinetModel:
+        return CabinetModel(
+            name=self.names[index],
+            asset_path=self.asset_paths[index],
+            dimensions=tuple(self.dimensions[index].tolist()),
+            function=self.functions[self.function_codes[index]],
+            type=self.types[self.type_codes[index]],
+            color=tuple(self.colors[index].tolist()),
+            material=self.materials[self.material_codes[index]],
+        )
+
+    def to_models(self) -> List[CabinetModel]:
+        return [self.model(index) for index in range(len(self))]
+
+    def take(self, indices) -> "ComponentTable":
+        """Return the rows at indices (an integer array or a boolean mask), in that order."""
+        return ComponentTable(self.names[indices], self.asset_paths[indices], self.dimensions[indices],
+                              self.colors[indices], self.type_codes[indices], self.types,
+                              self.material_codes[indices], self.materials, self.function_codes[indices],
+                              self.functions)
+
+    def mask(self, component_type: Optional[str] = None, material: Optional[str] = None,
+             width: Optional[Tuple[float, float]] = None, depth: Optional[Tuple[float, float]] = None,
+             height: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """
+        Return a boolean mask of the rows matching every given constraint.
+
+        component_type and material match exactly. width, depth and height are inclusive (min, max) ranges over
+        dimensions x, y and z, either bound may be None.
+        """
+        selected = np.ones(len(self), dtype=bool)
+        for codes, categories, value in ((self.type_codes, self.types, component_type),
+                                         (self.material_codes, self.materials, material)):
+            if value is not None:
+                matches = np.flatnonzero(categories == value)
+                selected &= np.isin(codes, matches)
+        for axis, bounds in enumerate((width, depth, height)):
+            if bounds is None:
+                continue
+            low, high = bounds
+            if low is not None:
+                selected &= self.dimensions[:, axis] >= low
+            if high is not None:
+                selected &= self.dimensions[:, axis] <= high
+        return selected
+
+    def total_length(self, indices=None) -> float:
+        """Sum of the x dimensions, of all rows or of the rows at indices (see CabinetAssembly.total_length)."""
+        widths = self.widths if indices is None else self.widths[indices]
+        return float(widths.sum())
+
+    def inconsistent(self, indices: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compare every row with the first one, as CabinetAssembly.check_consistency does.
+
+        Returns:
+            tuple: Boolean (height, depth) arrays, True where a cabinet's dimensions y / z differ from the first.
+        """
+        dimensions = self.dimensions if indices is None else self.dimensions[indices]
+        if not len(dimensions):
+            return np.zeros(0, dtype=bool), np.zeros(0, dtype=bool)
+        return dimensions[:, 1] != dimensions[0, 1], dimensions[:, 2] != dimensions[0, 2]
+
+    def check_consistency(self, indices: Optional[Sequence[int]] = None) -> List[str]:
+        """The warnings CabinetAssembly.check_consistency reports for the same cabinets, computed vectorized."""
+        dimensions = self.dimensions if indices is None else self.dimensions[indices]
+        different_height, different_depth = self.inconsistent(indices)
+        warnings = []
+        # Only the (usually few) inconsistent rows are formatted in Python
+        for i in np.flatnonzero(different_height | different_depth):
+            if different_height[i]:
+                warnings.append(f"Warning: Cabinet {i} has a different height ({dimensions[i, 1]}) than the first "
+                                f"cabinet ({dimensions[0, 1]})")
+            if different_depth[i]:
+                warnings.append(f"Warning: Cabinet {i} has a different depth ({dimensions[i, 2]}) than the first "
+                                f"cabinet ({dimensions[0, 2]})")
+        return warnings
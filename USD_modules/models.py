@@ -10,11 +10,16 @@ The models include validation logic to ensure dimensional consistency between co
 for calculating total lengths and checking component compatibility. An assembly model should define a caninet assembly.
 
 These models are the "heart" of any pipeline that uses LISTA files to create assemblies. e.g. We can transform this model to 3D-Future style datatypes, or conver to USD.
+
+Build models with their normal constructor, also from our own catalog data: with every field given, pydantic-core
+validation is cheaper than model_construct, and nested models that are already instances are not validated again.
+For internal hot loops over many cabinets, CabinetRecord is the low-overhead representation.
 """
 
-from pydantic import BaseModel, Field, computed_field, model_validator
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
+from typing import Any, List, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass, field
 
 
 class CabinetModel(BaseModel):
@@ -73,18 +78,149 @@ class OtherAssetModel(BaseModel):
     position: str = Field(..., description="Position of the asset relative to the assembly, e.g., 'side', 'corner', 'back'")
 
 
+@dataclass(slots=True)
+class CabinetRecord:
+    """Compact, unvalidated cabinet for internal hot loops, e.g. scoring many candidate assemblies."""
+    name: str
+    asset_path: str
+    dimensions: Tuple[float, float, float]
+    function: str
+    type: str
+    color: Tuple[float, float, float]
+    material: str
+
+    @classmethod
+    def from_model(cls, cabinet: CabinetModel) -> 'CabinetRecord':
+        return cls(cabinet.name, cabinet.asset_path, cabinet.dimensions, cabinet.function, cabinet.type,
+                   cabinet.color, cabinet.material)
+
+    def to_model(self) -> CabinetModel:
+        return CabinetModel(name=self.name, asset_path=self.asset_path, dimensions=self.dimensions,
+                            function=self.function, type=self.type, color=self.color, material=self.material)
+
+
+@dataclass(slots=True)
+class AssemblyAggregates:
+    """Running totals of a CabinetAssembly. Axes follow check_consistency: y is height, z is depth."""
+    total_length: float = 0.0
+    heights: Counter = field(default_factory=Counter)
+    depths: Counter = field(default_factory=Counter)
+
+    @classmethod
+    def of(cls, cabinets: List[CabinetModel]) -> 'AssemblyAggregates':
+        return cls(sum(cabinet.dimensions[0] for cabinet in cabinets),
+                   Counter(cabinet.dimensions[1] for cabinet in cabinets),
+                   Counter(cabinet.dimensions[2] for cabinet in cabinets))
+
+    def copy(self) -> 'AssemblyAggregates':
+        return AssemblyAggregates(self.total_length, Counter(self.heights), Counter(self.depths))
+
+    def add(self, cabinet: CabinetModel) -> None:
+        width, height, depth = cabinet.dimensions
+        self.total_length += width
+        self.heights[height] += 1
+        self.depths[depth] += 1
+
+    def discard(self, cabinet: CabinetModel) -> None:
+        width, height, depth = cabinet.dimensions
+        self.total_length -= width
+        for counts, value in ((self.heights, height), (self.depths, depth)):
+            counts[value] -= 1
+            if not counts[value]:
+                del counts[value]
+
+
 class CabinetAssembly(BaseModel):
+    """
+    Cabinets placed side by side.
+
+    Edit the cabinets through append, insert, remove and swap: they keep the running aggregates (total length and
+    the height/depth counts behind max_height, max_depth and check_consistency) up to date in O(1), so layout code
+    can mutate candidates instead of rebuilding the model. Assigning a new cabinets list rebuilds them; mutating the
+    list in place leaves them stale.
+    """
     cabinets: List[CabinetModel] = Field(..., description="List of cabinets included in the assembly")
 
+    _aggregates: AssemblyAggregates = PrivateAttr(default_factory=AssemblyAggregates)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._aggregates = AssemblyAggregates.of(self.cabinets)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'cabinets':
+            self.__pydantic_private__['_aggregates'] = AssemblyAggregates.of(self.cabinets)
+
+    @property
+    def aggregates(self) -> AssemblyAggregates:
+        # Read the private state directly, BaseModel.__getattr__ costs more than the edits themselves
+        return self.__pydantic_private__['_aggregates']
+
+    def __copy__(self) -> 'CabinetAssembly':
+        # A shallow copy must not share the cabinet list or the running aggregates, or editing the copy would
+        # corrupt the original
+        copied = super().__copy__()
+        copied.__dict__['cabinets'] = list(self.cabinets)
+        copied._aggregates = self.aggregates.copy()
+        return copied
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> 'CabinetAssembly':
+        copied = super().model_copy(update=update, deep=deep)
+        if update and 'cabinets' in update:
+            copied.model_post_init(None)
+        return copied
+
+    def append(self, cabinet: CabinetModel) -> None:
+        self.cabinets.append(cabinet)
+        self.aggregates.add(cabinet)
+
+    def insert(self, index: int, cabinet: CabinetModel) -> None:
+        self.cabinets.insert(index, cabinet)
+        self.aggregates.add(cabinet)
+
+    def remove(self, index: int) -> CabinetModel:
+        """Remove and return the cabinet at index."""
+        cabinet = self.cabinets.pop(index)
+        aggregates = self.aggregates
+        aggregates.discard(cabinet)
+        if not self.cabinets:
+            # Start again from an exact zero rather than the rounding residue of the removals
+            aggregates.total_length = 0.0
+        return cabinet
+
+    def swap(self, i: int, j: int) -> None:
+        """Exchange the cabinets at positions i and j. The aggregates do not depend on the order."""
+        self.cabinets[i], self.cabinets[j] = self.cabinets[j], self.cabinets[i]
+
     @computed_field
     @property
     def total_length(self) -> float:
         """Calculate the total width of all cabinets in the assembly."""
-        return sum(cabinet.dimensions[0] for cabinet in self.cabinets)
+        return self.aggregates.total_length
+
+    @property
+    def max_height(self) -> float:
+        """Tallest cabinet, in O(distinct heights): catalog cabinets come in a handful of heights."""
+        return max(self.aggregates.heights, default=0.0)
+
+    @property
+    def max_depth(self) -> float:
+        """Deepest cabinet, in O(distinct depths)."""
+        return max(self.aggregates.depths, default=0.0)
+
+    @property
+    def inconsistency_count(self) -> int:
+        """Number of warnings check_consistency reports, without building them."""
+        cabinets = self.cabinets
+        if not cabinets:
+            return 0
+        aggregates = self.aggregates
+        _, reference_height, reference_depth = cabinets[0].dimensions
+        return 2 * len(cabinets) - aggregates.heights[reference_height] - aggregates.depths[reference_depth]
 
     def check_consistency(self) -> List[str]:
         warnings = []
-        if not self.cabinets:
+        if not self.inconsistency_count:
             return warnings
 
         first_cabinet = self.cabinets[0]
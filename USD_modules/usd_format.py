@@ -0,0 +1,24 @@
+"""
+USD file format of the pipeline's outputs, shared by the asset generator, the layout code and the LLM chain.
+
+Text .usda stays the default (and the debugging fallback), binary .usdc is faster to parse and smaller.
+The USD_FORMAT environment variable switches the whole pipeline.
+"""
+
+import os
+
+USD_FORMATS = ("usda", "usdc")
+DEFAULT_USD_FORMAT = os.getenv("USD_FORMAT", "usda")
+
+
+def resolve_usd_format(file_format=None):
+    """Validate file_format, falling back to the pipeline-wide default."""
+    file_format = (file_format or DEFAULT_USD_FORMAT).lower()
+    if file_format not in USD_FORMATS:
+        raise ValueError(f"Unsupported USD format '{file_format}', expected one of {USD_FORMATS}")
+    return file_format
+
+
+def with_usd_format(path, file_format=None):
+    """Return path with its extension replaced to match file_format."""
+    return f"{os.path.splitext(path)[0]}.{resolve_usd_format(file_format)}"
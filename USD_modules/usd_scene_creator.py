@@ -15,19 +15,25 @@ and workbench tops, including their dimensions and asset paths.
 """
 
 from pxr import Usd, UsdGeom, Sdf, Gf, Vt
-from typing import List
-from models import AssemblyModel
+from typing import List, Optional
+from USD_modules.models import AssemblyModel
+from USD_modules.usd_format import with_usd_format
 
 # create scene, import assets, scale workbench top accordinly
 #WEORK IN PROGRESS
 
-def create_usd_scene(assembly: AssemblyModel, output_path: str) -> None:
+def create_usd_scene(assembly: AssemblyModel, output_path: str, file_format: Optional[str] = None) -> str:
     """
     Create a USD scene from the given assembly model.
     
     :param assembly: The AssemblyModel containing cabinets and workbench top
     :param output_path: The path where the USD file will be saved
+    :param file_format: 'usda' or 'usdc', the extension of output_path is replaced to match.
+                        Defaults to the USD_FORMAT environment variable, or 'usda'
+    :return: The path of the written scene
     """
+    output_path = with_usd_format(output_path, file_format)
+
     # Create a new USD stage
     stage = Usd.Stage.CreateNew(output_path)
 
@@ -46,6 +52,7 @@ def create_usd_scene(assembly: AssemblyModel, output_path: str) -> None:
 
     # Save the stage
     stage.GetRootLayer().Save()
+    return output_path
 
 def import_asset(stage: Usd.Stage, prim_path: str, asset_path: str) -> None:
     """
@@ -146,14 +153,20 @@ def sequence_cabinets(stage: Usd.Stage, sub_layer: Sdf.Layer, assembly: Assembly
     total_width = current_x + previous_half_width
     return total_width
 
-def apply_transformation(input_path: str, output_path: str, assembly: AssemblyModel) -> None:
+def apply_transformation(input_path: str, output_path: str, assembly: AssemblyModel,
+                         file_format: Optional[str] = None) -> str:
     """
     Apply transformations to place cabinets next to each other and position the workbench top.
     
     :param input_path: Path to the input USD file
     :param output_path: Path where the transformed USD file will be saved
     :param assembly: The AssemblyModel containing metadata for the entire assembly
+    :param file_format: 'usda' or 'usdc' for the transformation sublayer, the extension of output_path is
+                        replaced to match. Defaults to the USD_FORMAT environment variable, or 'usda'
+    :return: The path of the written sublayer
     """
+    output_path = with_usd_format(output_path, file_format)
+
     # Open the input stage
     stage = Usd.Stage.Open(input_path)
     
@@ -198,6 +211,7 @@ def apply_transformation(input_path: str, output_path: str, assembly: AssemblyMo
 
     # Save the stage
     stage.Save()
+    return output_path
 
 
 # Example usage
@@ -216,10 +230,10 @@ if __name__ == "__main__":
         initial_scene_path = "assets/final_workbench_assembly.usda"
         transformed_scene_path = "assets/workbench_transformations.usda"
         
-        create_usd_scene(assembly, initial_scene_path)
+        initial_scene_path = create_usd_scene(assembly, initial_scene_path)
         print(f"Initial USD scene created successfully at {initial_scene_path}")
         
-        apply_transformation(initial_scene_path, transformed_scene_path, assembly)
+        transformed_scene_path = apply_transformation(initial_scene_path, transformed_scene_path, assembly)
         print(f"Transformed USD scene created successfully as a sublayer at {transformed_scene_path}")
     except Exception as e:
         print(f"Error creating or transforming USD scene: {str(e)}")
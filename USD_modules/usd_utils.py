@@ -1,9 +1,138 @@
 "Utilities for loading/transforming/manipulating usd files"
 
+# pxr is imported inside the functions that compose stages: extents of generated components and extract_filepaths
+# are served without it, and it is the most expensive import of the layout path.
 import os
-from pxr import Usd, UsdGeom
 
-def merge_usda_files(output_file, top_file, input_files, panel_file, quantity, layers, spacing=0.0):
+from USD_modules.component_cache import get_component
+from USD_modules.component_reader import SIZE_VARIANT_SET
+from USD_modules.usd_format import with_usd_format
+
+def _first_boundable(stage, root_path=None):
+    """Return the first boundable prim of a stage, or below root_path when given."""
+    from pxr import Usd, UsdGeom
+
+    if root_path:
+        root_prim = stage.GetPrimAtPath(root_path)
+        if not root_prim:
+            return None
+        prims = Usd.PrimRange(root_prim)
+    else:
+        prims = stage.Traverse()
+
+    for prim in prims:
+        if prim.IsA(UsdGeom.Boundable):
+            return prim
+    return None
+
+
+def add_family_reference(prim, family_file, variant, variant_set=SIZE_VARIANT_SET):
+    """Reference a product family asset and select one of its size variants on the referencing prim."""
+    prim.GetReferences().AddReference(family_file)
+    prim.GetVariantSets().GetVariantSet(variant_set).SetVariantSelection(variant)
+
+
+def _component_exists(component, catalog_stage):
+    if isinstance(component, tuple):
+        return os.path.exists(component[0])
+    if catalog_stage is not None:
+        return bool(catalog_stage.GetPrimAtPath(f"/{component}"))
+    return os.path.exists(component)
+
+
+def _add_component_reference(prim, component, catalog_file):
+    if isinstance(component, tuple):
+        add_family_reference(prim, *component)
+    elif catalog_file:
+        prim.GetReferences().AddReference(catalog_file, f"/{component}")
+    else:
+        prim.GetReferences().AddReference(component)
+
+
+def _open_component(component, catalog_stage):
+    """
+    Open the stage holding a component.
+
+    Returns:
+        tuple: (stage, root prim path). The root path is None for a standalone component file.
+    """
+    from pxr import Usd
+
+    if isinstance(component, tuple):
+        # Select the variant in the session layer so the shared family layer is left untouched
+        family_file, variant = component
+        family_stage = Usd.Stage.Open(family_file)
+        root_prim = family_stage.GetDefaultPrim()
+        with Usd.EditContext(family_stage, family_stage.GetSessionLayer()):
+            root_prim.GetVariantSets().GetVariantSet(SIZE_VARIANT_SET).SetVariantSelection(variant)
+        return family_stage, root_prim.GetPath()
+    if catalog_stage is not None:
+        return catalog_stage, f"/{component}"
+    return Usd.Stage.Open(component), None
+
+
+def _cached_component(component, catalog_file):
+    if isinstance(component, tuple):
+        return get_component(component[0], variant=component[1])
+    if catalog_file:
+        return get_component(catalog_file, prim_path=f"/{component}")
+    return get_component(component)
+
+
+class BoundsService:
+    """
+    Extents of the components referenced by one scene, each measured once and then served from memory.
+
+    Generated components come from the process-wide component cache (see component_cache), so their extents are
+    parsed once per process. Other components are measured by their first boundable prim once per service.
+    """
+
+    def __init__(self, catalog_file=None, catalog_stage=None):
+        self.catalog_file = catalog_file
+        self.catalog_stage = catalog_stage
+        self._extents = {}
+
+    def extent(self, component, first_boundable=False):
+        """
+        Return the extent of a component's geometry prim, or None if no geometry was found.
+
+        With first_boundable, components without a geometry prim are measured by their first boundable prim.
+        """
+        key = (component, first_boundable)
+        if key not in self._extents:
+            self._extents[key] = self._measure(component, first_boundable)
+        return self._extents[key]
+
+    def _measure(self, component, first_boundable):
+        try:
+            extent = _cached_component(component, self.catalog_file)['extent']
+        except ValueError:
+            extent = None
+        if extent is not None or not first_boundable:
+            return extent
+
+        from pxr import Usd, UsdGeom
+
+        if self.catalog_file and self.catalog_stage is None:
+            self.catalog_stage = Usd.Stage.Open(self.catalog_file)
+        # Keep the stage alive while its prims are in use
+        referenced_stage, root_path = _open_component(component, self.catalog_stage)
+        geometry_prim = _first_boundable(referenced_stage, root_path)
+        if not geometry_prim:
+            return None
+        return UsdGeom.Boundable(geometry_prim).GetExtentAttr().Get()
+
+
+def _component_name(component, catalog_stage):
+    if isinstance(component, tuple):
+        return component[1]
+    if catalog_stage is not None:
+        return component
+    return os.path.splitext(os.path.basename(component))[0]
+
+
+def merge_usda_files(output_file, top_file, input_files, panel_file, quantity, layers, spacing=0.0, catalog_file=None,
+                     file_format=None, bounds=None):
     """
     Merges multiple USDA files into a new USD scene, positioning them side by side.
 
@@ -11,10 +140,22 @@ def merge_usda_files(output_file, top_file, input_files, panel_file, quantity, l
         output_file (str): Path to the output USDA file.
         input_files (list of str): List of input USDA file paths.
         spacing (float): Spacing between models in the scene.
+        catalog_file (str): Optional single-layer catalog. When given, top_file, input_files and panel_file are
+            component names (prims /<name> of the catalog) rather than file paths, and the catalog is opened once.
+        Any of top_file, input_files and panel_file may also be a (family_file, variant) tuple, which references
+            a product family asset and selects the SKU's 'size' variant.
+        file_format (str): 'usda' or 'usdc'. The extension of output_file is replaced to match. Defaults to
+            the USD_FORMAT environment variable, or 'usda'.
+        bounds (BoundsService): Optional bounds service, created for the same catalog_file, to share measured
+            extents across calls. By default each call measures every referenced component once.
 
     Returns:
-        None
+        str: Path of the written scene, or None if it could not be created.
     """
+    from pxr import Usd, UsdGeom
+
+    output_file = with_usd_format(output_file, file_format)
+
     # Initialize a new USD stage
     try:
         stage = Usd.Stage.CreateNew(output_file)
@@ -22,36 +163,42 @@ def merge_usda_files(output_file, top_file, input_files, panel_file, quantity, l
         print(f"Error creating output file {output_file}: {e}")
         return
 
+    catalog_stage = None
+    if catalog_file:
+        catalog_stage = Usd.Stage.Open(catalog_file)
+        if not catalog_stage:
+            print(f"Error opening catalog {catalog_file}.")
+            return
+
+    if bounds is None:
+        bounds = BoundsService(catalog_file, catalog_stage)
+
     current_x_translation = - spacing
     prev_length = 0.0
     max_height = 0.0
     max_width = 0.0
 
     for index, file_path in enumerate(input_files):
-        if not os.path.exists(file_path):
+        if not _component_exists(file_path, catalog_stage):
             print(f"Warning: Input file {file_path} does not exist. Skipping.")
             continue
 
-        model_name = os.path.splitext(os.path.basename(file_path))[0]
         prim_path = f"/Model_{index}"
 
         # Add reference to the stage
         try:
             model_prim = stage.DefinePrim(prim_path)
             UsdGeom.SetStageUpAxis(stage, "Z")
-            model_prim.GetReferences().AddReference(file_path)
+            _add_component_reference(model_prim, file_path, catalog_file)
         except Exception as e:
             print(f"Error adding reference to {file_path}: {e}")
             continue
 
         # Compute translation based on bounding box size
         try:
-            referenced_stage = Usd.Stage.Open(file_path)
-            model_geometry_prim = referenced_stage.GetPrimAtPath(f'/{model_name}/geometry')
+            extent = bounds.extent(file_path)
 
-            if model_geometry_prim:
-                boundable = UsdGeom.Boundable(model_geometry_prim)
-                extent = boundable.GetExtentAttr().Get()
+            if extent is not None:
                 model_length = extent[1][0] - extent[0][0]  # Bounding box length
                 model_width = extent[1][1] - extent[0][1]
                 model_height =extent[1][2] - extent[0][2]
@@ -78,23 +225,15 @@ def merge_usda_files(output_file, top_file, input_files, panel_file, quantity, l
 
     total_length = current_x_translation + model_length
     try:
-        if os.path.exists(top_file):
+        if _component_exists(top_file, catalog_stage):
             top_prim_path = "/TopModel"
             top_prim = stage.DefinePrim(top_prim_path)
-            top_prim.GetReferences().AddReference(top_file)
+            _add_component_reference(top_prim, top_file, catalog_file)
 
             # Scale the top model to match the total length
-            top_referenced_stage = Usd.Stage.Open(top_file)
-            top_geometry_prim = None
-
-            for prim in top_referenced_stage.Traverse():
-                if prim.IsA(UsdGeom.Boundable):
-                    top_geometry_prim = prim
-                    break
+            top_extent = bounds.extent(top_file, first_boundable=True)
 
-            if top_geometry_prim:
-                top_boundable = UsdGeom.Boundable(top_geometry_prim)
-                top_extent = top_boundable.GetExtentAttr().Get()
+            if top_extent is not None:
                 top_length = top_extent[1][0] - top_extent[0][0]
                 top_width =top_extent[1][1] - top_extent[0][1]
                 top_height =top_extent[1][2] - top_extent[0][2]
@@ -121,20 +260,12 @@ def merge_usda_files(output_file, top_file, input_files, panel_file, quantity, l
                     try:
                         # Add panel reference
                         panel_prim = stage.DefinePrim(prim_path)
-                        panel_prim.GetReferences().AddReference(panel_file)
+                        _add_component_reference(panel_prim, panel_file, catalog_file)
                         
-                        # Get panel dimensions
-                        referenced_stage = Usd.Stage.Open(panel_file)
-                        panel_geom = None
+                        # Get panel dimensions from the first boundable geometry, measured once for all panels
+                        panel_extent = bounds.extent(panel_file, first_boundable=True)
                         
-                        # Find the first boundable geometry
-                        for prim in referenced_stage.Traverse():
-                            if prim.IsA(UsdGeom.Boundable):
-                                panel_geom = UsdGeom.Boundable(prim)
-                                break
-                        
-                        if panel_geom:
-                            panel_extent = panel_geom.GetExtentAttr().Get()
+                        if panel_extent is not None:
                             panel_length = panel_extent[1][0] - panel_extent[0][0]
                             panel_width = panel_extent[1][1] - panel_extent[0][1]
                             panel_height =panel_extent[1][2] - panel_extent[0][2]
@@ -164,6 +295,8 @@ def merge_usda_files(output_file, top_file, input_files, panel_file, quantity, l
     except Exception as e:
         print(f"Error adding top file {top_file} to the scene: {e}")
 
+    return output_file
+
 
 def extract_filepaths(json_data):
     filepaths = []
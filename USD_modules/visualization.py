@@ -7,15 +7,24 @@ import os
 from string import Template
 import subprocess
 
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 from uuid import uuid4
 
-from IPython.display import DisplayHandle, display, HTML
 from pxr import Gf, Usd, UsdGeom, UsdLux, Vt
 
+if TYPE_CHECKING:
+    from IPython.display import DisplayHandle
+
 log = logging.getLogger(__name__)
 
 
+def _display_html(html: str) -> "DisplayHandle":
+    """Display an HTML snippet in the notebook. IPython is only imported once something is displayed."""
+    from IPython.display import display, HTML
+
+    return display(HTML(html))
+
+
 def _get_highlightjs_imports() -> str:
     """
     Return the list of imports required for HighlightJS syntax highlighting features.
@@ -112,7 +121,7 @@ def _render_html_code_visualizer(
     )
     return templated_code_output_html
 
-def DisplayCode(usd_filename: str, max_height: Optional[int] = None) -> DisplayHandle:
+def DisplayCode(usd_filename: str, max_height: Optional[int] = None) -> "DisplayHandle":
     """
     Present a syntax-highlighted code representation in the Jupyter Notebook of the given USD file located in the
     `./content` folder.
@@ -200,7 +209,7 @@ ${highlightjs_imports}
             full_width=True,
         ),
     )
-    return display(HTML(templated_html))
+    return _display_html(templated_html)
 
 def FlattenFile(input_file_path: str, show_usd_lights: bool = False) -> str:
     """
@@ -254,7 +263,7 @@ def DisplaySingleUSD(
     disable_scrollwheel_zoom: bool = True,
     show_usd_code: bool = False,
     show_usd_lights: bool = False,
-) -> DisplayHandle:
+) -> "DisplayHandle":
     """
     Present an interactive 3D visualization in the Jupyter Notebook of the given USD file located in the `./content` folder.
 
@@ -481,7 +490,7 @@ ${highlightjs_imports}
         highlightjs_imports=highlightjs_imports,
         templated_code_output_html=_render_html_code_visualizer(usd_filename=usd_filename, viewer_id=unique_viewer_id) if show_usd_code else "",
     )
-    return display(HTML(templated_html))
+    return _display_html(templated_html)
 
 
 def DisplayUSD(
@@ -491,7 +500,7 @@ def DisplayUSD(
     disable_scrollwheel_zoom: bool = False,
     show_usd_code: bool = False,
     show_usd_lights: bool = True,
-) -> DisplayHandle:
+) -> "DisplayHandle":
     """
     Present an interactive 3D visualization in the Jupyter Notebook of the given USD files located in the `./content` folder.
 
@@ -644,7 +653,7 @@ def DisplayUSD(
         viewer_width=width if isinstance(width, str) else f"{width}px",
         viewer_height=height,
     )
-    return display(HTML(templated_html))
+    return _display_html(templated_html)
 
 
 def _set_mesh_normals_interpolation(prim: Usd.Prim, interpolation: str = UsdGeom.Tokens.faceVarying) -> bool:
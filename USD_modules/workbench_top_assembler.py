@@ -15,12 +15,6 @@ can be defined for assembly.
 
 from pxr import Usd, UsdGeom, Sdf, Gf
 
-# Create a new USD stage
-stage = Usd.Stage.CreateNew('assets/cleaned_workbench_assembly.usda')
-
-# Define a root Xform for the assembly
-rootXform = UsdGeom.Xform.Define(stage, '/WorkbenchAssembly')
-
 # Function to load and apply transformations
 def add_component_to_stage(stage, prim_path, reference_path, position, rotation, scale):
     prim = UsdGeom.Xform.Define(stage, prim_path)
@@ -40,32 +34,40 @@ def add_component_to_stage(stage, prim_path, reference_path, position, rotation,
     # Reference the asset
     prim.GetPrim().GetReferences().AddReference(reference_path)
 
-# Add components to the USD file with proper transformations
-# Replace with correct paths and transformation data
+def create_workbench_assembly(output_file, components):
+    """Write a stage referencing each component under /WorkbenchAssembly with its transformations."""
+    # Create a new USD stage
+    stage = Usd.Stage.CreateNew(output_file)
 
-# Example data (replace these with actual data for each component)
-components = [
-    {
-        "name": "workbench_top",
-        "asset_path": "components/workbench_top_1.usda",
-        "translation": Gf.Vec3d(0, 0.850, 0),
-        "rotation": Gf.Vec3d(-90, 0, 0),  # Rotate -90 degrees around X axis
-        "scale": Gf.Vec3d(1.5, 0.725, 1.0)
-    }
-    # Add more components as needed
-    
-    
-]
+    # Define a root Xform for the assembly
+    UsdGeom.Xform.Define(stage, '/WorkbenchAssembly')
+
+    # Add components to the USD file with proper transformations
+    for component in components:
+        add_component_to_stage(
+            stage,
+            '/WorkbenchAssembly',
+            component['asset_path'],
+            component['translation'],
+            component['rotation'],
+            component['scale']
+        )
+
+    # Save the stage
+    stage.GetRootLayer().Save()
+    return stage
 
-for component in components:
-    add_component_to_stage(
-        stage,
-        '/WorkbenchAssembly',
-        component['asset_path'],
-        component['translation'],
-        component['rotation'],
-        component['scale']
-    )
 
-# Save the stage
-stage.GetRootLayer().Save()
+if __name__ == "__main__":
+    # Example data (replace these with actual data for each component)
+    components = [
+        {
+            "name": "workbench_top",
+            "asset_path": "components/workbench_top_1.usda",
+            "translation": Gf.Vec3d(0, 0.850, 0),
+            "rotation": Gf.Vec3d(-90, 0, 0),  # Rotate -90 degrees around X axis
+            "scale": Gf.Vec3d(1.5, 0.725, 1.0)
+        }
+        # Add more components as needed
+    ]
+    create_workbench_assembly('assets/cleaned_workbench_assembly.usda', components)
@@ -10,26 +10,18 @@ The module serves as a bridge between USD asset files and the application's inte
 making it easier to work with workbench top components in a standardized way.
 """
 
-from models import WorkbenchTopModel
-from pxr import Usd, UsdGeom
+from USD_modules.models import WorkbenchTopModel
+from USD_modules.component_cache import get_component
+from USD_modules.component_reader import batch_extract
+from typing import List, Optional, Tuple, Union
 import os
 
-def extract_workbench_top_properties(file_path: str) -> WorkbenchTopModel:
-    stage = Usd.Stage.Open(file_path)
-    if not stage:
-        raise ValueError(f"Failed to open USD stage for {file_path}")
-
-    root_prim = stage.GetDefaultPrim()
-    if not root_prim:
-        raise ValueError(f"No default prim found in {file_path}")
-
-    # Find the geometry prim
-    geometry_prim = root_prim.GetChild("geometry")
-    if not geometry_prim:
-        raise ValueError(f"No geometry prim found in {file_path}")
+def extract_workbench_top_properties(file_path: str, prim_path: Optional[str] = None) -> WorkbenchTopModel:
+    # Parsed once per process: from the metadata sidecar, the layer, or a composed stage as a last resort
+    component = get_component(file_path, prim_path)
 
     # Extract custom attributes
-    custom_data = geometry_prim.GetCustomData()
+    custom_data = component['custom_data']
     function = custom_data.get("function", "Unknown")
     type_ = custom_data.get("type", "Unknown")
     material = custom_data.get("material", "Unknown")
@@ -40,11 +32,10 @@ def extract_workbench_top_properties(file_path: str) -> WorkbenchTopModel:
     height = custom_data.get("height", 0) / 1000  # Convert mm to meters
     
     # Extract color
-    display_color_attr = geometry_prim.GetAttribute("primvars:displayColor")
-    color = tuple(display_color_attr.Get()[0]) if display_color_attr else (0.5, 0.5, 0.5)
+    color = tuple(component['color'] or (0.5, 0.5, 0.5))
 
     return WorkbenchTopModel(
-        name=os.path.splitext(os.path.basename(file_path))[0],
+        name=component['name'] if prim_path else os.path.splitext(os.path.basename(file_path))[0],
         asset_path=file_path,
         dimensions=(width, depth, height),
         function=function,
@@ -53,6 +44,17 @@ def extract_workbench_top_properties(file_path: str) -> WorkbenchTopModel:
         material=material
     )
 
+def extract_workbench_top_properties_batch(
+    workbench_top_paths: List[Union[str, Tuple[str, str]]], max_workers: Optional[int] = None
+) -> Tuple[List[WorkbenchTopModel], List[Tuple[Union[str, Tuple[str, str]], str]]]:
+    """
+    Extract many workbench tops concurrently on a thread pool.
+
+    workbench_top_paths holds file paths, or (catalog_file, prim_path) tuples. Returns the WorkbenchTopModels of
+    the files that could be read, in input order, and a list of (path, error message) for the others.
+    """
+    return batch_extract(workbench_top_paths, extract_workbench_top_properties, max_workers=max_workers)
+
 def create_workbench_top(workbench_top_path: str) -> WorkbenchTopModel:
     try:
         workbench_top = extract_workbench_top_properties(workbench_top_path)
@@ -0,0 +1,91 @@
+"""
+Local SQLite catalog of every SKU, for exact attribute and dimension-range queries.
+
+Built from the Lista CSV through catalog_ingest (malformed rows are reported and left out), with indexes on
+type, material, color and each dimension so queries such as "type = X and width between a and b" are answered
+from the indexes without scanning. The LLM chain queries it through LLM_chain/LLM_chain/catalog_query.py.
+
+Usage (from the repository root):
+    python asset_generator/catalog_db.py                              # the Lista catalog
+    python asset_generator/catalog_db.py asset_generator/synthetic/synthetic_100000.csv --db /tmp/skus.sqlite
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+
+from catalog_ingest import load_catalog, report_errors
+
+DEFAULT_CATALOG_DB = os.path.join("assets", "sku_catalog.sqlite")
+
+TABLE_SCHEMA = """
+CREATE TABLE skus (
+    name TEXT PRIMARY KEY,
+    type TEXT NOT NULL COLLATE NOCASE,
+    function TEXT,
+    width INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    color TEXT COLLATE NOCASE,
+    color_attribute TEXT COLLATE NOCASE,
+    material TEXT COLLATE NOCASE
+)
+"""
+
+INDEXES = """
+-- type leads a composite index so the common "type and width range" query is a single index range scan
+CREATE INDEX skus_type_width ON skus (type, width);
+CREATE INDEX skus_material ON skus (material);
+CREATE INDEX skus_color ON skus (color);
+CREATE INDEX skus_width ON skus (width);
+CREATE INDEX skus_depth ON skus (depth);
+CREATE INDEX skus_height ON skus (height);
+"""
+
+
+def build_catalog_db(csv_path, db_path=DEFAULT_CATALOG_DB):
+    """
+    (Re)build the SQLite catalog from a catalog CSV.
+
+    Returns:
+        int: Number of SKUs written.
+    """
+    table, invalid = load_catalog(csv_path)
+    report_errors(invalid)
+
+    columns = table[['Name', 'Type', 'Function', 'width_mm', 'depth_mm', 'height_mm', 'Color (Object)',
+                     'Color (Attribute)', 'Material']]
+    rows = [(name, item_type, function, int(width), int(depth), int(height), color, color_attribute, material)
+            for name, item_type, function, width, depth, height, color, color_attribute, material
+            in columns.itertuples(index=False)]
+
+    # Build into a temporary file and swap it in, so readers never see a half-written catalog
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        # Loading before indexing is much faster than maintaining the indexes row by row
+        connection.execute(TABLE_SCHEMA)
+        with connection:
+            connection.executemany("INSERT INTO skus VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        connection.executescript(INDEXES)
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, db_path)
+    return len(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the SQLite SKU catalog from a catalog CSV.")
+    parser.add_argument('csv_file', nargs='?', default='asset_generator/Lista Products - Enumerated.csv')
+    parser.add_argument('--db', default=DEFAULT_CATALOG_DB, help="Path of the SQLite catalog to write")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = build_catalog_db(args.csv_file, args.db)
+    print(f"SKU catalog written: {args.db} ({count} SKUs in {time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,101 @@
+"""
+Columnar ingestion of the Lista catalog CSV.
+
+Loads the whole catalog once with pandas, validates it, and precomputes everything the authoring step needs
+(integer millimeter dimensions, meter dimensions, half extents and RGB display colors) as vectorized column
+operations. Malformed rows are collected and reported together instead of failing one by one mid-run.
+"""
+
+import pandas as pd
+
+CSV_COLUMNS = ['Name', 'Type', 'Function', 'Width', 'Depth', 'Height', 'Color (Object)', 'Color (Attribute)',
+               'Material']
+DIMENSION_COLUMNS = ['Width', 'Depth', 'Height']
+
+COLOR_MAP = {
+    'grey': (0.5, 0.5, 0.5),
+    'black': (0.0, 0.0, 0.0),
+    'blue': (0.0, 0.0, 1.0),
+    'yellow': (1.0, 1.0, 0.0),
+    'white': (1.0, 1.0, 1.0)
+}
+DEFAULT_COLOR = (0.5, 0.5, 0.5)
+
+
+def ingest_table(raw):
+    """
+    Validate a table of raw CSV rows and add the precomputed authoring columns.
+
+    Args:
+        raw (pd.DataFrame): String columns as read from the CSV (see CSV_COLUMNS).
+
+    Returns:
+        tuple: (table, errors). table holds the valid rows with the raw columns plus width_mm, depth_mm,
+            height_mm (int), width_m, depth_m, height_m, half_width, half_depth, half_height (float) and
+            color_r, color_g, color_b. errors is a list of {'record', 'name', 'reason'} dicts, where record is
+            the 1-based data record number in the CSV.
+    """
+    missing = [column for column in CSV_COLUMNS if column not in raw.columns]
+    if missing:
+        raise ValueError(f"Catalog is missing required columns: {missing}")
+
+    raw = raw[CSV_COLUMNS].fillna('').astype(str).reset_index(drop=True)
+    names = raw['Name'].str.strip()
+    dimensions = raw[DIMENSION_COLUMNS].apply(lambda column: pd.to_numeric(column.str.strip(), errors='coerce'))
+
+    checks = {
+        "missing name": names.eq(''),
+        "duplicate name": names.ne('') & names.duplicated(keep='first'),
+        "missing type": raw['Type'].str.strip().eq(''),
+        "non-numeric dimension": dimensions.isna().any(axis=1),
+        "non-positive dimension": (dimensions <= 0).any(axis=1),
+        "fractional millimeters": (dimensions.notna() & (dimensions % 1 != 0)).any(axis=1),
+    }
+    failed_checks = pd.DataFrame(checks)
+    invalid = failed_checks.any(axis=1)
+    errors = [
+        {'record': index + 1, 'name': raw.at[index, 'Name'],
+         'reason': "; ".join(failed_checks.columns[failed_checks.loc[index]])}
+        for index in raw.index[invalid]
+    ]
+
+    table = raw[~invalid].copy()
+    millimeters = dimensions[~invalid].astype('int64')
+    table['width_mm'], table['depth_mm'], table['height_mm'] = (
+        millimeters['Width'], millimeters['Depth'], millimeters['Height'])
+
+    meters = millimeters / 1000
+    table['width_m'], table['depth_m'], table['height_m'] = meters['Width'], meters['Depth'], meters['Height']
+    table['half_width'], table['half_depth'], table['half_height'] = (
+        table['width_m'] / 2, table['depth_m'] / 2, table['height_m'] / 2)
+
+    palette = pd.DataFrame.from_dict(COLOR_MAP, orient='index', columns=['color_r', 'color_g', 'color_b'])
+    colors = palette.reindex(table['Color (Object)'].str.lower().str.strip())
+    colors = colors.fillna(dict(zip(palette.columns, DEFAULT_COLOR)))
+    table['color_r'], table['color_g'], table['color_b'] = (
+        colors['color_r'].to_numpy(), colors['color_g'].to_numpy(), colors['color_b'].to_numpy())
+
+    return table, errors
+
+
+def load_catalog(csv_path):
+    """Read the catalog CSV in one pass and ingest it, see ingest_table."""
+    # Read through a text-mode handle so line endings inside quoted cells are normalized like csv.DictReader does
+    with open(csv_path, 'r') as csvfile:
+        raw = pd.read_csv(csvfile, dtype=str, keep_default_na=False)
+    return ingest_table(raw)
+
+
+def ingest_rows(rows):
+    """Ingest a list of csv.DictReader-style rows, see ingest_table."""
+    return ingest_table(pd.DataFrame(list(rows), columns=CSV_COLUMNS))
+
+
+def raw_row(record):
+    """The original CSV columns of an ingested record, as used for content hashing."""
+    return {column: record[column] for column in CSV_COLUMNS}
+
+
+def report_errors(errors):
+    for error in errors:
+        print(f"Invalid catalog record {error['record']} ({error['name'] or 'unnamed'}): {error['reason']}")
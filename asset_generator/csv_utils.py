@@ -1,7 +1,44 @@
 import csv
+import json
+import os
+import re
 
-def process_csv(input_file, output_file):
+# Columns that identify a SKU. Editing anything else (e.g. the function text) keeps the row's name.
+IDENTITY_COLUMNS = ['Type', 'Width', 'Depth', 'Height', 'Color (Object)', 'Color (Attribute)', 'Material']
+
+def type_slug(item_type):
+    # Lower-case and keep to characters that are valid in USD prim names ("Heavy-duty" -> "heavy_duty")
+    return re.sub(r'[^0-9a-z]+', '_', item_type.lower()).strip('_')
+
+def load_id_map(id_map_file):
+    if id_map_file and os.path.exists(id_map_file):
+        with open(id_map_file, 'r') as f:
+            return json.load(f)
+    return {"names": {}, "counters": {}}
+
+def save_id_map(id_map_file, id_map):
+    tmp_file = id_map_file + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(id_map, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, id_map_file)
+
+def row_identity(header, row, occurrence):
+    """Identity of a row: its SKU-defining columns, plus the occurrence number for identical rows."""
+    values = {column: row[header.index(column)].strip() if column in header else '' for column in IDENTITY_COLUMNS}
+    return json.dumps([values[column] for column in IDENTITY_COLUMNS] + [occurrence])
+
+def process_csv(input_file, output_file, id_map_file=None):
+    """
+    Assign a Name to every row of the Lista list.
+
+    Without id_map_file, names come from a running per-type counter (drawer_cabinet_1, drawer_cabinet_2, ...),
+    so inserting a row renumbers everything after it. With id_map_file, the mapping from row identity
+    (see IDENTITY_COLUMNS) to name is persisted: known rows keep their name across catalog edits, new rows get
+    the next unused number of their type, and names of removed rows are never reused.
+    """
     type_counters = {}
+    id_map = load_id_map(id_map_file) if id_map_file else None
+    occurrences = {}
     
     with open(input_file, 'r', newline='') as infile, open(output_file, 'w', newline='') as outfile:
         reader = csv.reader(infile)
@@ -14,15 +51,30 @@ def process_csv(input_file, output_file):
         
         for row in reader:
             if row and len(row) > 1:
-                item_type = row[1].lower().replace(' ', '_')
-                type_counters[item_type] = type_counters.get(item_type, 0) + 1
-                new_name = f"{item_type}_{type_counters[item_type]}"
+                item_type = type_slug(row[1])
+
+                if id_map is None:
+                    type_counters[item_type] = type_counters.get(item_type, 0) + 1
+                    new_name = f"{item_type}_{type_counters[item_type]}"
+                else:
+                    base_identity = row_identity(new_header, row, 0)
+                    occurrences[base_identity] = occurrences.get(base_identity, 0) + 1
+                    identity = row_identity(new_header, row, occurrences[base_identity])
+                    new_name = id_map["names"].get(identity)
+                    if new_name is None:
+                        id_map["counters"][item_type] = id_map["counters"].get(item_type, 0) + 1
+                        new_name = f"{item_type}_{id_map['counters'][item_type]}"
+                        id_map["names"][identity] = new_name
                 
                 new_row = [new_name] + row[1:]
                 writer.writerow(new_row)
 
-# Usage
-input_file = 'Lista Products - LIST.csv'
-output_file = 'Lista Products - Enumerated.csv'
-process_csv(input_file, output_file)
+    if id_map is not None:
+        save_id_map(id_map_file, id_map)
 
+# Usage
+if __name__ == "__main__":
+    input_file = 'Lista Products - LIST.csv'
+    output_file = 'Lista Products - Enumerated.csv'
+    id_map_file = 'Lista Products - IDs.json'
+    process_csv(input_file, output_file, id_map_file=id_map_file)
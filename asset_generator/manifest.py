@@ -0,0 +1,98 @@
+"""
+Content-hash manifest for incremental asset generation.
+
+The manifest records, for every generated asset, the hash of the CSV row it was authored from and
+the file it was written to. Comparing a fresh CSV against it yields the delta (added / changed /
+removed / unchanged rows), so the generator only re-authors what changed and downstream stages
+(indexing, bounds caches) can update incrementally from the recorded delta.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+MANIFEST_VERSION = 1
+
+
+def row_hash(row, salt=""):
+    """Stable hash of a CSV row. `salt` lets callers fold generator settings into the hash."""
+    payload = json.dumps(row, sort_keys=True, ensure_ascii=False) + salt
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(manifest_path):
+    if not manifest_path or not os.path.exists(manifest_path):
+        return {"version": MANIFEST_VERSION, "assets": {}}
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        # Unknown layout, treat everything as new
+        return {"version": MANIFEST_VERSION, "assets": {}}
+    return manifest
+
+
+def save_manifest(manifest_path, manifest):
+    os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def compute_delta(manifest, rows, salt=""):
+    """
+    Compare CSV rows against a manifest.
+
+    Args:
+        manifest (dict): Manifest as returned by load_manifest.
+        rows (list of dict): CSV rows, each with a 'Name' column.
+        salt (str): Generator settings folded into each row hash.
+
+    Returns:
+        tuple: (delta, hashes) where delta maps 'added', 'changed', 'removed' and 'unchanged' to lists of
+            asset names and hashes maps every current name to its row hash.
+    """
+    assets = manifest.get("assets", {})
+    delta = {"added": [], "changed": [], "removed": [], "unchanged": []}
+    hashes = {}
+
+    for row in rows:
+        name = row["Name"]
+        hashes[name] = row_hash(row, salt)
+        entry = assets.get(name)
+        if entry is None:
+            delta["added"].append(name)
+        elif entry["hash"] != hashes[name] or not os.path.exists(entry["output"]):
+            delta["changed"].append(name)
+        else:
+            delta["unchanged"].append(name)
+
+    delta["removed"] = sorted(name for name in assets if name not in hashes)
+    return delta, hashes
+
+
+def update_manifest(manifest, delta, hashes, outputs, failed=()):
+    """
+    Fold the result of a generation run into the manifest.
+
+    Successfully authored rows get their new hash and output recorded, rows that failed are dropped so
+    the next run retries them, and removed rows are forgotten. The delta is stored under 'last_run'.
+    """
+    assets = manifest.setdefault("assets", {})
+    failed = set(failed)
+
+    for name in delta["added"] + delta["changed"]:
+        if name in failed:
+            assets.pop(name, None)
+        else:
+            assets[name] = {"hash": hashes[name], "output": outputs[name]}
+    for name in delta["removed"]:
+        assets.pop(name, None)
+
+    manifest["last_run"] = {
+        "timestamp": datetime.now().isoformat(),
+        "delta": {key: sorted(names) for key, names in delta.items()},
+        "failed": sorted(failed),
+    }
+    return manifest
@@ -0,0 +1,104 @@
+"""
+Metadata sidecar index written next to the generated assets.
+
+A single SQLite file (`components.sqlite` in the output directory) holds, for every generated component, the
+metadata consumers otherwise read from USD: name, type, function, dimensions, colors, material, the scale and
+extent exactly as authored (float32), and where the component lives (file, prim path, variant). The file's
+mtime and size at generation time are recorded so readers can detect a stale entry and fall back to the USD
+file. See USD_modules/component_index.py for the reader.
+"""
+
+import os
+import sqlite3
+import struct
+
+SIDECAR_NAME = "components.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS components (
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    function TEXT,
+    width INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    color_r REAL, color_g REAL, color_b REAL,
+    color_attribute TEXT,
+    material TEXT,
+    scale_x REAL, scale_y REAL, scale_z REAL,
+    extent_min_x REAL, extent_min_y REAL, extent_min_z REAL,
+    extent_max_x REAL, extent_max_y REAL, extent_max_z REAL,
+    file_path TEXT NOT NULL,
+    prim_path TEXT NOT NULL,
+    variant TEXT,
+    default_prim INTEGER NOT NULL,
+    file_mtime_ns INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    PRIMARY KEY (name, file_path)
+)
+"""
+
+COLUMNS = ["name", "type", "function", "width", "depth", "height", "color_r", "color_g", "color_b",
+           "color_attribute", "material", "scale_x", "scale_y", "scale_z",
+           "extent_min_x", "extent_min_y", "extent_min_z", "extent_max_x", "extent_max_y", "extent_max_z",
+           "file_path", "prim_path", "variant", "default_prim", "file_mtime_ns", "file_size"]
+
+
+def sidecar_path_for(output_dir):
+    return os.path.join(output_dir, SIDECAR_NAME)
+
+
+def _f32(value):
+    """Round to float32, the precision USD stores scale, extent and color with."""
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+
+def sidecar_row(record, output_path, sidecar_dir, prim_path, variant=None, default_prim=True):
+    """Build the sidecar row of an ingested catalog record (see catalog_ingest.ingest_table)."""
+    stat = os.stat(output_path)
+    return {
+        "name": record['Name'],
+        "type": record['Type'],
+        "function": record['Function'],
+        "width": int(record['width_mm']),
+        "depth": int(record['depth_mm']),
+        "height": int(record['height_mm']),
+        "color_r": _f32(record['color_r']),
+        "color_g": _f32(record['color_g']),
+        "color_b": _f32(record['color_b']),
+        "color_attribute": record['Color (Attribute)'],
+        "material": record['Material'],
+        "scale_x": _f32(record['width_m']),
+        "scale_y": _f32(record['depth_m']),
+        "scale_z": _f32(record['height_m']),
+        "extent_min_x": _f32(-record['half_width']),
+        "extent_min_y": _f32(-record['half_depth']),
+        "extent_min_z": _f32(-record['half_height']),
+        "extent_max_x": _f32(record['half_width']),
+        "extent_max_y": _f32(record['half_depth']),
+        "extent_max_z": _f32(record['half_height']),
+        # Stored relative to the sidecar so the index stays valid wherever the assets directory is opened from
+        "file_path": os.path.relpath(output_path, sidecar_dir),
+        "prim_path": prim_path,
+        "variant": variant,
+        "default_prim": int(default_prim),
+        "file_mtime_ns": stat.st_mtime_ns,
+        "file_size": stat.st_size,
+    }
+
+
+def write_sidecar(db_path, rows):
+    """Replace the sidecar's contents with rows in a single transaction."""
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    try:
+        with connection:
+            connection.execute(SCHEMA)
+            connection.execute("DELETE FROM components")
+            connection.executemany(
+                f"INSERT OR REPLACE INTO components ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+                ([row[column] for column in COLUMNS] for row in rows))
+    finally:
+        connection.close()
+    print(f"Sidecar index written: {db_path}")
@@ -0,0 +1,110 @@
+"""
+Synthetic large-catalog generator for scale testing.
+
+Learns per-type distributions from the real Lista catalog (`Lista Products - Enumerated.csv`) and emits
+synthetic catalogs with the same schema and naming scheme (`<type>_<n>`), so the asset generator, indexer and
+parsers consume them unchanged. For every synthetic row:
+- the type is drawn with the frequency it has in the real catalog
+- width, depth and height are drawn independently from the values observed for that type, which yields
+  realistic but new size combinations
+- object/attribute color (jointly), material and function are drawn from the values observed for that type
+
+Usage (from the repository root):
+    python asset_generator/synthetic_catalog.py                      # 1k, 10k and 100k SKUs
+    python asset_generator/synthetic_catalog.py --sizes 5000 --seed 7
+
+Synthetic SKUs reuse the real naming scheme, so generate their assets into a scratch directory (usd_utlis.py
+--components-dir), never into assets/components.
+"""
+
+import argparse
+import csv
+import os
+import random
+from collections import defaultdict
+
+from csv_utils import type_slug
+
+SOURCE_CSV = os.path.join("asset_generator", "Lista Products - Enumerated.csv")
+OUTPUT_DIR = os.path.join("asset_generator", "synthetic")
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+def load_distributions(source_csv=SOURCE_CSV):
+    """
+    Collect the empirical per-type distributions of the real catalog.
+
+    Returns:
+        tuple: (fieldnames, distributions) where distributions maps each type to lists of observed
+            'Width', 'Depth', 'Height', 'Color', 'Material' and 'Function' values, plus its row 'count'.
+    """
+    distributions = defaultdict(lambda: defaultdict(list))
+    with open(source_csv, 'r') as csvfile:
+        reader = csv.DictReader(csvfile)
+        fieldnames = reader.fieldnames
+        for row in reader:
+            if not row.get('Type') or not all(row.get(column, '').strip().isdigit()
+                                              for column in ('Width', 'Depth', 'Height')):
+                continue
+            observed = distributions[row['Type']]
+            for column in ('Width', 'Depth', 'Height', 'Material', 'Function'):
+                observed[column].append(row[column])
+            observed['Color'].append((row['Color (Object)'], row['Color (Attribute)']))
+
+    for observed in distributions.values():
+        observed['count'] = len(observed['Width'])
+    return fieldnames, distributions
+
+
+def generate_rows(size, distributions, seed=0):
+    """Yield `size` synthetic catalog rows."""
+    rng = random.Random(seed)
+    types = sorted(distributions)
+    weights = [distributions[item_type]['count'] for item_type in types]
+    counters = defaultdict(int)
+
+    for item_type in rng.choices(types, weights=weights, k=size):
+        observed = distributions[item_type]
+        slug = type_slug(item_type)
+        counters[slug] += 1
+        color_object, color_attribute = rng.choice(observed['Color'])
+        yield {
+            'Name': f"{slug}_{counters[slug]}",
+            'Type': item_type,
+            'Function': rng.choice(observed['Function']),
+            'Width': rng.choice(observed['Width']),
+            'Depth': rng.choice(observed['Depth']),
+            'Height': rng.choice(observed['Height']),
+            'Color (Object)': color_object,
+            'Color (Attribute)': color_attribute,
+            'Material': rng.choice(observed['Material']),
+        }
+
+
+def write_synthetic_catalog(output_file, size, source_csv=SOURCE_CSV, seed=0):
+    fieldnames, distributions = load_distributions(source_csv)
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, 'w', newline='') as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(generate_rows(size, distributions, seed=seed))
+    print(f"Synthetic catalog created: {output_file} ({size} SKUs)")
+    return output_file
+
+
+def synthetic_catalog_path(size, output_dir=OUTPUT_DIR):
+    return os.path.join(output_dir, f"synthetic_{size}.csv")
+
+
+# Usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic Lista catalogs for scale testing.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--source', default=SOURCE_CSV)
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        write_synthetic_catalog(synthetic_catalog_path(size, args.output_dir), size, source_csv=args.source,
+                                seed=args.seed)
@@ -1,20 +1,78 @@
 from pxr import Usd, UsdGeom, Sdf, Gf, Kind
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import argparse
 import os
-import csv
+import sys
+import time
 
-def create_usd_from_csv_row(row):
-    # Extract data from the row
-    name = row['Name']
-    file_name = f"{name}.usda"
-    file_path = os.path.join("assets", "components", file_name)
-    
-    # Create a new stage
-    stage = Usd.Stage.CreateNew(file_path)
+# The USD format settings are shared with the layout code in USD_modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from USD_modules.usd_format import USD_FORMATS, resolve_usd_format
+from catalog_ingest import load_catalog, ingest_rows, raw_row, report_errors
+from csv_utils import type_slug
+from manifest import load_manifest, save_manifest, compute_delta, update_manifest
+from sdf_authoring import author_component_spec, author_family_spec
+from sidecar_index import sidecar_path_for, sidecar_row, write_sidecar
+
+COMPONENTS_DIR = os.path.join("assets", "components")
+DEFAULT_MANIFEST = os.path.join(COMPONENTS_DIR, "manifest.json")
+FAMILIES_DIR = os.path.join("assets", "families")
+
+# 'usd' authors through the UsdGeom schema API, 'sdf' writes the same specs directly into the layer
+AUTHORING_BACKENDS = ("usd", "sdf")
+
+def output_path_for(name, file_format=None, components_dir=None):
+    return os.path.join(components_dir or COMPONENTS_DIR, f"{name}.{resolve_usd_format(file_format)}")
+
+def family_path_for(family, file_format=None):
+    return os.path.join(FAMILIES_DIR, f"{family}.{resolve_usd_format(file_format)}")
+
+def create_usd_from_csv_row(row, catalog_stage=None, file_format=None, backend="usd", components_dir=None):
+    """Validate and author a single raw CSV row. Batches should go through load_catalog and create_usd_from_record."""
+    table, errors = ingest_rows([row])
+    if errors:
+        raise ValueError(f"Invalid catalog row {row.get('Name')}: {errors[0]['reason']}")
+    create_usd_from_record(table.to_dict('records')[0], catalog_stage=catalog_stage, file_format=file_format,
+                           backend=backend, components_dir=components_dir)
+
+def _custom_data(record):
+    return {
+        'type': record['Type'],
+        'function': record['Function'],
+        'width': int(record['width_mm']),
+        'depth': int(record['depth_mm']),
+        'height': int(record['height_mm']),
+        'color_attribute': record['Color (Attribute)'],
+        'material': record['Material'],
+    }
+
+def create_usd_from_record(record, catalog_stage=None, file_format=None, backend="usd", components_dir=None):
+    """Author one precomputed catalog record (a row of the table returned by load_catalog)."""
+    if backend == "sdf":
+        return create_layer_from_record(record, catalog_stage=catalog_stage, file_format=file_format,
+                                        components_dir=components_dir)
+    if backend != "usd":
+        raise ValueError(f"Unknown authoring backend '{backend}', expected one of {AUTHORING_BACKENDS}")
+
+    # Extract data from the record
+    name = record['Name']
+
+    if catalog_stage is None:
+        # Create a new stage
+        file_path = output_path_for(name, file_format, components_dir)
+        stage = Usd.Stage.CreateNew(file_path)
+    else:
+        # Author the component as a sibling prim of the shared catalog layer
+        stage = catalog_stage
     
     # Create the main xform
     main_xform = UsdGeom.Xform.Define(stage, f"/{name}")
-    stage.SetDefaultPrim(main_xform.GetPrim())
-    UsdGeom.SetStageUpAxis(stage, "Y")
+    if catalog_stage is None:
+        stage.SetDefaultPrim(main_xform.GetPrim())
+        UsdGeom.SetStageUpAxis(stage, "Y")
 
     # Assign the 'component' kind
     Usd.ModelAPI(main_xform.GetPrim()).SetKind(Kind.Tokens.component)
@@ -23,53 +81,305 @@ def create_usd_from_csv_row(row):
     # Create the geometry
     geometry = UsdGeom.Cube.Define(stage, f"/{name}/geometry")
 
-    # Set dimensions
-    width, depth, height = int(row['Width']) / 1000, int(row['Depth']) / 1000, int(row['Height']) / 1000
-    
-    # Set the scale
-    geometry.AddScaleOp().Set(Gf.Vec3f(width, depth, height))
+    # Set the scale (dimensions in meters)
+    geometry.AddScaleOp().Set(Gf.Vec3f(record['width_m'], record['depth_m'], record['height_m']))
     
     # Set the extent based on the dimensions
-    half_width, half_depth, half_height = width/2, depth/2, height/2
+    half_width, half_depth, half_height = record['half_width'], record['half_depth'], record['half_height']
     min_extent = Gf.Vec3f(-half_width, -half_depth, -half_height)  # Minimum corner
     max_extent = Gf.Vec3f(half_width, half_depth, half_height)     # Maximum corner
     geometry.GetExtentAttr().Set([min_extent, max_extent])
     
     # Set the color (object color)
-    color_map = {
-        'grey': (0.5, 0.5, 0.5),
-        'black': (0.0, 0.0, 0.0),
-        'blue': (0.0, 0.0, 1.0),
-        'yellow': (1.0, 1.0, 0.0),
-        'white': (1.0, 1.0, 1.0)
-    }
-    object_color = color_map.get(row['Color (Object)'].lower(), (0.5, 0.5, 0.5))
-    geometry.GetDisplayColorAttr().Set([Gf.Vec3f(*object_color)])
+    geometry.GetDisplayColorAttr().Set([Gf.Vec3f(record['color_r'], record['color_g'], record['color_b'])])
     
     # Add custom metadata attributes
     prim = geometry.GetPrim()
-    prim.SetCustomDataByKey('type', row['Type'])
-    prim.SetCustomDataByKey('function', row['Function'])
-    prim.SetCustomDataByKey('width', int(row['Width']))
-    prim.SetCustomDataByKey('depth', int(row['Depth']))
-    prim.SetCustomDataByKey('height', int(row['Height']))
-    prim.SetCustomDataByKey('color_attribute', row['Color (Attribute)'])
-    prim.SetCustomDataByKey('material', row['Material'])
-    
+    for key, value in _custom_data(record).items():
+        prim.SetCustomDataByKey(key, value)
+
+    if catalog_stage is not None:
+        # The catalog is saved once by the caller after all rows are authored
+        return
+
     # Save the stage
     stage.GetRootLayer().Save()
     
     print(f"USD file created: {file_path}")
 
-def process_csv_file(file_path):
-    with open(file_path, 'r') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            create_usd_from_csv_row(row)
+def create_layer_from_record(record, catalog_stage=None, file_format=None, components_dir=None):
+    """Sdf fast path of create_usd_from_record, producing the same prims, attributes and metadata."""
+    name = record['Name']
+    dimensions = (record['width_m'], record['depth_m'], record['height_m'])
+    object_color = (record['color_r'], record['color_g'], record['color_b'])
 
-# Usage
-process_csv_file('asset_generator/Lista Products - Enumerated.csv')
+    if catalog_stage is not None:
+        author_component_spec(catalog_stage.GetRootLayer(), name, dimensions, object_color, _custom_data(record),
+                              default_prim=False)
+        return
+
+    file_path = output_path_for(name, file_format, components_dir)
+    layer = Sdf.Layer.CreateNew(file_path)
+    author_component_spec(layer, name, dimensions, object_color, _custom_data(record))
+    layer.Save()
+
+    print(f"USD file created: {file_path}")
+
+def group_families(records):
+    """Group catalog records into product families (one per type), in catalog order."""
+    families = defaultdict(list)
+    for record in records:
+        families[type_slug(record['Type'])].append(record)
+    return [{'Name': family, 'skus': skus} for family, skus in families.items()]
+
+def create_family_from_record(family_record, file_format=None):
+    """Author one asset per product family, with a 'size' variant per SKU (see sdf_authoring.author_family_spec)."""
+    family = family_record['Name']
+    variants = [
+        (record['Name'], (record['width_m'], record['depth_m'], record['height_m']),
+         (record['color_r'], record['color_g'], record['color_b']), _custom_data(record))
+        for record in family_record['skus']
+    ]
+
+    file_path = family_path_for(family, file_format)
+    layer = Sdf.Layer.CreateNew(file_path)
+    author_family_spec(layer, family, variants)
+    layer.Save()
+
+    print(f"USD family created: {file_path} ({len(variants)} sizes)")
+
+def _hashed_columns(record):
+    if 'skus' in record:
+        return {'Name': record['Name'], 'skus': [raw_row(sku) for sku in record['skus']]}
+    return raw_row(record)
 
+def open_catalog_stage(catalog_path):
+    """Open the single-layer catalog for editing, creating it if it does not exist yet."""
+    if os.path.exists(catalog_path):
+        stage = Usd.Stage.Open(catalog_path)
+    else:
+        stage = Usd.Stage.CreateNew(catalog_path)
+        UsdGeom.SetStageUpAxis(stage, "Y")
+    return stage
 
+def _compile_row(record, catalog_stage=None, file_format=None, backend="usd", components_dir=None):
+    """Author a single record, returning (name, error) instead of raising so one bad row cannot abort a batch."""
+    try:
+        if 'skus' in record:
+            create_family_from_record(record, file_format=file_format)
+            return record['Name'], None
+        if catalog_stage is not None:
+            # Re-authoring a changed row starts from a clean prim
+            catalog_stage.RemovePrim(f"/{record['Name']}")
+        create_usd_from_record(record, catalog_stage=catalog_stage, file_format=file_format, backend=backend,
+                               components_dir=components_dir)
+        return record['Name'], None
+    except Exception as e:
+        return record['Name'], f"{type(e).__name__}: {e}"
+
+def write_component_sidecar(records, failed_names=(), catalog_path=None, file_format=None, families=False,
+                            components_dir=None):
+    """
+    Index every generated component of the catalog in the sidecar next to the outputs (see sidecar_index).
+
+    records are the ingested (ungrouped) catalog records. Components whose asset failed to author, or whose
+    output does not exist, are left out so readers fall back to USD for them.
+    """
+    if catalog_path:
+        sidecar_dir = os.path.dirname(catalog_path) or "."
+    else:
+        sidecar_dir = FAMILIES_DIR if families else components_dir or COMPONENTS_DIR
+    failed_names = set(failed_names)
+
+    rows = []
+    for record in records:
+        name = record['Name']
+        if families:
+            family = type_slug(record['Type'])
+            if family in failed_names:
+                continue
+            output, prim_path, variant = family_path_for(family, file_format), f"/{family}", name
+        else:
+            if name in failed_names:
+                continue
+            output = catalog_path or output_path_for(name, file_format, components_dir)
+            prim_path, variant = f"/{name}", None
+        if not os.path.exists(output):
+            continue
+        rows.append(sidecar_row(record, output, sidecar_dir, prim_path, variant=variant,
+                                default_prim=not catalog_path))
+
+    write_sidecar(sidecar_path_for(sidecar_dir), rows)
+
+def process_csv_file(file_path, workers=1, manifest_path=None, force=False, catalog_path=None, file_format=None,
+                     backend="usd", families=False, sidecar=True, components_dir=None):
+    """
+    Generate one USD asset per CSV row.
+
+    The catalog is ingested once up front (see catalog_ingest.load_catalog): malformed rows are reported
+    together and skipped, the remaining rows are authored from the precomputed table.
+
+    Args:
+        file_path (str): Path to the enumerated Lista CSV.
+        workers (int): Number of worker processes. 1 authors the rows serially in this process,
+            None uses one worker per CPU.
+        manifest_path (str): Optional content-hash manifest. When given, only rows that were added or
+            changed since the last run are authored and assets of removed rows are deleted.
+        force (bool): Re-author every row even if the manifest says it is unchanged.
+        catalog_path (str): Optional single-layer catalog. When given, all components are written as sibling
+            prims (/<name>) of this one layer instead of one file each, so consumers pay a single layer load.
+            Authoring into one layer is serial, `workers` is ignored in this mode.
+        file_format (str): 'usda' or 'usdc' for per-component files. Defaults to the USD_FORMAT environment
+            variable, or 'usda'. In catalog mode the format follows the extension of catalog_path.
+        backend (str): 'usd' authors through the UsdGeom API, 'sdf' writes the specs directly inside a change
+            block. Both produce the same layers.
+        families (bool): Write one asset per product family (assets/families/<type>.usda) with a 'size'
+            variantSet holding each SKU, instead of one asset per SKU. The manifest then tracks families, and
+            a family is re-authored when any of its rows changes. Always uses the Sdf backend, and cannot be
+            combined with catalog_path.
+        sidecar (bool): Write the metadata sidecar (components.sqlite) next to the outputs, indexing every
+            generated component so consumers can answer metadata queries without opening USD files.
+        components_dir (str): Directory of the per-component files, assets/components by default. Point scratch
+            catalogs (e.g. the synthetic ones) elsewhere, with their own manifest, so they never replace or
+            remove the real assets.
+
+    Returns:
+        dict: 'created' (list of asset names), 'failed' (list of (name, error) tuples), 'invalid' (malformed
+            CSV records), 'elapsed' (seconds) and, with a manifest, 'delta' (added/changed/removed/unchanged
+            asset names).
+    """
+    if families and catalog_path:
+        raise ValueError("Family assets cannot be written into a single-layer catalog")
+
+    table, invalid = load_catalog(file_path)
+    report_errors(invalid)
+    records = catalog_records = table.to_dict('records')
+    if families:
+        records = group_families(records)
+
+    file_format = resolve_usd_format(file_format)
+    components_dir = components_dir or COMPONENTS_DIR
+
+    delta = None
+    if manifest_path:
+        manifest = load_manifest(manifest_path)
+        # Switching between per-file and catalog output, or between formats, must re-author everything
+        delta, hashes = compute_delta(manifest, [_hashed_columns(record) for record in records],
+                                      salt=catalog_path or f"{file_format}{'|families' if families else ''}")
+        # A row that became malformed keeps its previous asset until it is fixed or really removed
+        invalid_names = {error['name'] for error in invalid}
+        delta['removed'] = [name for name in delta['removed'] if name not in invalid_names]
+        if force:
+            delta['changed'].extend(delta['unchanged'])
+            delta['unchanged'] = []
+        pending = set(delta['added']) | set(delta['changed'])
+        records = [record for record in records if record['Name'] in pending]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    catalog_stage = open_catalog_stage(catalog_path) if catalog_path else None
+    if catalog_stage is not None:
+        workers = 1
+
+    start = time.perf_counter()
+    if catalog_stage is not None:
+        results = [_compile_row(record, catalog_stage, backend=backend) for record in records]
+        if delta is not None:
+            for name in delta['removed']:
+                catalog_stage.RemovePrim(f"/{name}")
+        catalog_stage.GetRootLayer().Save()
+        print(f"USD catalog saved: {catalog_path}")
+    elif workers > 1 and len(records) > 1:
+        # Records are cheap to pickle, so batch them to keep inter-process overhead low
+        chunksize = max(1, len(records) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            compile_row = partial(_compile_row, file_format=file_format, backend=backend,
+                                  components_dir=components_dir)
+            results = list(executor.map(compile_row, records, chunksize=chunksize))
+    else:
+        results = [_compile_row(record, file_format=file_format, backend=backend, components_dir=components_dir)
+                   for record in records]
+    elapsed = time.perf_counter() - start
+
+    created = [name for name, error in results if error is None]
+    failed = [(name, error) for name, error in results if error is not None]
+
+    for name, error in failed:
+        print(f"Error creating USD file for row {name}: {error}")
+    rate = len(created) / elapsed if elapsed > 0 else float('inf')
+    print(f"Compiled {len(created)}/{len(records)} assets in {elapsed:.2f}s "
+          f"({rate:.1f} assets/sec, {workers} worker(s), {len(failed)} failed)")
+
+    summary = {'created': created, 'failed': failed, 'invalid': invalid, 'elapsed': elapsed}
+
+    if delta is not None:
+        if families:
+            outputs = {name: family_path_for(name, file_format) for name in hashes}
+        else:
+            outputs = {name: catalog_path or output_path_for(name, file_format, components_dir) for name in hashes}
+
+        if catalog_stage is None:
+            # Files of removed rows, and files left behind in another format, are deleted. A single-layer catalog
+            # recorded by an earlier catalog-mode run holds other rows too and is left in place.
+            recorded_outputs = Counter(entry['output'] for entry in manifest['assets'].values())
+            catalogs = {output for output, count in recorded_outputs.items() if count > 1}
+            catalogs.add(manifest.get('catalog'))
+            stale_paths = [manifest['assets'][name]['output'] for name in delta['removed']]
+            stale_paths += [manifest['assets'][name]['output'] for name in created
+                            if name in manifest['assets'] and manifest['assets'][name]['output'] != outputs[name]]
+            for stale_path in sorted(set(stale_paths) - catalogs):
+                if os.path.exists(stale_path):
+                    os.remove(stale_path)
+                    print(f"USD file removed: {stale_path}")
+
+        update_manifest(manifest, delta, hashes, outputs, failed=[name for name, _ in failed])
+        if catalog_path:
+            manifest['catalog'] = catalog_path
+        else:
+            manifest.pop('catalog', None)
+        save_manifest(manifest_path, manifest)
+
+        print("Delta: " + ", ".join(f"{len(names)} {key}" for key, names in delta.items()))
+        summary['delta'] = delta
+
+    if sidecar:
+        write_component_sidecar(catalog_records, failed_names=[name for name, _ in failed],
+                                catalog_path=catalog_path, file_format=file_format, families=families,
+                                components_dir=components_dir)
+
+    return summary
+
+# Usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate USD component assets from the Lista CSV.")
+    parser.add_argument('csv_file', nargs='?', default='asset_generator/Lista Products - Enumerated.csv')
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of worker processes (0 = one per CPU)")
+    parser.add_argument('--components-dir', default=COMPONENTS_DIR,
+                        help="Directory of the per-component files (default: assets/components)")
+    parser.add_argument('--manifest', default=None,
+                        help="Content-hash manifest used for incremental regeneration ('' disables it, default: "
+                             "manifest.json in the output directory)")
+    parser.add_argument('--force', action='store_true', help="Re-author every asset, even unchanged ones")
+    parser.add_argument('--catalog', default=None,
+                        help="Write all components into this single catalog layer instead of one file each")
+    parser.add_argument('--format', dest='file_format', choices=USD_FORMATS, default=None,
+                        help="Output format of per-component files (default: $USD_FORMAT or usda)")
+    parser.add_argument('--backend', choices=AUTHORING_BACKENDS, default="usd",
+                        help="Authoring backend: UsdGeom API (usd) or direct Sdf specs (sdf)")
+    parser.add_argument('--families', action='store_true',
+                        help="Write one asset per product family with a 'size' variantSet instead of one per SKU")
+    parser.add_argument('--no-sidecar', dest='sidecar', action='store_false',
+                        help="Do not write the components.sqlite metadata sidecar")
+    args = parser.parse_args()
 
+    manifest_path = args.manifest
+    if manifest_path is None:
+        manifest_path = os.path.join(FAMILIES_DIR if args.families else args.components_dir, "manifest.json")
+    manifest_path = manifest_path or None
 
+    process_csv_file(args.csv_file, workers=args.workers or None, manifest_path=manifest_path,
+                     force=args.force, catalog_path=args.catalog, file_format=args.file_format,
+                     backend=args.backend, families=args.families, sidecar=args.sidecar,
+                     components_dir=args.components_dir)
@@ -0,0 +1,105 @@
+"""
+Benchmark: approximate (IVFIndex) vs exact (ExactIndex) component search on a large synthetic catalog.
+
+Draws a synthetic catalog from the real Lista catalog's distributions (asset_generator/synthetic_catalog.py), embeds
+one text per SKU with the local HashedNgramEncoder, and searches it with queries phrased the way main() phrases them
+(str() of a component dict), built from held-out synthetic SKUs. For ExactIndex and for IVFIndex at several nprobe
+it reports
+- build time
+- per-query latency, one query per search call as retrieve_modules issues them: p50 and p99
+- recall@k against exact search. Synthetic SKUs often share a text, so exact search has ties; a result counts as
+  relevant when it scores at least the k-th exact score, whichever of the tied SKUs it is.
+No network and no API key are needed.
+
+Usage (from the repository root):
+    python benchmarks/bench_ann_index.py [--size 100000] [--dim 256] [--queries 500] [--top-k 5]
+        [--nlist 0] [--nprobe 1 4 8 16 32]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "asset_generator"))
+
+from synthetic_catalog import SOURCE_CSV, generate_rows, load_distributions  # noqa: E402
+
+from LLM_chain.LLM_chain.embeddings import HashedNgramEncoder  # noqa: E402
+from LLM_chain.LLM_chain.vector_search import ExactIndex, IVFIndex  # noqa: E402
+
+
+def _document(row):
+    return (f"{row['Name']} type {row['Type']} function {row['Function']} material {row['Material']} "
+            f"color {row['Color (Attribute)']} width {row['Width']} depth {row['Depth']} height {row['Height']}")
+
+
+def _query(row):
+    return str({'category': "Workbench Top" if "top" in row['Type'].lower() else "Cabinet",
+                'requirements': [row['Type'], row['Function'], row['Material'].lower(), f"{row['Width']} mm wide"],
+                'size': None})
+
+
+def _latencies(index, queries, top_k, **kwargs):
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(index.search(query[np.newaxis, :], top_k, **kwargs)[0])
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies) * 1000
+    return results, np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+
+def _recall(results, exact_results, top_k):
+    relevant = 0
+    for found, exact in zip(results, exact_results):
+        threshold = exact[-1][1] - 1e-5
+        relevant += sum(score >= threshold for _, score in found)
+    return relevant / (top_k * len(exact_results))
+
+
+def main(args):
+    _, distributions = load_distributions(os.path.join(REPO_ROOT, SOURCE_CSV))
+    encoder = HashedNgramEncoder(dim=args.dim)
+    start = time.perf_counter()
+    rows = list(generate_rows(args.size, distributions, seed=0))
+    vectors = encoder.encode_batch([_document(row) for row in rows])
+    queries = encoder.encode_batch([_query(row) for row in generate_rows(args.queries, distributions, seed=1)])
+    print(f"{args.size} SKUs, {args.dim} dimensions, {args.queries} queries, top {args.top_k}: "
+          f"embedded in {time.perf_counter() - start:.1f} s")
+
+    ids = [row['Name'] for row in rows]
+    start = time.perf_counter()
+    exact = ExactIndex(ids, vectors)
+    exact_build = time.perf_counter() - start
+    start = time.perf_counter()
+    ivf = IVFIndex(ids, vectors, nlist=args.nlist)
+    ivf_build = time.perf_counter() - start
+
+    print(f"{'index':<24}{'build (s)':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}{f'recall@{args.top_k}':>11}"
+          f"{'scanned':>9}")
+    exact_results, p50, p99 = _latencies(exact, queries, args.top_k)
+    print(f"{'exact':<24}{exact_build:>10.2f}{p50:>10.2f}{p99:>10.2f}{1.0:>11.3f}{1.0:>9.1%}")
+    cluster_sizes = np.diff(ivf.offsets)
+    for nprobe in args.nprobe:
+        results, p50, p99 = _latencies(ivf, queries, args.top_k, nprobe=nprobe)
+        # Expected share of the catalog a query scores: its clusters are, on average, as large as a random vector's
+        scanned = min(nprobe, ivf.nlist) * np.sum(cluster_sizes ** 2) / args.size ** 2
+        name = f"ivf nlist {ivf.nlist} nprobe {nprobe}"
+        recall = _recall(results, exact_results, args.top_k)
+        print(f"{name:<24}{ivf_build:>10.2f}{p50:>10.2f}{p99:>10.2f}{recall:>11.3f}{scanned:>9.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark IVFIndex against ExactIndex.")
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--dim', type=int, default=256)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--nlist', type=int, default=0, help="0: square root of the catalog size")
+    parser.add_argument('--nprobe', type=int, nargs='+', default=[1, 4, 8, 16, 32])
+    main(parser.parse_args())
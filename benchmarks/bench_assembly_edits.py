@@ -0,0 +1,117 @@
+"""
+Benchmark: editing a CabinetAssembly in place vs rebuilding it after every edit.
+
+A layout search mutates a candidate assembly of N cabinets (random append, insert, remove and swap) and after each
+edit reads the total length and whether the cabinets are consistent. Compared:
+- rebuild: CabinetAssembly(cabinets=...) over the edited list, then total_length and check_consistency
+- incremental: the assembly's own edit methods, then total_length and inconsistency_count
+Both runs replay the same edits and must agree at every step.
+
+Usage (from the repository root):
+    python benchmarks/bench_assembly_edits.py [N] [EDITS]
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from USD_modules.models import CabinetAssembly, CabinetModel  # noqa: E402
+
+WIDTHS = (0.564, 0.717, 0.870, 1.023)
+HEIGHTS = (0.7, 0.75, 0.8)
+DEPTHS = (0.5, 0.6)
+
+
+def _cabinets(n, rng):
+    return [CabinetModel(name=f"cabinet_{i}", asset_path=f"assets/components/cabinet_{i}.usda",
+                         dimensions=(rng.choice(WIDTHS), rng.choice(HEIGHTS), rng.choice(DEPTHS)),
+                         function="Storage", type="Drawer Cabinet", color=(0.5, 0.5, 0.5), material="Steel")
+            for i in range(n)]
+
+
+def _edits(count, n, pool, rng):
+    """A replayable edit script that keeps the assembly size around n."""
+    edits = []
+    size = n
+    for _ in range(count):
+        op = rng.choice(("append", "insert", "remove", "swap"))
+        if op == "remove" and size > 1:
+            edits.append(("remove", rng.randrange(size)))
+            size -= 1
+        elif op == "swap":
+            edits.append(("swap", rng.randrange(size), rng.randrange(size)))
+        elif op == "insert":
+            edits.append(("insert", rng.randint(0, size), rng.choice(pool)))
+            size += 1
+        else:
+            edits.append(("append", rng.choice(pool)))
+            size += 1
+    return edits
+
+
+def _apply(cabinets, edit):
+    op = edit[0]
+    if op == "append":
+        cabinets.append(edit[1])
+    elif op == "insert":
+        cabinets.insert(edit[1], edit[2])
+    elif op == "remove":
+        cabinets.pop(edit[1])
+    else:
+        i, j = edit[1], edit[2]
+        cabinets[i], cabinets[j] = cabinets[j], cabinets[i]
+
+
+def rebuild(start, edits):
+    cabinets = list(start)
+    results = []
+    for edit in edits:
+        _apply(cabinets, edit)
+        assembly = CabinetAssembly(cabinets=list(cabinets))
+        results.append((assembly.total_length, len(assembly.check_consistency())))
+    return results
+
+
+def incremental(start, edits):
+    assembly = CabinetAssembly(cabinets=list(start))
+    results = []
+    for edit in edits:
+        getattr(assembly, edit[0])(*edit[1:])
+        results.append((assembly.total_length, assembly.inconsistency_count))
+    return results
+
+
+def _timed(fn, *args):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main(n, count):
+    rng = random.Random(0)
+    pool = _cabinets(64, rng)
+    start = _cabinets(n, rng)
+    edits = _edits(count, n, pool, rng)
+    print(f"{n} cabinets, {count} edits")
+    print(f"{'strategy':<14}{'total (s)':>10}{'us/edit':>10}")
+    expected, rebuild_time = _timed(rebuild, start, edits)
+    actual, incremental_time = _timed(incremental, start, edits)
+    for label, elapsed in (("rebuild", rebuild_time), ("incremental", incremental_time)):
+        print(f"{label:<14}{elapsed:>10.3f}{elapsed / count * 1e6:>10.2f}")
+    agree = all(abs(a[0] - e[0]) < 1e-6 and a[1] == e[1] for a, e in zip(actual, expected))
+    print(f"results agree: {agree}, speedup {rebuild_time / incremental_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
@@ -0,0 +1,101 @@
+"""
+Benchmark: sequential vs asynchronous LLM_chain pipeline, with local stubs for the remote APIs.
+
+The remote calls are replaced by stubs that sleep for a typical latency:
+- structure_user_input: one LLM completion (LLM_LATENCY)
+- retrieve_many: one batch embedding request (EMBEDDING_LATENCY)
+- width_cabinet: one asset read per cabinet file (FILE_LATENCY, e.g. a cold network-mounted asset store)
+Sequential runs main_async with a concurrency bound of 1, which executes the steps exactly as the previous
+synchronous main() did. Reports the latency of single 4-6 cabinet prompts and of a burst of prompts (main_many vs
+one after another). The assembly_chooser strategies are not part of main() and are left out.
+
+Usage (from the repository root):
+    python benchmarks/bench_async_pipeline.py [BURST]
+"""
+
+import asyncio
+from enum import Enum
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from LLM_chain.LLM_chain import main as pipeline  # noqa: E402
+
+LLM_LATENCY = 0.4
+EMBEDDING_LATENCY = 0.15
+FILE_LATENCY = 0.03
+
+
+class _Category(str, Enum):
+    cabinet = "Cabinet"
+    workbench_top = "Workbench Top"
+    rear_panels = "Rear Panels"
+
+
+def _stub_structure_user_input(user_input):
+    time.sleep(LLM_LATENCY)
+    cabinets = int(user_input.split()[0])
+    return ([SimpleNamespace(category=_Category.cabinet, requirements=["drawers", f"cabinet {i}"], size=None)
+             for i in range(cabinets)]
+            + [SimpleNamespace(category=_Category.workbench_top, requirements=["wooden"], size=None),
+               SimpleNamespace(category=_Category.rear_panels, requirements=["black"], size=None)])
+
+
+def _stub_retrieve_many(queries, top_k=1):
+    time.sleep(EMBEDDING_LATENCY)
+    return [[{'default_prim': f"drawer_cabinet_{i}", 'score': 0.5}] for i in range(len(queries))]
+
+
+def _stub_width_cabinet(input_files, catalog_file=None):
+    time.sleep(FILE_LATENCY * len(input_files))
+    return [0.564 for _ in input_files]
+
+
+def _install_stubs():
+    pipeline.structure_user_input = _stub_structure_user_input
+    pipeline.retrieve_many = _stub_retrieve_many
+    pipeline.width_cabinet = _stub_width_cabinet
+
+
+def _timed(coroutine_or_function, *args):
+    start = time.perf_counter()
+    if asyncio.iscoroutinefunction(coroutine_or_function):
+        result = asyncio.run(coroutine_or_function(*args))
+    else:
+        result = coroutine_or_function(*args)
+    return result, time.perf_counter() - start
+
+
+async def _sequential(user_inputs):
+    return [await pipeline.main_async(user_input, asyncio.Semaphore(1)) for user_input in user_inputs]
+
+
+async def _single_sequential(user_input):
+    return await pipeline.main_async(user_input, asyncio.Semaphore(1))
+
+
+def main(burst):
+    _install_stubs()
+    print(f"stub latencies: LLM {LLM_LATENCY * 1000:.0f} ms, embedding {EMBEDDING_LATENCY * 1000:.0f} ms, "
+          f"file {FILE_LATENCY * 1000:.0f} ms")
+    print(f"{'prompt':<22}{'sequential (ms)':>16}{'async (ms)':>12}")
+    for cabinets in (4, 5, 6):
+        prompt = f"{cabinets} cabinets with drawers, a wooden top and black rear panels"
+        expected, sequential_time = _timed(_single_sequential, prompt)
+        result, async_time = _timed(pipeline.main_async, prompt)
+        assert result['metadata']['W_tot_cabinets'] == expected['metadata']['W_tot_cabinets']
+        print(f"{f'{cabinets} cabinets':<22}{sequential_time * 1000:>16.0f}{async_time * 1000:>12.0f}")
+
+    prompts = [f"{4 + i % 3} cabinets with drawers" for i in range(burst)]
+    expected, sequential_time = _timed(_sequential, prompts)
+    results, async_time = _timed(pipeline.main_many, prompts)
+    assert [r['metadata']['W_tot_cabinets'] for r in results] == [r['metadata']['W_tot_cabinets'] for r in expected]
+    print(f"{f'burst of {burst} prompts':<22}{sequential_time * 1000:>16.0f}{async_time * 1000:>12.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
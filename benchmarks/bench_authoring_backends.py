@@ -0,0 +1,98 @@
+"""
+Microbenchmark: UsdGeom vs Sdf authoring backends of the asset generator.
+
+Authors every row of the Lista CSV (repeated to N assets) with both backends into separate directories,
+reports the per-asset cost and speedup, and checks that each pair of files is byte-identical, or failing
+that, semantically equal (same specs, fields and values).
+
+Usage (from the repository root):
+    python benchmarks/bench_authoring_backends.py [N]
+"""
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "asset_generator"))
+
+from pxr import Sdf  # noqa: E402
+
+from catalog_ingest import ingest_rows  # noqa: E402
+from usd_utlis import create_usd_from_record  # noqa: E402
+
+CSV_PATH = os.path.join(REPO_ROOT, "asset_generator", "Lista Products - Enumerated.csv")
+
+
+def _rows(n):
+    with open(CSV_PATH, "r") as f:
+        rows = list(csv.DictReader(f))
+    scaled = []
+    for i in range(n):
+        row = dict(rows[i % len(rows)])
+        row["Name"] = f"{row['Name']}_{i}"
+        scaled.append(row)
+    table, _ = ingest_rows(scaled)
+    return table.to_dict("records")
+
+
+def _author_all(rows, components_dir, backend):
+    os.makedirs(components_dir)
+    start = time.perf_counter()
+    # Silence the per-asset progress output so it does not dominate the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        for row in rows:
+            create_usd_from_record(row, backend=backend, components_dir=components_dir)
+    return time.perf_counter() - start
+
+
+def _spec_fields(layer):
+    """Flatten a layer into {(path, field): value} for a semantic comparison."""
+    fields = {}
+
+    def visit(path):
+        spec = layer.GetObjectAtPath(path)
+        for key in spec.ListInfoKeys():
+            fields[(str(path), key)] = spec.GetInfo(key)
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, visit)
+    return fields
+
+
+def _compare(usd_dir, sdf_dir):
+    identical = equal = different = 0
+    for file_name in sorted(os.listdir(usd_dir)):
+        usd_path, sdf_path = os.path.join(usd_dir, file_name), os.path.join(sdf_dir, file_name)
+        with open(usd_path, "rb") as a, open(sdf_path, "rb") as b:
+            if a.read() == b.read():
+                identical += 1
+                continue
+        if _spec_fields(Sdf.Layer.FindOrOpen(usd_path)) == _spec_fields(Sdf.Layer.FindOrOpen(sdf_path)):
+            equal += 1
+        else:
+            different += 1
+            print(f"Mismatch: {file_name}")
+    return identical, equal, different
+
+
+def main(n):
+    rows = _rows(n)
+    with tempfile.TemporaryDirectory() as workdir:
+        usd_dir, sdf_dir = os.path.join(workdir, "usd"), os.path.join(workdir, "sdf")
+        usd_time = _author_all(rows, usd_dir, "usd")
+        sdf_time = _author_all(rows, sdf_dir, "sdf")
+        identical, equal, different = _compare(usd_dir, sdf_dir)
+
+    print(f"{n} assets")
+    print(f"usd backend: {usd_time:.3f}s ({usd_time / n * 1e3:.3f} ms/asset)")
+    print(f"sdf backend: {sdf_time:.3f}s ({sdf_time / n * 1e3:.3f} ms/asset)")
+    print(f"speedup:     {usd_time / sdf_time:.2f}x")
+    print(f"outputs:     {identical} byte-identical, {equal} semantically equal, {different} different")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
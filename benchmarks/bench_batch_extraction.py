@@ -0,0 +1,98 @@
+"""
+Benchmark: serial Usd.Stage extraction vs batch, layer-level extraction of cabinet metadata.
+
+Authors N component assets (the Lista CSV repeated), then extracts a CabinetModel from each with
+  - stage:  the previous implementation, one fully composed Usd.Stage.Open per file, serially
+  - layer:  extract_usd_properties (layer-level read), serially
+  - batch:  extract_usd_properties_batch (layer-level read on a thread pool)
+and checks that all three return the same models. No sidecar is written and the component cache is cleared
+before each run, so every path reads the USD files.
+
+Usage (from the repository root):
+    python benchmarks/bench_batch_extraction.py [N] [WORKERS]
+"""
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "asset_generator"))
+sys.path.insert(0, REPO_ROOT)
+
+from pxr import Usd, UsdGeom  # noqa: E402
+
+import usd_utlis  # noqa: E402
+from catalog_ingest import ingest_rows  # noqa: E402
+from USD_modules.cabinet_parser import extract_usd_properties, extract_usd_properties_batch  # noqa: E402
+from USD_modules.component_cache import component_cache  # noqa: E402
+from USD_modules.models import CabinetModel  # noqa: E402
+
+CSV_PATH = os.path.join(REPO_ROOT, "asset_generator", "Lista Products - Enumerated.csv")
+
+
+def _author(n, components_dir):
+    with open(CSV_PATH, "r") as f:
+        rows = list(csv.DictReader(f))
+    scaled = []
+    for i in range(n):
+        row = dict(rows[i % len(rows)])
+        row["Name"] = f"{row['Name']}_{i}"
+        scaled.append(row)
+    table, _ = ingest_rows(scaled)
+
+    os.makedirs(components_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for record in table.to_dict("records"):
+            usd_utlis.create_usd_from_record(record, backend="sdf", components_dir=components_dir)
+    return sorted(os.path.join(components_dir, name) for name in os.listdir(components_dir))
+
+
+def _stage_extract(file_path):
+    """The stage-based read extract_usd_properties used before the layer-level path."""
+    stage = Usd.Stage.Open(file_path)
+    root_prim = stage.GetDefaultPrim()
+    geometry_prim = root_prim.GetChild("geometry")
+    custom_data = geometry_prim.GetCustomData()
+    xform_ops = {op.GetOpName(): op.Get() for op in UsdGeom.Xformable(geometry_prim).GetOrderedXformOps()}
+    display_color = geometry_prim.GetAttribute("primvars:displayColor").Get()
+    return CabinetModel(
+        name=os.path.splitext(os.path.basename(file_path))[0],
+        asset_path=file_path,
+        dimensions=tuple(xform_ops.get('xformOp:scale', (1.0, 1.0, 1.0))),
+        function=custom_data.get('function', 'Unknown'),
+        type=custom_data.get('type', 'Unknown'),
+        color=tuple(display_color[0]) if display_color else (1.0, 1.0, 1.0),
+        material=custom_data.get('material', 'Unknown')
+    )
+
+
+def _timed(fn):
+    component_cache.clear()
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(n, workers):
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = _author(n, os.path.join(workdir, "components"))
+
+        stage_models, stage_time = _timed(lambda: [_stage_extract(path) for path in paths])
+        layer_models, layer_time = _timed(lambda: [extract_usd_properties(path) for path in paths])
+        (batch_models, errors), batch_time = _timed(lambda: extract_usd_properties_batch(paths, max_workers=workers))
+
+    print(f"{n} assets, {workers or 'default'} worker thread(s)")
+    print(f"stage, serial: {stage_time:.3f}s ({stage_time / n * 1e3:.3f} ms/asset)")
+    print(f"layer, serial: {layer_time:.3f}s ({layer_time / n * 1e3:.3f} ms/asset, {stage_time / layer_time:.2f}x)")
+    print(f"layer, batch:  {batch_time:.3f}s ({batch_time / n * 1e3:.3f} ms/asset, {stage_time / batch_time:.2f}x)")
+    print(f"models equal:  {stage_models == layer_models == batch_models} ({len(errors)} errors)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,108 @@
+"""
+Benchmark: one retrieve_modules call per component vs a single retrieve_many call.
+
+Builds an offline index (local embedding backend) from the indexed component texts in a temporary directory, then
+retrieves typical prompts (6 cabinets and a workbench top, i.e. 7 queries), and larger batches, both ways:
+- loop: the previous main(), one VectorIndexRetriever.retrieve per component
+- batch: retrieve_many, one embedding batch and one matrix product
+and reports the wall time and the number of embedding requests each needs, which is what dominates with a remote
+embedding API. Both must return the same components. The query embedding cache is disabled, so every run embeds
+its queries and only batching is measured (see bench_query_cache.py for the cache).
+Requires llama-index-core; no network and no API key.
+
+Usage (from the repository root):
+    python benchmarks/bench_batched_retrieval.py [QUERIES...]
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DOCSTORE = os.path.join(REPO_ROOT, "LLM_chain", "LLM_chain", "index_components", "docstore.json")
+INDEX_DIR = tempfile.mkdtemp(prefix="component_index_")
+os.environ["COMPONENT_INDEX_DIR"] = INDEX_DIR
+# Later, larger batches would otherwise be served from the embeddings cached by earlier ones
+os.environ["QUERY_CACHE_SIZE"] = "0"
+
+from llama_index.core import Document, VectorStoreIndex  # noqa: E402
+from llama_index.core.retrievers import VectorIndexRetriever  # noqa: E402
+
+from LLM_chain.LLM_chain import resources  # noqa: E402
+from LLM_chain.LLM_chain.component_retriever import retrieve_many  # noqa: E402
+from LLM_chain.LLM_chain.embeddings import embedding_config, get_embed_model, write_embedding_config  # noqa: E402
+
+REQUIREMENTS = (["drawers"], ["shelves", "small"], ["hinged doors", "metal"], ["rolling", "mobile"],
+                ["heavy duty", "large"], ["bins"], ["wooden"])
+
+
+def _build_index():
+    with open(DOCSTORE, "r") as f:
+        texts = [entry["__data__"]["text"] for entry in json.load(f)["docstore/data"].values()]
+    config = embedding_config("local")
+    index = VectorStoreIndex.from_documents([Document(text=text) for text in texts],
+                                            embed_model=get_embed_model(**config))
+    index.storage_context.persist(persist_dir=INDEX_DIR)
+    write_embedding_config(INDEX_DIR, config)
+    return len(texts)
+
+
+def _queries(n):
+    queries = []
+    for i in range(n):
+        category = "Workbench Top" if i % 7 == 6 else "Cabinet"
+        queries.append(str({'category': category, 'requirements': list(REQUIREMENTS[i % len(REQUIREMENTS)]),
+                            'size': ("Small", "Medium", "Large")[i % 3]}))
+    return queries
+
+
+class _CountingEmbedding:
+    """Count the embedding requests of the shared embed model."""
+
+    def __init__(self, model):
+        self.requests = 0
+        for name in ("_get_query_embedding", "_get_text_embeddings"):
+            original = getattr(model, name)
+            object.__setattr__(model, name, self._counted(original))
+
+    def _counted(self, method):
+        def counted(*args, **kwargs):
+            self.requests += 1
+            return method(*args, **kwargs)
+        return counted
+
+
+def main(sizes):
+    documents = _build_index()
+    retriever = VectorIndexRetriever(index=resources.get_index(), similarity_top_k=1)
+    counter = _CountingEmbedding(resources.get_embed_model())
+    retrieve_many(["warm up"])
+    print(f"{documents} documents")
+    print(f"{'queries':>8}{'loop (ms)':>11}{'requests':>10}{'batch (ms)':>12}{'requests':>10}  same results")
+    for n in sizes:
+        queries = _queries(n)
+
+        counter.requests = 0
+        start = time.perf_counter()
+        looped = [[node.node.text for node in retriever.retrieve(query)] for query in queries]
+        loop_time, loop_requests = time.perf_counter() - start, counter.requests
+
+        counter.requests = 0
+        start = time.perf_counter()
+        batched = [[result['content'] for result in results] for results in retrieve_many(queries)]
+        batch_time, batch_requests = time.perf_counter() - start, counter.requests
+
+        print(f"{n:>8}{loop_time * 1000:>11.1f}{loop_requests:>10}{batch_time * 1000:>12.1f}{batch_requests:>10}"
+              f"  {looped == batched}")
+
+
+if __name__ == "__main__":
+    try:
+        main([int(arg) for arg in sys.argv[1:]] or [7, 100, 1000])
+    finally:
+        shutil.rmtree(INDEX_DIR, ignore_errors=True)
@@ -0,0 +1,113 @@
+"""
+Benchmark: one file per component vs a single-layer catalog.
+
+Generates N components in both layouts from the Lista CSV (rows are repeated with fresh names to reach N),
+then measures
+- cold open: reading every component's extent from disk, in a fresh interpreter so no layer is in the Sdf
+  registry yet (generating the assets leaves them loaded in this process)
+- merge: merge_usda_files on a 6-cabinet assembly, with the layers already loaded
+
+Usage (from the repository root):
+    python benchmarks/bench_catalog_layout.py [N]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import gc
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "asset_generator"))
+
+from pxr import Usd, UsdGeom  # noqa: E402
+
+from usd_utlis import process_csv_file, output_path_for  # noqa: E402
+from USD_modules.usd_utils import merge_usda_files  # noqa: E402
+
+CSV_PATH = os.path.join(REPO_ROOT, "asset_generator", "Lista Products - Enumerated.csv")
+
+
+def _write_scaled_csv(path, n):
+    with open(CSV_PATH, "r") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        rows = list(reader)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for i in range(n):
+            row = dict(rows[i % len(rows)])
+            row["Name"] = f"{row['Name']}_{i}"
+            writer.writerow(row)
+    return [f"{rows[i % len(rows)]['Name']}_{i}" for i in range(n)]
+
+
+def _timed(fn):
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _read_extents_per_file(names):
+    for name in names:
+        stage = Usd.Stage.Open(output_path_for(name))
+        UsdGeom.Boundable(stage.GetPrimAtPath(f"/{name}/geometry")).GetExtentAttr().Get()
+
+
+def _read_extents_catalog(catalog_path, names):
+    stage = Usd.Stage.Open(catalog_path)
+    for name in names:
+        UsdGeom.Boundable(stage.GetPrimAtPath(f"/{name}/geometry")).GetExtentAttr().Get()
+
+
+def _cold_read(catalog_path, names):
+    if catalog_path:
+        return _timed(lambda: _read_extents_catalog(catalog_path, names))
+    return _timed(lambda: _read_extents_per_file(names))
+
+
+def _timed_cold(catalog_path, names):
+    """Time _cold_read in a newly spawned interpreter, whose layer registry is empty."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_cold_read, catalog_path, names).result()
+
+
+def main(n):
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        os.makedirs(os.path.join("assets", "components"))
+        csv_path = os.path.join(workdir, "catalog.csv")
+        names = _write_scaled_csv(csv_path, n)
+        catalog_path = os.path.join("assets", "catalog.usda")
+
+        process_csv_file(csv_path)
+        process_csv_file(csv_path, catalog_path=catalog_path)
+
+        cabinets = [name for name in names if "cabinet" in name][:6]
+        top = next(name for name in names if name.startswith("workbench_top"))
+        panel = next(name for name in names if name.startswith("rear_panel"))
+
+        per_file_open = _timed_cold(None, names)
+        catalog_open = _timed_cold(catalog_path, names)
+
+        per_file_merge = _timed(lambda: merge_usda_files(
+            "merged_files.usda", output_path_for(top), [output_path_for(c) for c in cabinets],
+            output_path_for(panel), 2, 3))
+        catalog_merge = _timed(lambda: merge_usda_files(
+            "merged_catalog.usda", top, cabinets, panel, 2, 3, catalog_file=catalog_path))
+
+        print()
+        print(f"{n} components")
+        print(f"{'layout':<12}{'cold open (s)':>16}{'merge (s)':>12}")
+        print(f"{'per-file':<12}{per_file_open:>16.4f}{per_file_merge:>12.4f}")
+        print(f"{'catalog':<12}{catalog_open:>16.4f}{catalog_merge:>12.4f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,92 @@
+"""
+Benchmark: import time of the layout-only entry points, with a budget check.
+
+Each entry point is imported in a fresh interpreter under `python -X importtime`, RUNS times, and the median
+cumulative import time is compared with the budget. The heavy dependencies (pxr, IPython, llama_index, openai,
+pandas) must not be imported at all on this path: they are loaded by the functions that need them.
+Exits with status 1 if an entry point is over budget, imports a heavy dependency or fails to import (a missing
+third-party package or a broken module), so it can gate CI.
+
+Usage (from the repository root):
+    python benchmarks/bench_import_time.py [--budget-ms MS] [--runs RUNS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What the layout step of run_demo imports: the pipeline entry, USD merging, component metadata and SKU queries
+ENTRY_POINTS = (
+    "run_demo",
+    "LLM_chain.LLM_chain.main",
+    "LLM_chain.LLM_chain.retrieval_utils",
+    "LLM_chain.LLM_chain.catalog_query",
+    "USD_modules.usd_utils",
+    "USD_modules.component_cache",
+)
+HEAVY_PACKAGES = ("pxr", "IPython", "llama_index", "openai", "pandas")
+DEFAULT_BUDGET_MS = 100
+
+
+def import_profile(module):
+    """
+    Import module in a fresh interpreter.
+
+    Returns:
+        tuple: (cumulative import time in ms, heavy packages imported), or (None, error line) if the import failed.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO_ROOT, capture_output=True, text=True)
+    lines = result.stderr.splitlines()
+    if result.returncode != 0:
+        return None, lines[-1] if lines else f"exit status {result.returncode}"
+
+    cumulative = None
+    heavy = set()
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        name = name.strip()
+        if name == module:
+            cumulative = int(total) / 1000
+        if name.split(".")[0] in HEAVY_PACKAGES:
+            heavy.add(name.split(".")[0])
+    return cumulative, sorted(heavy)
+
+
+def main(budget_ms, runs):
+    print(f"budget {budget_ms} ms per entry point, median of {runs} runs")
+    print(f"{'entry point':<38}{'median (ms)':>12}  heavy imports")
+    failed = False
+    for module in ENTRY_POINTS:
+        times = []
+        heavy = []
+        for _ in range(runs):
+            elapsed, heavy = import_profile(module)
+            if elapsed is None:
+                break
+            times.append(elapsed)
+        if not times:
+            failed = True
+            print(f"{module:<38}{'FAILED':>12}  {heavy}")
+            continue
+        median = statistics.median(times)
+        over = median > budget_ms or heavy
+        failed = failed or bool(over)
+        status = "  OVER BUDGET" if median > budget_ms else ""
+        print(f"{module:<38}{median:>12.1f}  {', '.join(heavy) or '-'}{status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the import time of the layout-only entry points.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Maximum median import time per entry point (default {DEFAULT_BUDGET_MS} ms)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point (default 5)")
+    args = parser.parse_args()
+    sys.exit(main(args.budget_ms, args.runs))
@@ -0,0 +1,86 @@
+"""
+Benchmark: offline component retrieval with the local hashed n-gram embedding backend.
+
+Embeds the indexed component documents (the docstore of the persisted index) with HashedNgramEncoder, then runs one
+structured query per component, phrased the way main() phrases them (str() of a component dict), built from the
+component's own customData: type, function, material and width. Reports
+- indexing throughput
+- per-query latency (embed + score against every document), p50 and p99
+- hit@1 (the best match has the queried type and width) and recall@5 (the queried component is in the top 5)
+No network and no API key are needed; LlamaIndex is not involved, this measures the encoder and exact scoring.
+
+Usage (from the repository root):
+    python benchmarks/bench_local_embedding.py [DIM]
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from LLM_chain.LLM_chain.embeddings import HashedNgramEncoder  # noqa: E402
+from LLM_chain.LLM_chain.usda_scanner import scan_usda  # noqa: E402
+
+DOCSTORE = os.path.join(REPO_ROOT, "LLM_chain", "LLM_chain", "index_components", "docstore.json")
+
+
+def _category(component_type):
+    component_type = component_type.lower()
+    if "top" in component_type:
+        return "Workbench Top"
+    if "panel" in component_type:
+        return "Rear Panels"
+    return "Cabinet"
+
+
+def _documents():
+    with open(DOCSTORE, "r") as f:
+        texts = [entry["__data__"]["text"] for entry in json.load(f)["docstore/data"].values()]
+    return texts, [scan_usda(text)['custom_data'] for text in texts]
+
+
+def _query(custom_data):
+    return str({
+        'category': _category(custom_data.get('type', '')),
+        'requirements': [custom_data.get('type', ''), custom_data.get('function', ''),
+                         str(custom_data.get('material', '')).lower(), f"{custom_data.get('width')} mm wide"],
+        'size': None,
+    })
+
+
+def main(dim):
+    texts, metadata = _documents()
+    encoder = HashedNgramEncoder(dim=dim)
+
+    start = time.perf_counter()
+    matrix = encoder.encode_batch(texts)
+    index_time = time.perf_counter() - start
+    print(f"{len(texts)} documents, {dim} dimensions: indexed in {index_time * 1000:.1f} ms "
+          f"({len(texts) / index_time:.0f} docs/s)")
+
+    latencies = []
+    hits = 0
+    recalled = 0
+    for i, custom_data in enumerate(metadata):
+        query = _query(custom_data)
+        start = time.perf_counter()
+        scores = matrix @ encoder.encode(query)
+        top = np.argsort(-scores)[:5]
+        latencies.append(time.perf_counter() - start)
+        best = metadata[top[0]]
+        hits += best.get('type') == custom_data.get('type') and best.get('width') == custom_data.get('width')
+        recalled += i in top
+
+    latencies = np.array(latencies) * 1000
+    print(f"query latency: p50 {np.percentile(latencies, 50):.3f} ms, p99 {np.percentile(latencies, 99):.3f} ms")
+    print(f"hit@1 (type and width): {hits / len(metadata):.2f}, recall@5 (same component): "
+          f"{recalled / len(metadata):.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1024)
@@ -0,0 +1,56 @@
+"""
+Benchmark: merge_usda_files time as the number of rear panels grows.
+
+Generates the Lista components, then merges a 4-cabinet assembly with quantity x layers rear panels for
+increasing quantities. Panel bounds come from the bounds service, so the number of component reads stays
+constant and the merge time grows only with the prims authored into the scene.
+
+Usage (from the repository root):
+    python benchmarks/bench_merge_panels.py [QUANTITY ...]
+"""
+
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "asset_generator"))
+
+from usd_utlis import process_csv_file, output_path_for  # noqa: E402
+from USD_modules.component_cache import component_cache  # noqa: E402
+from USD_modules.usd_utils import merge_usda_files  # noqa: E402
+
+CSV_PATH = os.path.join(REPO_ROOT, "asset_generator", "Lista Products - Enumerated.csv")
+LAYERS = 2
+
+
+def main(quantities):
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        os.makedirs(os.path.join("assets", "components"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            names = process_csv_file(CSV_PATH)['created']
+
+        cabinets = [output_path_for(name) for name in names if "cabinet" in name][:4]
+        top = output_path_for(next(name for name in names if name.startswith("workbench_top")))
+        panel = output_path_for(next(name for name in names if name.startswith("rear_panel")))
+
+        print(f"{'panels':>8}{'merge (s)':>12}{'ms/panel':>10}{'component reads':>17}")
+        for quantity in quantities:
+            component_cache.clear()
+            gc.collect()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                merge_usda_files(f"merged_{quantity}.usda", top, cabinets, panel, quantity, LAYERS)
+            elapsed = time.perf_counter() - start
+            panels = quantity * LAYERS
+            print(f"{panels:>8}{elapsed:>12.4f}{elapsed / panels * 1e3:>10.3f}{component_cache.misses:>17}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000])
@@ -0,0 +1,113 @@
+"""
+Benchmark: validated and unvalidated model construction, and copy costs, at scale.
+
+Builds N cabinets from catalog-like field dicts (the Lista CSV repeated) as
+- CabinetModel(**fields): full Pydantic validation, also the cheapest way to build a model
+- CabinetModel.model_construct(**fields): no validation, yet slower than validating
+- CabinetRecord(**fields): slotted dataclass for internal hot loops
+and reports construction time and retained memory per representation, then the cost of re-dimensioning each
+object: rebuilding field by field (adjust_workbench_top), model_copy, and dataclasses.replace.
+Finally it builds an AssemblyModel over all cabinets.
+
+Usage (from the repository root):
+    python benchmarks/bench_model_construction.py [N]
+"""
+
+import csv
+import dataclasses
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from USD_modules.models import (  # noqa: E402
+    AssemblyModel, CabinetAssembly, CabinetModel, CabinetRecord, WorkbenchTopModel)
+
+CSV_PATH = os.path.join(REPO_ROOT, "asset_generator", "Lista Products - Enumerated.csv")
+
+
+def _fields(n):
+    with open(CSV_PATH, "r") as f:
+        rows = [row for row in csv.DictReader(f) if row["Width"].isdigit()]
+    fields = []
+    for i in range(n):
+        row = rows[i % len(rows)]
+        fields.append(dict(
+            name=f"{row['Name']}_{i}",
+            asset_path=f"assets/components/{row['Name']}_{i}.usda",
+            dimensions=(int(row["Width"]) / 1000, int(row["Depth"]) / 1000, int(row["Height"]) / 1000),
+            function=row["Function"],
+            type=row["Type"],
+            color=(0.5, 0.5, 0.5),
+            material=row["Material"],
+        ))
+    return fields
+
+
+def _measure(build):
+    """Return (result, seconds, retained bytes) of build(). Memory is traced in a separate run, tracing skews time."""
+    elapsed = _timed(build)
+    result = build()
+    gc.collect()
+    tracemalloc.start()
+    traced = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+    return result, elapsed, retained
+
+
+def _timed(fn):
+    # Collections triggered by the objects kept alive from earlier runs would otherwise dominate later runs
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _rebuild(model, dimensions):
+    """adjust_workbench_top: a new, fully validated model field by field."""
+    return type(model)(name=model.name, asset_path=model.asset_path, dimensions=dimensions, function=model.function,
+                       type=model.type, color=model.color, material=model.material)
+
+
+def main(n):
+    fields = _fields(n)
+    print(f"{n} cabinets")
+
+    print(f"{'construction':<26}{'total (s)':>10}{'us/object':>11}{'MB retained':>13}")
+    validated, validated_time, validated_bytes = _measure(lambda: [CabinetModel(**f) for f in fields])
+    _, construct_time, construct_bytes = _measure(lambda: [CabinetModel.model_construct(**f) for f in fields])
+    records, record_time, record_bytes = _measure(lambda: [CabinetRecord(**f) for f in fields])
+    for label, elapsed, retained in (("CabinetModel (validated)", validated_time, validated_bytes),
+                                     ("model_construct", construct_time, construct_bytes),
+                                     ("CabinetRecord (slots)", record_time, record_bytes)):
+        print(f"{label:<26}{elapsed:>10.3f}{elapsed / n * 1e6:>11.2f}{retained / 2**20:>13.1f}")
+
+    dimensions = (1.0, 0.5, 0.8)
+    print(f"{'copy with new dimensions':<26}{'total (s)':>10}{'us/object':>11}")
+    for label, copy in (("rebuild field by field", lambda: [_rebuild(m, dimensions) for m in validated]),
+                        ("model_copy(update=...)",
+                         lambda: [m.model_copy(update={'dimensions': dimensions}) for m in validated]),
+                        ("dataclasses.replace", lambda: [dataclasses.replace(r, dimensions=dimensions)
+                                                         for r in records])):
+        elapsed = _timed(copy)
+        print(f"{label:<26}{elapsed:>10.3f}{elapsed / n * 1e6:>11.2f}")
+
+    top = WorkbenchTopModel(name="workbench_top_1", asset_path="assets/components/workbench_top_1.usda",
+                            dimensions=(1.0, 1.0, 0.05), function="Top", type="Workbench Top",
+                            color=(0.5, 0.5, 0.5), material="Universal")
+    assembly = _timed(lambda: AssemblyModel(cabinets=CabinetAssembly(cabinets=validated), workbench_top=top))
+    print(f"AssemblyModel over all cabinets: {assembly:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,149 @@
+"""
+Benchmark: retrieve_many with and without the persistent query embedding cache.
+
+Builds an offline index (local embedding backend) from the indexed component texts in a temporary directory, then
+replays a stream of prompts the way main() issues them (one retrieve_many per prompt, one query per cabinet and
+workbench top). Component queries are drawn from a skewed (Zipf) distribution over category, requirements and size,
+and written the ways they occur in practice: other key orders, extra whitespace, capitalized requirements.
+Each embedding request is charged EMBEDDING_LATENCY, a typical remote embedding API round trip.
+Reports, without the cache, with a cold cache file and with the warm file reopened (a restarted worker):
+- embedding requests and embedded texts
+- wall time
+- cache hit rate
+and checks that every mode retrieves the same components. A last run with a small maxsize shows eviction.
+Requires llama-index-core; no network and no API key.
+
+Usage (from the repository root):
+    python benchmarks/bench_query_cache.py [PROMPTS]
+"""
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DOCSTORE = os.path.join(REPO_ROOT, "LLM_chain", "LLM_chain", "index_components", "docstore.json")
+INDEX_DIR = tempfile.mkdtemp(prefix="component_index_")
+os.environ["COMPONENT_INDEX_DIR"] = INDEX_DIR
+
+from llama_index.core import Document, VectorStoreIndex  # noqa: E402
+
+from LLM_chain.LLM_chain import component_retriever, resources  # noqa: E402
+from LLM_chain.LLM_chain.embeddings import embedding_config, get_embed_model, write_embedding_config  # noqa: E402
+from LLM_chain.LLM_chain.query_cache import QueryEmbeddingCache  # noqa: E402
+
+EMBEDDING_LATENCY = 0.15
+REQUIREMENTS = (["drawers"], ["shelves"], ["hinged doors"], ["drawers", "small"], ["rolling", "mobile"],
+                ["heavy duty"], ["bins"], ["drawers", "lockable"], ["shelves", "metal"], ["sliding doors"],
+                ["drawers", "heavy duty"], ["open shelves", "wide"])
+SIZES = ("Small", "Medium", "Large", None)
+TOPS = (["wooden"], ["plastic", "chemical resistant"], ["steel"], ["wooden", "oiled"])
+
+
+def _build_index():
+    with open(DOCSTORE, "r") as f:
+        texts = [entry["__data__"]["text"] for entry in json.load(f)["docstore/data"].values()]
+    config = embedding_config("local")
+    index = VectorStoreIndex.from_documents([Document(text=text) for text in texts],
+                                            embed_model=get_embed_model(**config))
+    index.storage_context.persist(persist_dir=INDEX_DIR)
+    write_embedding_config(INDEX_DIR, config)
+    return len(texts)
+
+
+def _zipf_choice(rng, options):
+    weights = [1 / (rank + 1) for rank in range(len(options))]
+    return rng.choices(options, weights)[0]
+
+
+def _phrase(rng, component):
+    """Write a component query as one of the reprs that reach retrieve_many."""
+    keys = list(component)
+    if rng.random() < 0.3:
+        rng.shuffle(keys)
+    component = {key: component[key] for key in keys}
+    if rng.random() < 0.3:
+        component['requirements'] = [requirement.title() for requirement in component['requirements']]
+    text = str(component)
+    if rng.random() < 0.2:
+        text = text.replace(", ", ",  ").replace("{", "{ ")
+    return text
+
+
+def _prompts(n, seed=0):
+    rng = random.Random(seed)
+    prompts = []
+    for _ in range(n):
+        queries = [_phrase(rng, {'category': "Cabinet", 'requirements': list(_zipf_choice(rng, REQUIREMENTS)),
+                                 'size': _zipf_choice(rng, SIZES)})
+                   for _ in range(rng.randint(3, 6))]
+        queries.append(_phrase(rng, {'category': "Workbench Top", 'requirements': list(_zipf_choice(rng, TOPS)),
+                                     'size': None}))
+        prompts.append(queries)
+    return prompts
+
+
+class _RemoteEmbedding:
+    """Count the embedding requests and texts of the shared embed model, charging each request a round trip."""
+
+    def __init__(self, model):
+        self.requests = 0
+        self.texts = 0
+        original = model._get_text_embeddings
+        object.__setattr__(model, "_get_text_embeddings", self._remote(original))
+
+    def _remote(self, method):
+        def remote(texts):
+            self.requests += 1
+            self.texts += len(texts)
+            time.sleep(EMBEDDING_LATENCY)
+            return method(texts)
+        return remote
+
+
+def _replay(prompts, remote, cache):
+    component_retriever.get_query_cache = lambda: cache
+    remote.requests = remote.texts = 0
+    start = time.perf_counter()
+    results = [[[result['default_prim'] for result in results]
+                for results in component_retriever.retrieve_many(queries)] for queries in prompts]
+    return results, time.perf_counter() - start
+
+
+def main(n):
+    documents = _build_index()
+    resources.get_vector_index()
+    remote = _RemoteEmbedding(resources.get_embed_model())
+    prompts = _prompts(n)
+    queries = [query for prompt in prompts for query in prompt]
+    print(f"{documents} documents, {n} prompts, {len(queries)} component queries, {len(set(queries))} distinct reprs, "
+          f"embedding latency {EMBEDDING_LATENCY * 1000:.0f} ms per request")
+    print(f"{'mode':<22}{'requests':>10}{'texts':>8}{'time (ms)':>11}{'hit rate':>10}{'entries':>9}  same results")
+
+    cache_path = os.path.join(INDEX_DIR, "bench_query_cache.sqlite")
+    # As with QUERY_CACHE_SIZE=0: every prompt's distinct queries are embedded
+    expected, elapsed = _replay(prompts, remote, None)
+    print(f"{'no cache':<22}{remote.requests:>10}{remote.texts:>8}{elapsed * 1000:>11.0f}{'-':>10}{'-':>9}  -")
+
+    for mode, maxsize in (("cold cache", 100000), ("warm cache, reopened", 100000), ("maxsize 8", 8)):
+        if mode == "maxsize 8":
+            os.remove(cache_path)
+        cache = QueryEmbeddingCache(cache_path, maxsize)
+        results, elapsed = _replay(prompts, remote, cache)
+        info = cache.info()
+        print(f"{mode:<22}{remote.requests:>10}{remote.texts:>8}{elapsed * 1000:>11.0f}{info['hit_rate']:>10.2f}"
+              f"{info['currsize']:>9}  {results == expected}")
+        cache.close()
+
+
+if __name__ == "__main__":
+    try:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
+    finally:
+        shutil.rmtree(INDEX_DIR, ignore_errors=True)
@@ -0,0 +1,99 @@
+"""
+Benchmark: exact and range queries against the SQLite SKU catalog.
+
+Builds the catalog from the synthetic N-SKU corpus (asset_generator/synthetic, generated if missing), then runs a
+mix of randomized queries the LLM chain issues and reports p50/p99 latency per query kind:
+- type + width range ("rolling cabinet around 500mm wide"), ordered by closeness
+- type + material
+- color + height range
+- width range only
+and checks that the near= fast path (limit given) finds the same matches as ordering all of them (limit=None),
+with the target inside, below and above the queried range.
+
+Usage (from the repository root):
+    python benchmarks/bench_sku_catalog.py [N] [QUERIES]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "asset_generator"))
+
+from catalog_db import build_catalog_db  # noqa: E402
+from synthetic_catalog import synthetic_catalog_path, write_synthetic_catalog  # noqa: E402
+from LLM_chain.LLM_chain.catalog_query import ComponentCatalog, around  # noqa: E402
+
+
+def _percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def _check_near(catalog, sample, rng, checks=500, limit=5):
+    """Compare the near= fast path with ordering every match, return the number of mismatches."""
+    mismatches = 0
+    for _ in range(checks):
+        row = rng.choice(sample)
+        width = around(row[3])
+        for target in (row[3], width[0] - rng.randint(1, 300), width[1] + rng.randint(1, 300)):
+            query = dict(component_type=row[0], width=width, near={'width': target})
+            fast = catalog.query(limit=limit, **query)
+            full = catalog.query(limit=None, **query)[:limit]
+            # Matches equally far from the target may come back in either order
+            if sorted(abs(r['width'] - target) for r in fast) != sorted(abs(r['width'] - target) for r in full):
+                mismatches += 1
+    return mismatches
+
+
+def main(n, queries):
+    os.chdir(REPO_ROOT)
+    csv_path = synthetic_catalog_path(n)
+    if not os.path.exists(csv_path):
+        write_synthetic_catalog(csv_path, n)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "skus.sqlite")
+        start = time.perf_counter()
+        count = build_catalog_db(csv_path, db_path)
+        print(f"built catalog of {count} SKUs in {time.perf_counter() - start:.2f}s")
+
+        catalog = ComponentCatalog(db_path)
+        sample = catalog._connection.execute("SELECT type, material, color, width, height FROM skus").fetchall()
+        rng = random.Random(0)
+        kinds = {
+            "type + width range": lambda row: dict(component_type=row[0], width=around(row[3]),
+                                                   near={'width': row[3]}),
+            "type + material": lambda row: dict(component_type=row[0], material=row[1]),
+            "color + height range": lambda row: dict(color=row[2], height=around(row[4], 0.05)),
+            "width range": lambda row: dict(width=around(row[3], 0.02)),
+        }
+
+        print(f"{'query':<24}{'p50 (ms)':>10}{'p99 (ms)':>10}{'rows':>7}")
+        for kind, constraints in kinds.items():
+            timings, rows = [], 0
+            for _ in range(queries):
+                query = constraints(rng.choice(sample))
+                start = time.perf_counter()
+                rows += len(catalog.query(**query))
+                timings.append(time.perf_counter() - start)
+            print(f"{kind:<24}{_percentile(timings, 0.5) * 1e3:>10.3f}{_percentile(timings, 0.99) * 1e3:>10.3f}"
+                  f"{rows / queries:>7.1f}")
+
+        mismatches = _check_near(catalog, sample, rng)
+        print(f"near= fast path vs ordering every match: {mismatches} mismatches")
+
+        plan = catalog._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM skus WHERE type = ? AND width >= ? AND width <= ?",
+            ("Rolling Cabinet", 450, 550)).fetchall()
+        print("plan (type + width range): " + "; ".join(row[-1] for row in plan))
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
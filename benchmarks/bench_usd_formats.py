@@ -0,0 +1,67 @@
+"""
+Benchmark: text .usda vs binary .usdc.
+
+For each prim count, builds a flat assembly of cube prims (scale, extent, displayColor and
+customData, like the generated components), then measures save latency, open latency and file size for both
+formats.
+
+Usage (from the repository root):
+    python benchmarks/bench_usd_formats.py [N ...]      # default: 10 1000 100000
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+
+from pxr import Gf, Usd, UsdGeom
+
+DEFAULT_SIZES = (10, 1000, 100000)
+
+
+def _build_stage(n):
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.SetStageUpAxis(stage, "Y")
+    root = UsdGeom.Xform.Define(stage, "/WorkbenchAssembly")
+    stage.SetDefaultPrim(root.GetPrim())
+    for i in range(n):
+        cube = UsdGeom.Cube.Define(stage, f"/WorkbenchAssembly/Component_{i}")
+        cube.AddScaleOp().Set(Gf.Vec3f(0.411, 0.572, 0.8))
+        cube.GetExtentAttr().Set([Gf.Vec3f(-0.2055, -0.286, -0.4), Gf.Vec3f(0.2055, 0.286, 0.4)])
+        cube.GetDisplayColorAttr().Set([Gf.Vec3f(0.5, 0.5, 0.5)])
+        cube.GetPrim().SetCustomDataByKey("type", "Drawer Cabinet")
+        cube.GetPrim().SetCustomDataByKey("width", 411)
+    return stage
+
+
+def _measure(stage, path):
+    gc.collect()
+    start = time.perf_counter()
+    stage.GetRootLayer().Export(path)
+    save_time = time.perf_counter() - start
+
+    gc.collect()
+    start = time.perf_counter()
+    opened = Usd.Stage.Open(path)
+    # Touch every prim so lazily-loaded crate data is actually read
+    prim_count = sum(1 for _ in opened.Traverse())
+    open_time = time.perf_counter() - start
+    del opened
+
+    return save_time, open_time, os.path.getsize(path), prim_count
+
+
+def main(sizes):
+    print(f"{'prims':>8}{'format':>8}{'save (s)':>12}{'open (s)':>12}{'size (KiB)':>14}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            stage = _build_stage(n)
+            for file_format in ("usda", "usdc"):
+                path = os.path.join(workdir, f"assembly_{n}.{file_format}")
+                save_time, open_time, size, _ = _measure(stage, path)
+                print(f"{n:>8}{file_format:>8}{save_time:>12.4f}{open_time:>12.4f}{size / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
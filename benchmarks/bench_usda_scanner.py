@@ -0,0 +1,108 @@
+"""
+Benchmark: single-pass USDA scanner vs the previous regex and line-splitting extraction.
+
+Builds a corpus of N USDA documents from the indexed component texts (the docstore of the persisted index,
+repeated with fresh prim names), then measures
+- default prim: assembly_chooser's previous two-regex search, component_retriever's previous line splitting,
+  and usda_scanner.default_prim_name
+- metadata: one regex per field (defaultPrim, root Xform, customData, extent) vs usda_scanner.scan_usda
+and checks that every method extracts the same values.
+
+Usage (from the repository root):
+    python benchmarks/bench_usda_scanner.py [N]
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from LLM_chain.LLM_chain.usda_scanner import default_prim_name, scan_usda  # noqa: E402
+
+DOCSTORE = os.path.join(REPO_ROOT, "LLM_chain", "LLM_chain", "index_components", "docstore.json")
+
+
+def _corpus(n):
+    with open(DOCSTORE, "r") as f:
+        texts = [entry["__data__"]["text"] for entry in json.load(f)["docstore/data"].values()]
+    corpus = []
+    for i in range(n):
+        text = texts[i % len(texts)]
+        name = default_prim_name(text)
+        corpus.append(text.replace(f'"{name}"', f'"{name}_{i}"'))
+    return corpus
+
+
+def _regex_default_prim(content):
+    """assembly_chooser.extract_default_prim before the scanner."""
+    match = re.search(r'defaultPrim = "(\w+)"', content)
+    if match:
+        return match.group(1)
+    xform_match = re.search(r'def Xform "(\w+)"', content)
+    return xform_match.group(1) if xform_match else "Unknown"
+
+
+def _line_split_default_prim(content):
+    """component_retriever.retrieve_modules before the scanner."""
+    for line in content.split('\n'):
+        if 'defaultPrim = ' in line:
+            return line.split('"')[1] if '"' in line else line.split('=')[1].strip()
+    return None
+
+
+_CUSTOM_DATA = re.compile(r'customData = \{([^{}]*)\}')
+_CUSTOM_DATA_ENTRY = re.compile(r'(\w+) (\w+) = ("""[\s\S]*?"""|"[^"]*"|\S+)')
+_EXTENT = re.compile(r'extent = \[\(([^)]*)\), \(([^)]*)\)\]')
+
+
+def _regex_metadata(content):
+    """The same metadata, one regex per field."""
+    custom_data = {}
+    block = _CUSTOM_DATA.search(content)
+    for value_type, key, value in _CUSTOM_DATA_ENTRY.findall(block.group(1) if block else ""):
+        if value.startswith('"'):
+            custom_data[key] = value[3:-3] if value.startswith('"""') else value[1:-1]
+        else:
+            custom_data[key] = int(value) if value_type == "int" else value
+    extent = _EXTENT.search(content)
+    default_prim = re.search(r'defaultPrim = "([^"]*)"', content)
+    root_xform = re.search(r'def Xform "([^"]*)"', content)
+    return {
+        'default_prim': default_prim.group(1) if default_prim else None,
+        'root_xform': root_xform.group(1) if root_xform else None,
+        'custom_data': custom_data,
+        'extent': tuple(tuple(float(v) for v in extent.group(i).split(',')) for i in (1, 2)) if extent else None,
+    }
+
+
+def _timed(fn, corpus):
+    start = time.perf_counter()
+    results = [fn(content) for content in corpus]
+    return results, time.perf_counter() - start
+
+
+def main(n):
+    corpus = _corpus(n)
+    print(f"{n} documents")
+
+    regex, regex_time = _timed(_regex_default_prim, corpus)
+    lines, lines_time = _timed(_line_split_default_prim, corpus)
+    scanned, scan_time = _timed(default_prim_name, corpus)
+    print(f"default prim, regex:      {regex_time * 1e3:8.2f} ms")
+    print(f"default prim, line split: {lines_time * 1e3:8.2f} ms")
+    print(f"default prim, scanner:    {scan_time * 1e3:8.2f} ms "
+          f"({regex_time / scan_time:.1f}x / {lines_time / scan_time:.1f}x), equal: {regex == lines == scanned}")
+
+    per_field, per_field_time = _timed(_regex_metadata, corpus)
+    metadata, metadata_time = _timed(scan_usda, corpus)
+    print(f"metadata, regex per field: {per_field_time * 1e3:7.2f} ms")
+    print(f"metadata, scanner:         {metadata_time * 1e3:7.2f} ms "
+          f"({per_field_time / metadata_time:.1f}x), equal: {per_field == metadata}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -1,4 +1,5 @@
 from LLM_chain.LLM_chain.main import main
+from LLM_chain.LLM_chain.retrieval_utils import construct_file_path
 from USD_modules.usd_utils import merge_usda_files, extract_filepaths
 
 def demo (user_input):
@@ -6,9 +7,9 @@ def demo (user_input):
 
     filepaths = extract_filepaths(assembly_data_model)
     # Group files by component type
-    cabinet_usdas = [f"assets/components/{fp}.usda" for fp in filepaths if "cabinet" in fp.lower()]
-    top_usdas = [f"assets/components/{fp}.usda" for fp in filepaths if "top" in fp.lower()]
-    rear_panel_usdas = [f"assets/components/{fp}.usda" for fp in filepaths if "rear_panel" in fp.lower()]
+    cabinet_usdas = [construct_file_path(fp) for fp in filepaths if "cabinet" in fp.lower()]
+    top_usdas = [construct_file_path(fp) for fp in filepaths if "top" in fp.lower()]
+    rear_panel_usdas = [construct_file_path(fp) for fp in filepaths if "rear_panel" in fp.lower()]
     spacing = assembly_data_model["metadata"]["spacing"] / (assembly_data_model["metadata"]["number_of_cabinets"] - 1) / 1000
 
 